@@ -88,6 +88,20 @@ def fileexistspolicy(
     default=False,
     help="Skip the files in the corresponding directories if they already exist.",
 )
+@click.option(
+    "-j",
+    "--jobs",
+    metavar="N",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of threads for rendering and writing files.",
+)
+@click.option(
+    "--fork-hooks",
+    is_flag=True,
+    default=False,
+    help="Run Python hooks in a forked process, where supported.",
+)
 @fatal
 def cookiecutter(
     location: str,
@@ -98,6 +112,8 @@ def cookiecutter(
     directory: Optional[Path],
     overwrite_if_exists: bool,
     skip_if_file_exists: bool,
+    jobs: int,
+    fork_hooks: bool,
 ) -> None:
     """Generate projects from Cookiecutter templates."""
     extrabindings = [Binding(key, value) for key, value in extra_context.items()]
@@ -107,7 +123,7 @@ def cookiecutter(
 
     fileexists = fileexistspolicy(overwrite_if_exists, skip_if_file_exists)
 
-    create(
+    counts = create(
         location,
         output_dir,
         extrabindings=extrabindings,
@@ -115,4 +131,12 @@ def cookiecutter(
         checkout=checkout,
         directory=directory,
         fileexists=fileexists,
+        jobs=jobs,
+        forkhooks=fork_hooks,
     )
+
+    if fileexists is not FileExistsPolicy.RAISE:
+        click.echo(
+            f"{counts.written} files written, {counts.skipped} skipped,"
+            f" {counts.unchanged} unchanged."
+        )
@@ -0,0 +1,266 @@
+"""Archive-based file storage."""
+import abc
+import os
+import pathlib
+import stat
+import tarfile
+import tempfile
+import time
+import zipfile
+from typing import Any
+from typing import BinaryIO
+from typing import cast
+from typing import Optional
+
+from cutty.errors import CuttyError
+from cutty.filestorage.domain.files import CHUNK_SIZE
+from cutty.filestorage.domain.files import Executable
+from cutty.filestorage.domain.files import File
+from cutty.filestorage.domain.files import RegularFile
+from cutty.filestorage.domain.files import SymbolicLink
+from cutty.filestorage.domain.storage import FileStorage
+from cutty.filesystems.domain.path import Path
+
+
+# Compression schemes for tar archives, in addition to those in the tarfile module.
+ZSTANDARD = "zst"
+
+TAR_COMPRESSIONS = ("", "gz", "bz2", "xz", ZSTANDARD)
+
+# Zip archives cannot represent times before 1980-01-01.
+ZIP_EPOCH = 315532800
+
+
+class ZstandardNotFoundError(CuttyError):
+    """Cannot import the ``zstandard`` module."""
+
+
+def _getmode(file: File) -> int:
+    """Return the file type and permission bits for an archive member."""
+    if isinstance(file, SymbolicLink):
+        return stat.S_IFLNK | 0o777
+
+    if isinstance(file, Executable):
+        return stat.S_IFREG | 0o755
+
+    if isinstance(file, RegularFile):
+        return stat.S_IFREG | 0o644
+
+    raise TypeError(f"cannot store file of type {type(file)}")
+
+
+class _ArchiveStorage(FileStorage):
+    """File storage writing an archive to the given path.
+
+    Members are streamed to a temporary file next to the path as they are
+    added. Committing renames the temporary file to the path, replacing any
+    existing file, and rolling back removes it. The modification time of
+    members defaults to the start of the transaction.
+    """
+
+    def __init__(self, path: pathlib.Path, *, mtime: Optional[float] = None) -> None:
+        """Initialize."""
+        self.path = path
+        self.mtime = mtime
+        self.timestamp = 0
+        self.names: set[str] = set()
+        self.fileobj: Optional[BinaryIO] = None
+
+    def begin(self) -> None:
+        """Begin a storage transaction."""
+        self.timestamp = int(self.mtime if self.mtime is not None else time.time())
+        self.names.clear()
+        self.fileobj = cast(
+            BinaryIO,
+            tempfile.NamedTemporaryFile(
+                dir=self.path.parent, suffix=".tmp", delete=False
+            ),
+        )
+
+        try:
+            self.open(self.fileobj)
+        except BaseException:
+            self.fileobj.close()
+            os.unlink(self.fileobj.name)
+            self.fileobj = None
+            raise
+
+    def add(self, file: File) -> None:
+        """Add the file to the storage."""
+        name = "/".join(file.path.parts)
+
+        if name in self.names:
+            raise FileExistsError(f"{name} already exists")
+
+        self.names.add(name)
+        self.write(name, file, _getmode(file))
+
+    def commit(self) -> None:
+        """Commit all stores."""
+        assert self.fileobj is not None  # noqa: S101
+
+        try:
+            self.close()
+        finally:
+            self.fileobj.close()
+
+        os.replace(self.fileobj.name, self.path)
+        self.fileobj = None
+
+    def rollback(self) -> None:
+        """Rollback all stores."""
+        assert self.fileobj is not None  # noqa: S101
+
+        try:
+            self.close()
+        finally:
+            self.fileobj.close()
+            os.unlink(self.fileobj.name)
+            self.fileobj = None
+
+    @abc.abstractmethod
+    def open(self, fileobj: BinaryIO) -> None:
+        """Open the archive."""
+
+    @abc.abstractmethod
+    def write(self, name: str, file: File, mode: int) -> None:
+        """Write an archive member."""
+
+    @abc.abstractmethod
+    def close(self) -> None:
+        """Close the archive."""
+
+
+class ZipFileStorage(_ArchiveStorage):
+    """File storage writing a zip archive."""
+
+    def __init__(
+        self,
+        path: pathlib.Path,
+        *,
+        mtime: Optional[float] = None,
+        compression: int = zipfile.ZIP_DEFLATED,
+    ) -> None:
+        """Initialize."""
+        super().__init__(path, mtime=mtime)
+        self.compression = compression
+        self.archive: Optional[zipfile.ZipFile] = None
+
+    def open(self, fileobj: BinaryIO) -> None:
+        """Open the archive."""
+        self.archive = zipfile.ZipFile(fileobj, "w", compression=self.compression)
+
+    def write(self, name: str, file: File, mode: int) -> None:
+        """Write an archive member."""
+        assert self.archive is not None  # noqa: S101
+
+        date_time = time.gmtime(max(self.timestamp, ZIP_EPOCH))
+        info = zipfile.ZipInfo(name, date_time=date_time[:6])
+        info.create_system = 3  # Unix, for the permission bits to be honored.
+        info.external_attr = mode << 16
+        info.compress_type = self.compression
+
+        if isinstance(file, SymbolicLink):
+            target = "/".join(file.target.parts)
+            self.archive.writestr(info, target.encode(errors="surrogateescape"))
+            return
+
+        assert isinstance(file, RegularFile)  # noqa: S101
+
+        with self.archive.open(info, "w") as io:
+            for chunk in file.chunks():
+                io.write(chunk)
+
+    def close(self) -> None:
+        """Close the archive."""
+        if self.archive is not None:
+            self.archive.close()
+            self.archive = None
+
+
+class TarFileStorage(_ArchiveStorage):
+    """File storage writing a tar archive.
+
+    The compression is empty for an uncompressed archive, or one of ``gz``,
+    ``bz2``, ``xz``, and ``zst``. Zstandard compression requires the
+    ``zstandard`` package.
+    """
+
+    def __init__(
+        self,
+        path: pathlib.Path,
+        *,
+        mtime: Optional[float] = None,
+        compression: str = "",
+    ) -> None:
+        """Initialize."""
+        if compression not in TAR_COMPRESSIONS:
+            raise ValueError(f"unknown compression {compression!r}")
+
+        super().__init__(path, mtime=mtime)
+        self.compression = compression
+        self.archive: Optional[tarfile.TarFile] = None
+        self.writer: Optional[Any] = None
+
+    def open(self, fileobj: BinaryIO) -> None:
+        """Open the archive."""
+        if self.compression == ZSTANDARD:
+            try:
+                import zstandard
+            except ImportError:
+                raise ZstandardNotFoundError()
+
+            compressor = zstandard.ZstdCompressor()
+            self.writer = compressor.stream_writer(fileobj, closefd=False)
+            self.archive = tarfile.open(fileobj=self.writer, mode="w|")
+        else:
+            mode = f"w|{self.compression}"
+            self.archive = tarfile.open(  # type: ignore[call-overload]
+                fileobj=fileobj, mode=mode
+            )
+
+    def write(self, name: str, file: File, mode: int) -> None:
+        """Write an archive member."""
+        assert self.archive is not None  # noqa: S101
+
+        info = tarfile.TarInfo(name)
+        info.mode = stat.S_IMODE(mode)
+        info.mtime = self.timestamp
+
+        if isinstance(file, SymbolicLink):
+            info.type = tarfile.SYMTYPE
+            info.linkname = "/".join(file.target.parts)
+            self.archive.addfile(info)
+            return
+
+        assert isinstance(file, RegularFile)  # noqa: S101
+
+        if isinstance(file.blob, bytes):
+            info.size = len(file.blob)
+            with file.open() as io:
+                self.archive.addfile(info, io)
+
+        elif isinstance(file.blob, Path):
+            # Tar headers precede the contents, so the size must be known.
+            info.size = file.blob.stat().size
+            with file.open() as io:
+                self.archive.addfile(info, io)
+
+        else:
+            with tempfile.SpooledTemporaryFile(max_size=CHUNK_SIZE) as spool:
+                for chunk in file.chunks():
+                    spool.write(chunk)
+
+                info.size = spool.tell()
+                spool.seek(0)
+                self.archive.addfile(info, spool)
+
+    def close(self) -> None:
+        """Close the archive."""
+        if self.archive is not None:
+            self.archive.close()
+            self.archive = None
+
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
@@ -1,8 +1,10 @@
 """File storage for Cookiecutter projects."""
 import pathlib
 from collections.abc import Iterable
+from typing import Optional
 
 from cutty.filestorage.adapters.disk import DiskFileStorage
+from cutty.filestorage.adapters.disk import FileCounts
 from cutty.filestorage.adapters.disk import FileExistsPolicy
 from cutty.filestorage.adapters.observers.cookiecutter import CookiecutterHooksObserver
 from cutty.filestorage.domain.files import File
@@ -15,13 +17,22 @@ def createcookiecutterstorage(
     projectdir: pathlib.Path,
     fileexists: FileExistsPolicy,
     hookfiles: Iterable[File],
+    *,
+    jobs: int = 1,
+    counts: Optional[FileCounts] = None,
+    forkhooks: bool = False,
 ) -> FileStorage:
     """Create storage for Cookiecutter project files."""
-    storage: FileStorage = DiskFileStorage(outputdir, fileexists=fileexists)
+    storage: FileStorage = DiskFileStorage(
+        outputdir, fileexists=fileexists, staging=True, jobs=jobs, counts=counts
+    )
 
     if hookfiles:  # pragma: no branch
         observer = CookiecutterHooksObserver(
-            hookfiles=hookfiles, project=projectdir, fileexists=fileexists
+            hookfiles=hookfiles,
+            project=projectdir,
+            fileexists=fileexists,
+            forkhooks=forkhooks,
         )
         storage = observe(storage, observer)
 
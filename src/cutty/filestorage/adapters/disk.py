@@ -1,15 +1,24 @@
 """Disk-based file storage."""
+import concurrent.futures
 import contextlib
 import enum
+import os
 import pathlib
+import secrets
+import shutil
+import stat
 from collections.abc import Callable
+from dataclasses import dataclass
 from typing import Optional
 
 from cutty.filestorage.domain.files import Executable
 from cutty.filestorage.domain.files import File
 from cutty.filestorage.domain.files import RegularFile
+from cutty.filestorage.domain.files import Stream
 from cutty.filestorage.domain.files import SymbolicLink
 from cutty.filestorage.domain.storage import FileStorage
+from cutty.filesystems.adapters.disk import DiskFilesystem
+from cutty.filesystems.domain.path import Path
 from cutty.filesystems.domain.purepath import PurePath
 
 
@@ -38,44 +47,145 @@ class FileExistsPolicy(enum.Enum):
         return self is FileExistsPolicy.OVERWRITE
 
 
+@dataclass
+class FileCounts:
+    """Number of files written, skipped, and left unchanged by a storage."""
+
+    written: int = 0
+    skipped: int = 0
+    unchanged: int = 0
+
+
 class DiskFileStorage(FileStorage):
-    """Disk-based file storage."""
+    """Disk-based file storage.
+
+    Directories created or found by the storage are remembered for the duration
+    of the transaction, so that they are checked only once.
+
+    In staging mode, top-level directories that do not exist yet are written to
+    hidden staging directories next to them. Committing renames each staging
+    directory into place, and rolling back removes it, without keeping track
+    of its contents. Other files are stored in place.
+
+    If more than one job is requested, regular files are written in a pool of
+    worker threads. Policies for existing files are still applied when files
+    are added, and all writes complete before the transaction ends.
+
+    When overwriting, files whose contents and mode would not change are left
+    alone. The storage counts the files it writes, skips, and leaves unchanged.
+    """
 
     def __init__(
         self,
         root: pathlib.Path,
         *,
         fileexists: FileExistsPolicy = FileExistsPolicy.RAISE,
+        staging: bool = False,
+        jobs: int = 1,
+        counts: Optional[FileCounts] = None,
     ) -> None:
         """Initialize."""
         super().__init__()
         self.root = root
         self.fileexists = fileexists
+        self.staging = staging
+        self.jobs = jobs
+        self.counts = counts if counts is not None else FileCounts()
+        self.executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self.pending: dict[pathlib.Path, concurrent.futures.Future[None]] = {}
         self.undo: list[Callable[[], None]] = []
+        self.directories: set[pathlib.Path] = set()
+        self.staged: dict[str, pathlib.Path] = {}
+        self.unstaged: set[str] = set()
 
     def begin(self) -> None:
         """Begin a storage transaction."""
+        self.directories.clear()
+
+        if self.jobs > 1:
+            self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.jobs)
 
     def add(self, file: File) -> None:
         """Add the file to the storage."""
-        path = self.resolve(file.path)
+        path, staged = self._locate(file.path)
+
+        if (future := self.pending.pop(path, None)) is not None:
+            future.result()
+
         if not path.exists():
-            self._storefile(file, path, overwrite=False)
-        elif self.fileexists.check(path):
-            self._storefile(file, path, overwrite=True)
+            self._storefile(file, path, overwrite=False, journal=not staged)
+            self.counts.written += 1
+        elif not self.fileexists.check(self.resolve(file.path)):
+            self.counts.skipped += 1
+        elif _isunchanged(file, path):
+            self.counts.unchanged += 1
+        else:
+            self._storefile(file, path, overwrite=True, journal=not staged)
+            self.counts.written += 1
 
     def resolve(self, path: PurePath) -> pathlib.Path:
         """Return the filesystem location."""
         return self.root.joinpath(*path.parts)
 
+    def _locate(self, path: PurePath) -> tuple[pathlib.Path, bool]:
+        """Return the location to write to, and whether it is staged."""
+        if self.staging and len(path.parts) > 1:
+            name = path.parts[0]
+            staging = self.staged.get(name)
+
+            if staging is None and name not in self.unstaged:
+                target = self.root / name
+                if target.exists() or target.is_symlink():
+                    self.unstaged.add(name)
+                else:
+                    staging = self._stage(name)
+
+            if staging is not None:
+                return staging.joinpath(*path.parts[1:]), True
+
+        return self.resolve(path), False
+
+    def _stage(self, name: str) -> pathlib.Path:
+        """Create a staging directory for the top-level directory."""
+        self._makedirs(self.root)
+
+        staging = self.root / f".{name}.{secrets.token_hex(4)}.staging"
+        staging.mkdir()
+
+        self.staged[name] = staging
+        self.directories.add(staging)
+        return staging
+
+    def _makedirs(self, path: pathlib.Path, *, journal: bool = True) -> None:
+        """Create the directory and its ancestors, unless they are known.
+
+        Pass ``journal=False`` for directories that need not be rolled back.
+        """
+        if path in self.directories:
+            return
+
+        if path.parent != path:
+            self._makedirs(path.parent, journal=journal)
+
+        if not path.is_dir():
+            path.mkdir()
+            if journal:
+                self.undo.append(path.rmdir)
+
+        self.directories.add(path)
+
     def _storefile(
         self,
         file: File,
         path: pathlib.Path,
         *,
         overwrite: bool = False,
+        journal: bool = True,
     ) -> None:
-        """Store the file at the given path on disk."""
+        """Store the file at the given path on disk.
+
+        Pass ``journal=False`` for files that need not be rolled back.
+        """
         # OVERWRITING.
         #
         # These operations are allowed:
@@ -97,35 +207,145 @@ class DiskFileStorage(FileStorage):
         if overwrite and path.is_symlink():
             path.unlink()
 
-        for parent in reversed(path.parents):
-            if not parent.is_dir():
-                parent.mkdir()
-                self.undo.append(parent.rmdir)
+        self._makedirs(path.parent, journal=journal)
 
         if isinstance(file, RegularFile):
-            path.write_bytes(file.blob)
-
-            if not overwrite:
+            if not overwrite and journal:
                 self.undo.append(path.unlink)
 
-            if isinstance(file, Executable):
-                path.chmod(path.stat().st_mode | 0o111)
+            self._copyfile(file, path, overwrite=overwrite)
 
         elif isinstance(file, SymbolicLink):
             target = pathlib.Path(*file.target.parts)
             path.symlink_to(target)
 
-            if not overwrite:
+            if not overwrite and journal:
                 self.undo.append(path.unlink)
 
         else:
             raise TypeError(f"cannot store file of type {type(file)}")
 
+    def _copyfile(
+        self, file: RegularFile, path: pathlib.Path, *, overwrite: bool
+    ) -> None:
+        """Write the file, in a worker thread if there is a pool."""
+        if self.executor is None:
+            _copyfile(file, path, overwrite=overwrite)
+            return
+
+        self.pending[path] = self.executor.submit(
+            _copyfile, file, path, overwrite=overwrite
+        )
+
+        # Bound the number of files held in memory by pending writes.
+        if len(self.pending) > 2 * self.jobs:
+            oldest = next(iter(self.pending))
+            self.pending.pop(oldest).result()
+
+    def _wait(self) -> None:
+        """Wait for pending writes, and shut down the pool."""
+        try:
+            while self.pending:
+                oldest = next(iter(self.pending))
+                self.pending.pop(oldest).result()
+        finally:
+            if self.executor is not None:
+                self.executor.shutdown(cancel_futures=True)
+                self.executor = None
+
     def commit(self) -> None:
         """Commit all stores."""
+        try:
+            self._wait()
+        except BaseException:
+            self.rollback()
+            raise
+
+        self.directories.clear()
+
+        renamed: list[pathlib.Path] = []
+
+        try:
+            for name, staging in self.staged.items():
+                os.rename(staging, self.root / name)
+                renamed.append(self.root / name)
+        except OSError:
+            for path in renamed:
+                shutil.rmtree(path, ignore_errors=True)
+
+            self.rollback()
+            raise
+
+        self.staged.clear()
+        self.unstaged.clear()
 
     def rollback(self) -> None:
         """Rollback all stores."""
+        with contextlib.suppress(Exception):
+            self._wait()
+
+        self.directories.clear()
+        self.unstaged.clear()
+
+        for staging in self.staged.values():
+            shutil.rmtree(staging, ignore_errors=True)
+
+        self.staged.clear()
+
         for action in reversed(self.undo):
             with contextlib.suppress(Exception):
                 action()
+
+
+def _isunchanged(file: File, path: pathlib.Path) -> bool:
+    """Return True if writing the file would not change the file on disk.
+
+    Sizes are compared before contents. Streamed contents are not compared,
+    because they would need to be produced twice.
+    """
+    if not isinstance(file, RegularFile) or isinstance(file.blob, Stream):
+        return False
+
+    status = path.lstat()
+
+    if not stat.S_ISREG(status.st_mode):
+        return False
+
+    if isinstance(file, Executable) and not status.st_mode & stat.S_IXUSR:
+        return False
+
+    size = file.blob.stat().size if isinstance(file.blob, Path) else len(file.blob)
+
+    if size != status.st_size:
+        return False
+
+    with path.open("rb") as io:
+        return all(io.read(len(chunk)) == chunk for chunk in file.chunks())
+
+
+def _copyfile(file: RegularFile, path: pathlib.Path, *, overwrite: bool) -> None:
+    """Write the file contents to the given path.
+
+    Files on disk are copied by the kernel where supported, without reading
+    them into Python. Other files are written in chunks, and created with the
+    executable bits set if needed. Otherwise, executables are made executable
+    after they were written.
+    """
+    executable = isinstance(file, Executable)
+
+    if isinstance(file.blob, Path) and isinstance(file.blob.filesystem, DiskFilesystem):
+        shutil.copyfile(file.blob.filesystem.resolve(file.blob), path)
+    else:
+        mode = 0o777 if executable else 0o666
+
+        def _open(name: str, flags: int) -> int:
+            return os.open(name, flags, mode)
+
+        with open(path, "wb", opener=_open) as destination:
+            destination.writelines(file.chunks())
+
+        if not overwrite:
+            return
+
+    if executable:
+        path.chmod(path.stat().st_mode | 0o111)
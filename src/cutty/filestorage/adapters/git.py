@@ -0,0 +1,149 @@
+"""Git-based file storage."""
+import pathlib
+from collections.abc import Container
+from typing import Any
+from typing import Optional
+
+import pygit2
+
+from cutty.filestorage.domain.files import Executable
+from cutty.filestorage.domain.files import File
+from cutty.filestorage.domain.files import RegularFile
+from cutty.filestorage.domain.files import SymbolicLink
+from cutty.filestorage.domain.storage import FileStorage
+from cutty.filesystems.adapters.git import GitFilesystem
+from cutty.filesystems.domain.path import Path
+
+
+def getfilemode(file: File) -> int:
+    """Return the git file mode for the file."""
+    filemode: int
+
+    if isinstance(file, Executable):
+        filemode = pygit2.GIT_FILEMODE_BLOB_EXECUTABLE
+    elif isinstance(file, RegularFile):
+        filemode = pygit2.GIT_FILEMODE_BLOB
+    elif isinstance(file, SymbolicLink):
+        filemode = pygit2.GIT_FILEMODE_LINK
+    else:
+        raise TypeError(f"cannot store file of type {type(file)}")
+
+    return filemode
+
+
+def createblob(
+    repository: pygit2.Repository,
+    file: File,
+    path: Optional[pathlib.Path] = None,
+) -> pygit2.Oid:
+    """Write the file contents as a blob, unless the blob exists.
+
+    The blob of a file read from a git repository is reused if the repository
+    has it. Pass the path of a copy of the file on disk, to read the contents
+    from there instead of producing them again.
+    """
+    if isinstance(file, SymbolicLink):
+        target = "/".join(file.target.parts).encode(errors="surrogateescape")
+        return repository.create_blob(target)
+
+    if not isinstance(file, RegularFile):
+        raise TypeError(f"cannot store file of type {type(file)}")
+
+    if (
+        isinstance(file.blob, Path)
+        and isinstance(file.blob.filesystem, GitFilesystem)
+        and (blobid := file.blob.blobid()) is not None
+        and (oid := pygit2.Oid(hex=blobid)) in repository
+    ):
+        return oid
+
+    if isinstance(file.blob, bytes):
+        return repository.create_blob(file.blob)
+
+    if path is not None:
+        return repository.create_blob_fromdisk(str(path))
+
+    with file.open() as io:
+        return repository.create_blob_fromiobase(io)
+
+
+class GitTreeStorage(FileStorage):
+    """File storage writing to the object database of a git repository.
+
+    Files are written as blobs when they are added, without a worktree or
+    index. Committing the transaction writes the trees, and sets ``tree`` to
+    the ID of the root tree. Blobs are not written again if the file is read
+    from a git repository, and the repository already has its blob. If the
+    files were also written to a directory, pass it as ``root`` to read their
+    contents from there, instead of producing them again.
+    """
+
+    def __init__(
+        self, repository: pygit2.Repository, *, root: Optional[pathlib.Path] = None
+    ) -> None:
+        """Initialize."""
+        super().__init__()
+        self.repository = repository
+        self.root = root
+        self.entries: dict[str, tuple[pygit2.Oid, int]] = {}
+        self.tree: Optional[pygit2.Oid] = None
+
+    def begin(self) -> None:
+        """Begin a storage transaction."""
+        self.entries.clear()
+        self.tree = None
+
+    def add(self, file: File) -> None:
+        """Add the file to the storage."""
+        path = "/".join(file.path.parts)
+
+        if path in self.entries:
+            raise FileExistsError(f"{path} already exists")
+
+        filemode = getfilemode(file)
+        diskpath = self.root.joinpath(*file.path.parts) if self.root else None
+        self.entries[path] = createblob(self.repository, file, diskpath), filemode
+
+    def writetree(self, exclude: Container[str] = ()) -> pygit2.Oid:
+        """Write the trees for the stored files, except for excluded paths."""
+        root: dict[str, Any] = {}
+
+        for path, entry in self.entries.items():
+            if path in exclude:
+                continue
+
+            *parents, name = path.split("/")
+            directory = root
+
+            for parent in parents:
+                directory = directory.setdefault(parent, {})
+                if not isinstance(directory, dict):
+                    raise FileExistsError(f"{parent} is not a directory in {path}")
+
+            if name in directory:
+                raise FileExistsError(f"{path} is a directory")
+
+            directory[name] = entry
+
+        def _writetree(directory: dict[str, Any]) -> pygit2.Oid:
+            builder = self.repository.TreeBuilder()
+
+            for name, entry in directory.items():
+                if isinstance(entry, dict):
+                    builder.insert(name, _writetree(entry), pygit2.GIT_FILEMODE_TREE)
+                else:
+                    builder.insert(name, *entry)
+
+            oid: pygit2.Oid = builder.write()
+            return oid
+
+        return _writetree(root)
+
+    def commit(self) -> None:
+        """Commit all stores."""
+        self.tree = self.writetree()
+
+    def rollback(self) -> None:
+        """Rollback all stores."""
+        self.entries.clear()
+        self.tree = None
@@ -1,10 +1,13 @@
 """Cookiecutter file storage."""
+import os
 import pathlib
 import platform
+import runpy
 import shutil
 import subprocess  # noqa: S404
 import sys
 import tempfile
+import traceback
 from collections.abc import Iterable
 
 from cutty.filestorage.adapters.disk import DiskFileStorage
@@ -13,10 +16,55 @@ from cutty.filestorage.domain.files import File
 from cutty.filestorage.domain.observers import FileStorageObserver
 
 
+def _runforked(path: pathlib.Path, cwd: pathlib.Path) -> int:
+    """Run a Python script in a forked child process, returning its exit status.
+
+    The child starts from a copy of the current interpreter, so the script runs
+    without interpreter startup, and cannot affect the state of the parent.
+    Output goes to the standard streams of the process, as for a subprocess.
+    """
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+    pid = os.fork()
+
+    if pid == 0:  # pragma: no cover
+        status = 1
+        try:
+            sys.stdout = open(1, "w", closefd=False)
+            sys.stderr = open(2, "w", closefd=False)
+            sys.argv = [str(path)]
+            sys.path[0] = str(path.parent)
+            os.chdir(cwd)
+            runpy.run_path(str(path), run_name="__main__")
+            status = 0
+        except SystemExit as exception:
+            if exception.code is None or isinstance(exception.code, int):
+                status = exception.code or 0
+            else:
+                print(exception.code, file=sys.stderr)
+        except BaseException:
+            traceback.print_exc()
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os._exit(status)
+
+    _, status = os.waitpid(pid, 0)
+    return os.waitstatus_to_exitcode(status)
+
+
 class _Hooks:
-    def __init__(self, *, hookfiles: Iterable[File], project: pathlib.Path) -> None:
+    def __init__(
+        self,
+        *,
+        hookfiles: Iterable[File],
+        project: pathlib.Path,
+        fork: bool = False,
+    ) -> None:
         self.hooks = {hook.path.stem: hook for hook in hookfiles}
         self.project = project
+        self.fork = fork and hasattr(os, "fork")
 
     def run(self, hook: str) -> None:
         hookfile = self.hooks.get(hook)
@@ -31,11 +79,17 @@ class _Hooks:
                 self._runpath(path)
 
     def _runpath(self, path: pathlib.Path) -> None:
+        self.project.mkdir(parents=True, exist_ok=True)
+
+        if self.fork and path.suffix == ".py":
+            if status := _runforked(path, self.project):
+                raise subprocess.CalledProcessError(status, [sys.executable, path])
+            return
+
         command = (
             [pathlib.Path(sys.executable), path] if path.suffix == ".py" else [path]
         )
         shell = platform.system() == "Windows"
-        self.project.mkdir(parents=True, exist_ok=True)
         subprocess.run(command, shell=shell, cwd=self.project, check=True)  # noqa: S602
 
 
@@ -48,9 +102,10 @@ class CookiecutterHooksObserver(FileStorageObserver):
         hookfiles: Iterable[File],
         project: pathlib.Path,
         fileexists: FileExistsPolicy,
+        forkhooks: bool = False,
     ) -> None:
         """Initialize."""
-        self.hooks = _Hooks(hookfiles=hookfiles, project=project)
+        self.hooks = _Hooks(hookfiles=hookfiles, project=project, fork=forkhooks)
         self.fileexists = fileexists
 
     def begin(self) -> None:
@@ -2,16 +2,30 @@
 from __future__ import annotations
 
 import dataclasses
+import io
+import stat
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
 from dataclasses import dataclass
+from typing import Any
+from typing import BinaryIO
+from typing import cast
+from typing import Optional
 from typing import TypeVar
+from typing import Union
 
-from cutty.filesystems.domain.filesystem import Access
+from cutty.filesystems.domain.filesystem import FileStatus
+from cutty.filesystems.domain.filesystem import FileType
 from cutty.filesystems.domain.path import Path
 from cutty.filesystems.domain.purepath import PurePath
 
 
 _FileT = TypeVar("_FileT", bound="File")
 
+# Size of chunks when reading file contents from a path.
+CHUNK_SIZE = 64 * 1024
+
 
 @dataclass(frozen=True)
 class File:
@@ -24,11 +38,91 @@ class File:
         return dataclasses.replace(self, path=path)
 
 
+@dataclass(frozen=True)
+class Stream:
+    """File contents produced in chunks, each time they are read."""
+
+    generate: Callable[[], Iterable[bytes]]
+
+
+class _StreamReader(io.RawIOBase):
+    """Read-only binary stream over chunks of bytes."""
+
+    def __init__(self, chunks: Iterator[bytes]) -> None:
+        """Initialize."""
+        self.chunks = chunks
+        self.chunk = b""
+
+    def readable(self) -> bool:
+        """Return True, the stream is readable."""
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        """Read bytes into the buffer."""
+        while not self.chunk:
+            chunk = next(self.chunks, None)
+            if chunk is None:
+                return 0
+            self.chunk = chunk
+
+        size = min(len(buffer), len(self.chunk))
+        buffer[:size] = self.chunk[:size]
+        self.chunk = self.chunk[size:]
+        return size
+
+
 @dataclass(frozen=True)
 class RegularFile(File):
-    """A regular file."""
+    """A regular file.
+
+    The contents are either held in memory, read from a path on demand, or
+    streamed. Contents read from a path are addressed by the blob identifier
+    of the path, if the filesystem provides one.
+    """
+
+    blob: Union[bytes, Path, Stream]
+
+    @property
+    def blobid(self) -> Optional[str]:
+        """Return an identifier for the file contents, if available."""
+        if isinstance(self.blob, Path):
+            return self.blob.blobid()
 
-    blob: bytes
+        return None
+
+    def read_bytes(self) -> bytes:
+        """Return the file contents."""
+        if isinstance(self.blob, Path):
+            return self.blob.read_bytes()
+
+        if isinstance(self.blob, Stream):
+            return b"".join(self.blob.generate())
+
+        return self.blob
+
+    def open(self) -> BinaryIO:
+        """Open the file contents for reading."""
+        if isinstance(self.blob, Path):
+            return self.blob.open()
+
+        if isinstance(self.blob, Stream):
+            reader = _StreamReader(iter(self.blob.generate()))
+            return cast(BinaryIO, io.BufferedReader(reader))
+
+        return io.BytesIO(self.blob)
+
+    def chunks(self) -> Iterator[bytes]:
+        """Iterate over the file contents in chunks."""
+        if isinstance(self.blob, Path):
+            with self.blob.open() as source:
+                while chunk := source.read(CHUNK_SIZE):
+                    yield chunk
+
+        elif isinstance(self.blob, Stream):
+            yield from self.blob.generate()
+
+        elif self.blob:
+            yield self.blob
 
 
 @dataclass(frozen=True)
@@ -49,21 +143,28 @@ def loadfile(
     follow_symlinks: bool = True,
 ) -> File:
     """Load file from path."""
-    if not follow_symlinks and path.is_symlink():
-        target = path.readlink()
-        return SymbolicLink(path, target)
+    status: Optional[FileStatus]
+
+    try:
+        status = path.stat(follow_symlinks=follow_symlinks)
+    except (FileNotFoundError, NotADirectoryError):
+        status = None
 
-    if path.is_file():
-        cls = Executable if path.access(Access.EXECUTE) else RegularFile
-        return cls(path, path.read_bytes())
+    if status is not None and status.type is FileType.SYMLINK:
+        assert status.target is not None  # noqa: S101
+        return SymbolicLink(path, status.target)
+
+    if status is not None and status.type is FileType.REGULAR:
+        cls = Executable if status.mode & stat.S_IXUSR else RegularFile
+        return cls(path, path)
 
     message = (
-        "broken symlink"
-        if path.is_symlink()
-        else "directory"
-        if path.is_dir()
+        "directory"
+        if status is not None and status.type is FileType.DIRECTORY
         else "special file"
-        if path.access()
+        if status is not None
+        else "broken symlink"
+        if path.is_symlink()
         else "no such file"
     )
     raise RuntimeError(f"{path}: {message}")
@@ -4,6 +4,8 @@ from typing import Any
 from typing import cast
 
 from cutty.filesystems.domain.filesystem import Access
+from cutty.filesystems.domain.filesystem import FileStatus
+from cutty.filesystems.domain.filesystem import FileType
 from cutty.filesystems.domain.nodefs import FilesystemNode
 from cutty.filesystems.domain.nodefs import NodeFilesystem
 from cutty.filesystems.domain.purepath import PurePath
@@ -56,6 +58,16 @@ class DictFilesystemNode(FilesystemNode):
         """Return True if the user can access the node."""
         return Access.EXECUTE not in mode or self.is_dir()
 
+    def stat(self) -> FileStatus:
+        """Return the status of the node, without following symbolic links."""
+        if self.is_dir():
+            return FileStatus(FileType.DIRECTORY, 0o755, 0)
+
+        if self.is_symlink():
+            return FileStatus(FileType.SYMLINK, 0o777, 0, self.readlink())
+
+        return FileStatus(FileType.REGULAR, 0o644, len(self.read_bytes()))
+
 
 class DictFilesystem(NodeFilesystem):
     """Dictionary-based filesystem for your pocket."""
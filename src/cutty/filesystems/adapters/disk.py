@@ -1,10 +1,14 @@
 """Disk-based filesystem implementation using pathlib."""
 import os
 import pathlib
+import stat
 from collections.abc import Iterator
+from typing import BinaryIO
 
 from cutty.filesystems.domain.filesystem import Access
+from cutty.filesystems.domain.filesystem import FileStatus
 from cutty.filesystems.domain.filesystem import Filesystem
+from cutty.filesystems.domain.filesystem import FileType
 from cutty.filesystems.domain.purepath import PurePath
 
 
@@ -55,6 +59,17 @@ class DiskFilesystem(Filesystem):
         """Return the contents of this file."""
         return self.resolve(path).read_text()
 
+    def open(self, path: PurePath) -> BinaryIO:
+        """Open the file for reading in binary mode."""
+        return self.resolve(path).open("rb")
+
+    def blobid(self, path: PurePath) -> str:
+        """Return an identifier for the file contents, based on its status."""
+        status = self.resolve(path).stat()
+        return "stat:{}:{}:{}:{}".format(
+            status.st_dev, status.st_ino, status.st_size, status.st_mtime_ns
+        )
+
     def is_symlink(self, path: PurePath) -> bool:
         """Return True if this is a symbolic link."""
         resolved = self.resolve(path.parent) / path.name
@@ -70,6 +85,29 @@ class DiskFilesystem(Filesystem):
         """Return True if the user can access the path."""
         return os.access(self.resolve(path), _fromaccess(mode))
 
+    def stat(self, path: PurePath, *, follow_symlinks: bool = True) -> FileStatus:
+        """Return the file status."""
+        if follow_symlinks:
+            status = self.resolve(path).stat()
+        else:
+            resolved = self.resolve(path.parent) / path.name
+            status = resolved.lstat()
+
+            if stat.S_ISLNK(status.st_mode):
+                target = PurePath(*resolved.readlink().parts)
+                return FileStatus(
+                    FileType.SYMLINK, stat.S_IMODE(status.st_mode), 0, target
+                )
+
+        filetype = (
+            FileType.REGULAR
+            if stat.S_ISREG(status.st_mode)
+            else FileType.DIRECTORY
+            if stat.S_ISDIR(status.st_mode)
+            else FileType.OTHER
+        )
+        return FileStatus(filetype, stat.S_IMODE(status.st_mode), status.st_size)
+
     def eq(self, path: PurePath, other: PurePath) -> bool:
         """Return True if the paths are considered equal."""
         return pathlib.Path(*path.parts) == pathlib.Path(*other.parts)
@@ -1,15 +1,42 @@
 """Git-based filesystem using libgit2."""
+import io
 import pathlib
 from collections.abc import Iterator
+from typing import Any
+from typing import BinaryIO
 
 import pygit2
 
 from cutty.filesystems.domain.filesystem import Access
+from cutty.filesystems.domain.filesystem import FileStatus
+from cutty.filesystems.domain.filesystem import FileType
 from cutty.filesystems.domain.nodefs import FilesystemNode
 from cutty.filesystems.domain.nodefs import NodeFilesystem
 from cutty.filesystems.domain.purepath import PurePath
 
 
+class _BlobReader(io.RawIOBase):
+    """Read the contents of a blob without copying it into a bytes object."""
+
+    def __init__(self, blob: pygit2.Blob) -> None:
+        """Initialize."""
+        super().__init__()
+        self._view = memoryview(blob)
+        self._position = 0
+
+    def readable(self) -> bool:
+        """Return True, the stream can be read from."""
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        """Read bytes into a pre-allocated buffer."""
+        chunk = self._view[self._position : self._position + len(buffer)]
+        size = len(chunk)
+        memoryview(buffer).cast("B")[:size] = chunk
+        self._position += size
+        return size
+
+
 class GitFilesystemNode(FilesystemNode):
     """A node in a git filesystem."""
 
@@ -44,6 +71,14 @@ class GitFilesystemNode(FilesystemNode):
         """Return the file contents."""
         return self.read_bytes().decode()
 
+    def open(self) -> BinaryIO:
+        """Open the file for reading in binary mode."""
+        return io.BufferedReader(_BlobReader(self.node))
+
+    def blobid(self) -> str:
+        """Return the object ID of the blob."""
+        return str(self.node.id)
+
     def readlink(self) -> PurePath:
         """Return the link target."""
         target: str = self.node.data.decode(errors="surrogateescape")
@@ -69,6 +104,21 @@ class GitFilesystemNode(FilesystemNode):
             or self.node.filemode == pygit2.GIT_FILEMODE_BLOB_EXECUTABLE
         )
 
+    def stat(self) -> FileStatus:
+        """Return the status of the node, without following symbolic links."""
+        if isinstance(self.node, pygit2.Tree):
+            return FileStatus(FileType.DIRECTORY, 0o755, 0)
+
+        if self.node.filemode == pygit2.GIT_FILEMODE_LINK:
+            return FileStatus(FileType.SYMLINK, 0o777, self.node.size, self.readlink())
+
+        mode = (
+            0o755
+            if self.node.filemode == pygit2.GIT_FILEMODE_BLOB_EXECUTABLE
+            else 0o644
+        )
+        return FileStatus(FileType.REGULAR, mode, self.node.size)
+
 
 class GitFilesystem(NodeFilesystem):
     """Git-based filesystem."""
@@ -3,8 +3,12 @@ import pathlib
 import stat
 import zipfile
 from collections.abc import Iterator
+from typing import BinaryIO
+from typing import cast
 
 from cutty.filesystems.domain.filesystem import Access
+from cutty.filesystems.domain.filesystem import FileStatus
+from cutty.filesystems.domain.filesystem import FileType
 from cutty.filesystems.domain.nodefs import FilesystemNode
 from cutty.filesystems.domain.nodefs import NodeFilesystem
 from cutty.filesystems.domain.purepath import PurePath
@@ -19,10 +23,14 @@ def _fromaccess(access: Access) -> int:
     return sum(mapping[flag] for flag in Access if flag and flag in access)
 
 
-def _getfilemode(zippath: zipfile.Path) -> int:
+def _getinfo(zippath: zipfile.Path) -> zipfile.ZipInfo:
     info: zipfile.ZipInfo
     info = zippath.root.getinfo(zippath.at)  # type: ignore[attr-defined]
-    return info.external_attr >> 16
+    return info
+
+
+def _getfilemode(zippath: zipfile.Path) -> int:
+    return _getinfo(zippath).external_attr >> 16
 
 
 class ZipFilesystemNode(FilesystemNode):
@@ -52,6 +60,10 @@ class ZipFilesystemNode(FilesystemNode):
         """Return the file contents."""
         return self.node.read_text()
 
+    def open(self) -> BinaryIO:
+        """Open the file for reading in binary mode."""
+        return cast(BinaryIO, self.node.open("rb"))
+
     def readlink(self) -> PurePath:
         """Return the link target."""
         raise NotImplementedError()
@@ -74,6 +86,15 @@ class ZipFilesystemNode(FilesystemNode):
         """Return True if the user can access the node."""
         return not mode or bool(_getfilemode(self.node) & _fromaccess(mode))
 
+    def stat(self) -> FileStatus:
+        """Return the status of the node, without following symbolic links."""
+        if self.node.is_dir():
+            return FileStatus(FileType.DIRECTORY, 0o755, 0)
+
+        info = _getinfo(self.node)
+        mode = stat.S_IMODE(info.external_attr >> 16)
+        return FileStatus(FileType.REGULAR, mode, info.file_size)
+
 
 class ZipFilesystem(NodeFilesystem):
     """ZIP filesystem."""
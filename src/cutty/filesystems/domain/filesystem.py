@@ -1,7 +1,11 @@
 """Filesystem abstraction."""
 import abc
 import enum
+import io
 from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import BinaryIO
+from typing import Optional
 
 from cutty.filesystems.domain.purepath import PurePath
 
@@ -15,6 +19,29 @@ class Access(enum.Flag):
     READ = enum.auto()
 
 
+class FileType(enum.Enum):
+    """File type."""
+
+    REGULAR = enum.auto()
+    DIRECTORY = enum.auto()
+    SYMLINK = enum.auto()
+    OTHER = enum.auto()
+
+
+@dataclass(frozen=True)
+class FileStatus:
+    """Result of a single metadata query for a file.
+
+    The mode holds the permission bits. The target is only set for symbolic
+    links.
+    """
+
+    type: FileType
+    mode: int
+    size: int
+    target: Optional[PurePath] = None
+
+
 class Filesystem(abc.ABC):
     """A filesystem abstraction."""
 
@@ -38,6 +65,19 @@ class Filesystem(abc.ABC):
     def read_text(self, path: PurePath) -> str:
         """Return the contents of this file."""
 
+    def open(self, path: PurePath) -> BinaryIO:
+        """Open the file for reading in binary mode."""
+        return io.BytesIO(self.read_bytes(path))
+
+    def blobid(self, path: PurePath) -> Optional[str]:
+        """Return an identifier for the file contents, if available.
+
+        Files with the same identifier have the same contents. Filesystems
+        return None if they cannot provide an identifier without reading the
+        file.
+        """
+        return None
+
     @abc.abstractmethod
     def is_symlink(self, path: PurePath) -> bool:
         """Return True if this is a symbolic link."""
@@ -50,6 +90,15 @@ class Filesystem(abc.ABC):
     def access(self, path: PurePath, mode: Access) -> bool:
         """Return True if the user can access the path."""
 
+    @abc.abstractmethod
+    def stat(self, path: PurePath, *, follow_symlinks: bool = True) -> FileStatus:
+        """Return the file status.
+
+        Raises FileNotFoundError or NotADirectoryError if the file does not
+        exist. If ``follow_symlinks`` is False, a symbolic link is described
+        by itself rather than by its target.
+        """
+
     def eq(self, path: PurePath, other: PurePath) -> bool:
         """Return True if the paths are considered equal."""
         return path.parts == other.parts
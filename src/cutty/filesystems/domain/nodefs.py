@@ -3,9 +3,13 @@ from __future__ import annotations
 
 import abc
 import functools
+import io
 from collections.abc import Iterator
+from typing import BinaryIO
+from typing import Optional
 
 from cutty.filesystems.domain.filesystem import Access
+from cutty.filesystems.domain.filesystem import FileStatus
 from cutty.filesystems.domain.filesystem import Filesystem
 from cutty.filesystems.domain.purepath import PurePath
 
@@ -33,6 +37,14 @@ class FilesystemNode(abc.ABC):
     def read_text(self) -> str:
         """Return the file contents."""
 
+    def open(self) -> BinaryIO:
+        """Open the file for reading in binary mode."""
+        return io.BytesIO(self.read_bytes())
+
+    def blobid(self) -> Optional[str]:
+        """Return an identifier for the file contents, if available."""
+        return None
+
     @abc.abstractmethod
     def readlink(self) -> PurePath:
         """Return the link target."""
@@ -49,6 +61,10 @@ class FilesystemNode(abc.ABC):
     def access(self, mode: Access) -> bool:
         """Return True if the user can access the node."""
 
+    @abc.abstractmethod
+    def stat(self) -> FileStatus:
+        """Return the status of the node, without following symbolic links."""
+
 
 class InvalidArgumentError(Exception):
     """The filesystem operation received an invalid argument."""
@@ -155,6 +171,24 @@ class NodeFilesystem(Filesystem):
 
         return node.read_text()
 
+    def open(self, path: PurePath) -> BinaryIO:
+        """Open the file for reading in binary mode."""
+        node = self.lookup(path)
+
+        if node.is_dir():
+            raise IsADirectoryError(f"is a directory: {path}")
+
+        return node.open()
+
+    def blobid(self, path: PurePath) -> Optional[str]:
+        """Return an identifier for the file contents, if available."""
+        node = self.lookup(path)
+
+        if node.is_dir():
+            raise IsADirectoryError(f"is a directory: {path}")
+
+        return node.blobid()
+
     def is_symlink(self, path: PurePath) -> bool:
         """Return True if this is a symbolic link."""
         try:
@@ -184,3 +218,10 @@ class NodeFilesystem(Filesystem):
             return False
         else:
             return node.access(mode)
+
+    def stat(self, path: PurePath, *, follow_symlinks: bool = True) -> FileStatus:
+        """Return the file status."""
+        if follow_symlinks or not path.parts:
+            return self.lookup(path).stat()
+
+        return self._lookup_symlink(path).stat()
@@ -2,8 +2,11 @@
 from __future__ import annotations
 
 from collections.abc import Iterator
+from typing import BinaryIO
+from typing import Optional
 
 from cutty.filesystems.domain.filesystem import Access
+from cutty.filesystems.domain.filesystem import FileStatus
 from cutty.filesystems.domain.filesystem import Filesystem
 from cutty.filesystems.domain.purepath import PurePath
 from cutty.util.typeguard_ignore import typeguard_ignore
@@ -12,6 +15,8 @@ from cutty.util.typeguard_ignore import typeguard_ignore
 class Path(PurePath):
     """Location in a filesystem, with methods for accessing the filesystem."""
 
+    __slots__ = ("filesystem",)
+
     filesystem: Filesystem
 
     def __init__(self, *parts: str, filesystem: Filesystem) -> None:
@@ -19,9 +24,11 @@ class Path(PurePath):
         super().__init__(*parts)
         object.__setattr__(self, "filesystem", filesystem)
 
-    def _withparts(self, *parts: str) -> Path:
-        """Create a path with the given parts."""
-        return Path(*parts, filesystem=self.filesystem)
+    def _fromparts(self, parts: tuple[str, ...]) -> Path:
+        """Create a path on the same filesystem from interned parts."""
+        path = super()._fromparts(parts)
+        object.__setattr__(path, "filesystem", self.filesystem)
+        return path
 
     def is_dir(self) -> bool:
         """Return True if this is a directory."""
@@ -44,6 +51,14 @@ class Path(PurePath):
         """Return the contents of this file."""
         return self.filesystem.read_text(self)
 
+    def open(self) -> BinaryIO:
+        """Open the file for reading in binary mode."""
+        return self.filesystem.open(self)
+
+    def blobid(self) -> Optional[str]:
+        """Return an identifier for the file contents, if available."""
+        return self.filesystem.blobid(self)
+
     def is_symlink(self) -> bool:
         """Return True if this is a symbolic link."""
         return self.filesystem.is_symlink(self)
@@ -56,8 +71,14 @@ class Path(PurePath):
         """Return True if the user can access the path."""
         return self.filesystem.access(self, mode)
 
-    def __hash__(self) -> int:
-        """Return the hash value of the path."""
+    def stat(self, *, follow_symlinks: bool = True) -> FileStatus:
+        """Return the file status."""
+        return self.filesystem.stat(self, follow_symlinks=follow_symlinks)
+
+    __hash__ = PurePath.__hash__
+
+    def _computehash(self) -> int:
+        """Compute the hash value of the path."""
         return hash((self.parts, self.filesystem))
 
     @typeguard_ignore
@@ -1,7 +1,10 @@
 """Filesystem implementation providing a view into another filesystem."""
 from collections.abc import Iterator
+from typing import BinaryIO
+from typing import Optional
 
 from cutty.filesystems.domain.filesystem import Access
+from cutty.filesystems.domain.filesystem import FileStatus
 from cutty.filesystems.domain.nodefs import FilesystemNode
 from cutty.filesystems.domain.nodefs import NodeFilesystem
 from cutty.filesystems.domain.path import Path
@@ -35,6 +38,14 @@ class PathNode(FilesystemNode):
         """Return the file contents."""
         return self.path.read_text()
 
+    def open(self) -> BinaryIO:
+        """Open the file for reading in binary mode."""
+        return self.path.open()
+
+    def blobid(self) -> Optional[str]:
+        """Return an identifier for the file contents, if available."""
+        return self.path.blobid()
+
     def readlink(self) -> PurePath:
         """Return the link target."""
         return self.path.readlink()
@@ -52,6 +63,10 @@ class PathNode(FilesystemNode):
         """Return True if the user can access the node."""
         return self.path.access(mode)
 
+    def stat(self) -> FileStatus:
+        """Return the status of the node, without following symbolic links."""
+        return self.path.stat(follow_symlinks=False)
+
 
 class PathFilesystem(NodeFilesystem):
     """Filesystem implementation providing a view into another filesystem."""
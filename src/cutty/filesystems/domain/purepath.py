@@ -1,37 +1,103 @@
 """Filesystem-agnostic path."""
 from __future__ import annotations
 
+import sys
+from collections.abc import Iterator
 from collections.abc import Sequence
-from dataclasses import dataclass
+from typing import Any
 from typing import overload
 from typing import TypeVar
 from typing import Union
 
+from cutty.util.typeguard_ignore import typeguard_ignore
+
 
 PurePathT = TypeVar("PurePathT", bound="PurePath")
 
 
-@dataclass(frozen=True)
 class PurePath:
-    """Location in a filesystem."""
+    """Location in a filesystem.
+
+    Paths are immutable. Path components are interned, and the hash value and
+    string representation are computed on first use and cached.
+    """
+
+    __slots__ = ("parts", "_hash", "_str")
 
     parts: tuple[str, ...]
+    _hash: int
+    _str: str
 
     def __init__(self, *parts: str) -> None:
         """Initialize."""
-        object.__setattr__(self, "parts", parts)
-
-    def _withparts(self: PurePathT, *parts: str) -> PurePathT:
-        """Create a path with the given parts."""
-        return self.__class__(*parts)
+        object.__setattr__(self, "parts", _intern(parts))
+
+    def _fromparts(self: PurePathT, parts: tuple[str, ...]) -> PurePathT:
+        """Create a path of the same type from interned parts."""
+        path = object.__new__(self.__class__)
+        object.__setattr__(path, "parts", parts)
+        return path
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Raise an exception, paths are immutable."""
+        raise AttributeError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        """Raise an exception, paths are immutable."""
+        raise AttributeError(f"cannot delete field {name!r}")
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the fields for copying and pickling, without cached values."""
+        return {
+            name: getattr(self, name)
+            for cls in type(self).__mro__
+            for name in getattr(cls, "__slots__", ())
+            if name not in ("_hash", "_str")
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore the fields when copying and unpickling."""
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+        object.__setattr__(self, "parts", _intern(self.parts))
+
+    def __repr__(self) -> str:
+        """Return a representation for debugging."""
+        return f"{self.__class__.__name__}(parts={self.parts!r})"
 
     def __str__(self) -> str:
         """Return a readable representation."""
-        return "/".join(self.parts)
+        try:
+            return self._str
+        except AttributeError:
+            text = "/".join(self.parts)
+            object.__setattr__(self, "_str", text)
+            return text
+
+    def __hash__(self) -> int:
+        """Return the hash value of the path."""
+        try:
+            return self._hash
+        except AttributeError:
+            value = self._computehash()
+            object.__setattr__(self, "_hash", value)
+            return value
+
+    def _computehash(self) -> int:
+        """Compute the hash value of the path."""
+        return hash(self.parts)
+
+    @typeguard_ignore
+    def __eq__(self, other: object) -> bool:
+        """Return True if the paths are equal."""
+        if not isinstance(other, PurePath) or other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.parts == other.parts
 
     def __truediv__(self: PurePathT, part: str) -> PurePathT:
         """Return a path with the part appended."""
-        return self.joinpath(part)
+        return self._fromparts((*self.parts, sys.intern(part)))
 
     @property
     def name(self) -> str:
@@ -48,7 +114,7 @@ class PurePath:
     @property
     def parent(self: PurePathT) -> PurePathT:
         """Return the parent of this path."""
-        return self._withparts(*self.parts[:-1]) if self.parts else self
+        return self._fromparts(self.parts[:-1]) if self.parts else self
 
     @property
     def parents(self: PurePathT) -> Sequence[PurePathT]:
@@ -57,12 +123,19 @@ class PurePath:
 
     def joinpath(self: PurePathT, *parts: str) -> PurePathT:
         """Return a path with the parts appended."""
-        return self._withparts(*self.parts, *parts)
+        return self._fromparts(self.parts + _intern(parts))
+
+
+def _intern(parts: tuple[str, ...]) -> tuple[str, ...]:
+    """Intern the path components."""
+    return tuple(map(sys.intern, parts))
 
 
 class Parents(Sequence[PurePathT]):
     """Sequence-like access to the logical ancestors of a path."""
 
+    __slots__ = ("path",)
+
     def __init__(self, path: PurePathT) -> None:
         """Initialize."""
         self.path = path
@@ -71,6 +144,12 @@ class Parents(Sequence[PurePathT]):
         """Return the number of parents."""
         return len(self.path.parts)
 
+    def __iter__(self) -> Iterator[PurePathT]:
+        """Iterate over the parents, from the nearest to the root."""
+        path, parts = self.path, self.path.parts
+        for stop in range(len(parts) - 1, -1, -1):
+            yield path._fromparts(parts[:stop])
+
     @overload
     def __getitem__(self, index: int) -> PurePathT:  # noqa: D105
         ...
@@ -83,12 +162,19 @@ class Parents(Sequence[PurePathT]):
         self, index: Union[int, slice]
     ) -> Union[PurePathT, Sequence[PurePathT]]:
         """Return the nth parent."""
+        path, parts = self.path, self.path.parts
+        size = len(parts)
+
         if isinstance(index, slice):
-            indices = index.indices(len(self))
-            return tuple(self[index] for index in range(*indices))
+            indices = index.indices(size)
+            return tuple(
+                path._fromparts(parts[: size - index - 1]) for index in range(*indices)
+            )
 
-        if index >= len(self) or index < -len(self):
+        if index >= size or index < -size:
             raise IndexError(index)
 
-        parts = self.path.parts[: -(index + 1)]
-        return self.path._withparts(*parts)
+        if index < 0:
+            index += size
+
+        return path._fromparts(parts[: size - index - 1])
@@ -1,4 +1,5 @@
 """Building projects in a repository."""
+import dataclasses
 import datetime
 from collections.abc import Iterator
 from collections.abc import Sequence
@@ -7,15 +8,28 @@ from typing import Optional
 from cutty.compat.contextlib import contextmanager
 from cutty.packages.domain.package import Author
 from cutty.projects.config import ProjectConfig
+from cutty.projects.generate import BaseProject
 from cutty.projects.generate import generate
 from cutty.projects.messages import MessageBuilder
 from cutty.projects.project import Project
 from cutty.projects.repository import ProjectRepository
 from cutty.projects.store import storeproject
+from cutty.projects.store import storeprojectfiles
+from cutty.projects.template import Template
 from cutty.projects.template import TemplateProvider
 from cutty.variables.domain.bindings import Binding
 
 
+@contextmanager
+def loadtemplate(config: ProjectConfig) -> Iterator[Template]:
+    """Load the project template."""
+    provider = TemplateProvider.create()
+    templates = provider.provide(config.template, config.directory)
+
+    with templates.get(config.revision) as template:
+        yield template
+
+
 @contextmanager
 def createproject(
     config: ProjectConfig,
@@ -23,18 +37,19 @@ def createproject(
     interactive: bool,
     createconfigfile: bool = True,
     userbindings: Sequence[Binding] = (),
+    jobs: int = 1,
+    base: Optional[BaseProject] = None,
 ) -> Iterator[Project]:
     """Create the project."""
-    provider = TemplateProvider.create()
-    templates = provider.provide(config.template, config.directory)
-
-    with templates.get(config.revision) as template:
+    with loadtemplate(config) as template:
         yield generate(
             template,
             config.bindings,
             interactive=interactive,
             createconfigfile=createconfigfile,
             userbindings=userbindings,
+            jobs=jobs,
+            base=base,
         )
 
 
@@ -45,24 +60,37 @@ def commitproject(
     parent: Optional[str] = None,
     commitmessage: Optional[MessageBuilder] = None,
 ) -> str:
-    """Build the project, returning the commit ID."""
-    with repository.build(parent=parent) as builder:
-        storeproject(project, builder.path)
+    """Build the project, returning the commit ID.
 
-        author: Optional[Author] = None
-        date: Optional[datetime.datetime] = None
+    Projects without hooks are written to the object database directly.
+    Otherwise, they are written to a temporary directory, for the hooks to run.
+    The directory is not a git worktree, so git commands run by hooks do not
+    see the project repository, and a ``.git`` directory created by a hook is
+    not committed.
+    """
+    author: Optional[Author] = None
+    date: Optional[datetime.datetime] = None
 
-        if commitmessage is not None:
-            message = commitmessage(project.template)
-        elif project.template.commit:
-            message = project.template.commit.message
-            author = project.template.commit.author
-            date = project.template.commit.date
-        else:  # pragma: no cover
-            # The `commitmessage` is only None when importing, and imports are only
-            # possible when there's a `template.commit`. So this should be unreachable.
-            message = f"Import {project.template.name}"
+    if commitmessage is not None:
+        message = commitmessage(project.template)
+    elif project.template.commit:
+        message = project.template.commit.message
+        author = project.template.commit.author
+        date = project.template.commit.date
+    else:  # pragma: no cover
+        # The `commitmessage` is only None when importing, and imports are only
+        # possible when there's a `template.commit`. So this should be unreachable.
+        message = f"Import {project.template.name}"
 
+    project = dataclasses.replace(project, hooks=tuple(project.hooks))
+
+    if not project.hooks:
+        with repository.buildtree(parent=parent) as treebuilder:
+            storeprojectfiles(project, treebuilder.storage)
+            return treebuilder.commit(message, author=author, date=date)
+
+    with repository.build(parent=parent) as builder:
+        storeproject(project, builder.path)
         return builder.commit(message, author=author, date=date)
 
 
@@ -74,16 +102,35 @@ def buildproject(
     interactive: bool,
     parent: Optional[str] = None,
     commitmessage: Optional[MessageBuilder] = None,
+    base: Optional[BaseProject] = None,
 ) -> str:
     """Build the project, returning the commit ID."""
     with createproject(
-        config, userbindings=userbindings, interactive=interactive
+        config, userbindings=userbindings, interactive=interactive, base=base
     ) as project:
         return commitproject(
             repository, project, parent=parent, commitmessage=commitmessage
         )
 
 
+@contextmanager
+def buildbaseproject(
+    repository: ProjectRepository,
+    config: ProjectConfig,
+    *,
+    interactive: bool,
+    commitmessage: Optional[MessageBuilder] = None,
+) -> Iterator[tuple[str, BaseProject]]:
+    """Build the project, yielding the commit ID and a base for other builds.
+
+    The template remains loaded while the context is active.
+    """
+    with loadtemplate(config) as template:
+        project = generate(template, config.bindings, interactive=interactive)
+        commit = commitproject(repository, project, commitmessage=commitmessage)
+        yield commit, BaseProject(template, project.bindings, repository.files(commit))
+
+
 def buildparentproject(
     repository: ProjectRepository,
     config: ProjectConfig,
@@ -1,10 +1,15 @@
 """Project generator."""
 from __future__ import annotations
 
+from collections.abc import Callable
 from collections.abc import Iterable
 from collections.abc import Sequence
 from dataclasses import dataclass
+from typing import Optional
 
+from cutty.filestorage.domain.files import File
+from cutty.filestorage.domain.files import loadfile
+from cutty.filestorage.domain.files import RegularFile
 from cutty.filesystems.domain.path import Path
 from cutty.filesystems.domain.purepath import PurePath
 from cutty.projects.config import createprojectconfigfile
@@ -16,9 +21,13 @@ from cutty.projects.project import Project
 from cutty.projects.template import Template
 from cutty.rendering.adapters.cookiecutter import CookiecutterConfig
 from cutty.rendering.adapters.cookiecutter import createcookiecutterrenderer
+from cutty.rendering.adapters.cookiecutter import createcookiecutterrenderplan
+from cutty.rendering.adapters.cookiecutter import createdependencyfinder
 from cutty.rendering.domain.render import Renderer
 from cutty.rendering.domain.renderbind import renderbind
 from cutty.rendering.domain.renderfiles import renderfiles
+from cutty.rendering.domain.renderplan import renderplan
+from cutty.rendering.domain.renderplan import RenderPlan
 from cutty.variables.adapters.prompts import createprompt
 from cutty.variables.domain.binders import binddefault
 from cutty.variables.domain.binders import Binder
@@ -26,6 +35,19 @@ from cutty.variables.domain.binders import override
 from cutty.variables.domain.bindings import Binding
 
 
+@dataclass(frozen=True)
+class BaseProject:
+    """A previously generated project, whose files may be reused.
+
+    The files are the generated project files in a previous build, without the
+    project directory.
+    """
+
+    template: Template
+    bindings: Sequence[Binding]
+    files: Path
+
+
 @dataclass(frozen=True)
 class ProjectGenerator:
     """A project generator."""
@@ -35,15 +57,31 @@ class ProjectGenerator:
     _renderer: Renderer
     _paths: Iterable[Path]
     _hooks: Iterable[Path]
+    _root: Path
+    _plan: Optional[RenderPlan] = None
 
     @classmethod
     def create(cls, template: Template) -> ProjectGenerator:
-        """Create a project generator."""
+        """Create a project generator.
+
+        Templates with a cache directory are rendered using a render plan, which
+        is created on first use and stored in the cache directory.
+        """
+        cachedir = template.metadata.cachedir
         config = loadcookiecutterconfig(template.metadata.location, template.root)
-        renderer = createcookiecutterrenderer(template.root, config)
-        paths = findcookiecutterpaths(template.root, config)
+        renderer = createcookiecutterrenderer(template.root, config, cachedir=cachedir)
+        paths = list(findcookiecutterpaths(template.root, config))
         hooks = findcookiecutterhooks(template.root)
-        return cls(template.metadata, config, renderer, paths, hooks)
+        plan = (
+            createcookiecutterrenderplan(
+                template.root, paths, config, cachedir=cachedir
+            )
+            if cachedir is not None
+            else None
+        )
+        return cls(
+            template.metadata, config, renderer, paths, hooks, template.root, plan
+        )
 
     def bind(
         self, *, interactive: bool = True, bindings: Sequence[Binding] = ()
@@ -53,11 +91,105 @@ class ProjectGenerator:
         binder = override(binder, bindings)
         return renderbind(self._renderer, binder, self._config.variables)
 
-    def generate(self, bindings: Sequence[Binding]) -> Project:
-        """Generate a project using the given bindings."""
-        files = renderfiles(self._paths, self._renderer, bindings)
+    def generate(
+        self,
+        bindings: Sequence[Binding],
+        *,
+        jobs: int = 1,
+        base: Optional[BaseProject] = None,
+    ) -> Project:
+        """Generate a project using the given bindings.
+
+        Pass ``jobs`` to render project files in a pool of worker threads. Pass
+        a base project to reuse its files where they cannot differ.
+        """
+        reuse = self._createreuse(base, bindings) if base is not None else None
+        files = (
+            renderplan(
+                self._plan, self._root, self._renderer, bindings, jobs=jobs, reuse=reuse
+            )
+            if self._plan is not None
+            else renderfiles(
+                self._paths, self._renderer, bindings, jobs=jobs, reuse=reuse
+            )
+        )
         hooks = renderfiles(self._hooks, self._renderer, bindings)
-        return Project.create(self._template, files, hooks)
+        return Project.create(self._template, files, hooks, bindings)
+
+    def _createreuse(
+        self, base: BaseProject, bindings: Sequence[Binding]
+    ) -> Optional[Callable[[Path], Optional[File]]]:
+        """Return a function that reuses files of the base project.
+
+        A file is reused if its template file is unchanged, and the variables
+        it depends on are bound to the same values. Files are never reused if
+        the templates have hooks, or different settings.
+        """
+        if (
+            any(findcookiecutterhooks(self._root))
+            or any(findcookiecutterhooks(base.template.root))
+            or loadcookiecutterconfig(
+                base.template.metadata.location, base.template.root
+            ).settings
+            != self._config.settings
+        ):
+            return None
+
+        values = {binding.name: binding.value for binding in bindings}
+        basevalues = {binding.name: binding.value for binding in base.bindings}
+        changed = {
+            name
+            for name in values.keys() | basevalues.keys()
+            if name not in values
+            or name not in basevalues
+            or values[name] != basevalues[name]
+        }
+
+        finddependencies: Callable[[Path], Optional[frozenset[str]]]
+
+        if self._plan is not None:
+            variables = {planned.parts: planned.variables for planned in self._plan}
+            finddependencies = lambda path: variables.get(  # noqa: E731
+                path.parts[len(self._root.parts) :]
+            )
+        else:
+            finddependencies = createdependencyfinder(
+                self._root, self._config, cachedir=self._template.cachedir
+            )
+
+        def reuse(path: Path) -> Optional[File]:
+            basepath = base.template.root.joinpath(*path.parts)
+
+            try:
+                status, basestatus = path.stat(), basepath.stat()
+            except FileNotFoundError:
+                return None
+
+            if (
+                path.is_symlink()
+                or basepath.is_symlink()
+                or status != basestatus
+                or (blobid := path.blobid()) is None
+                or blobid != basepath.blobid()
+                or (names := finddependencies(path)) is None
+                or not names.isdisjoint(changed)
+            ):
+                return None
+
+            renderedpath = self._renderer(path, bindings)
+            file = base.files.joinpath(*renderedpath.parts[1:])
+
+            try:
+                basefile = loadfile(file, follow_symlinks=False)
+            except RuntimeError:
+                return None
+
+            if not isinstance(basefile, RegularFile):
+                return None
+
+            return basefile.withpath(PurePath(*renderedpath.parts))
+
+        return reuse
 
     def addconfig(self, project: Project, bindings: Sequence[Binding]) -> Project:
         """Add a configuration file to the project."""
@@ -82,13 +214,15 @@ def generate(
     interactive: bool,
     userbindings: Sequence[Binding] = (),
     createconfigfile: bool = True,
+    jobs: int = 1,
+    base: Optional[BaseProject] = None,
 ) -> Project:
     """Generate a project from a project template."""
     generator = ProjectGenerator.create(template)
     bindings2 = generator.bind(
         interactive=interactive, bindings=[*bindings, *userbindings]
     )
-    project = generator.generate(bindings2)
+    project = generator.generate(bindings2, jobs=jobs, base=base)
 
     if createconfigfile:
         project = generator.addconfig(project, [*bindings, *bindings2])
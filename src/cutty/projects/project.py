@@ -4,11 +4,13 @@ from __future__ import annotations
 import dataclasses
 import itertools
 from collections.abc import Iterable
+from collections.abc import Sequence
 from dataclasses import dataclass
 
 from cutty.errors import CuttyError
 from cutty.filestorage.domain.files import File
 from cutty.projects.template import Template
+from cutty.variables.domain.bindings import Binding
 
 
 class EmptyTemplateError(CuttyError):
@@ -23,6 +25,7 @@ class Project:
     name: str
     files: Iterable[File]
     hooks: Iterable[File]
+    bindings: Sequence[Binding] = ()
 
     @classmethod
     def create(
@@ -30,6 +33,7 @@ class Project:
         template: Template.Metadata,
         files: Iterable[File],
         hooks: Iterable[File],
+        bindings: Sequence[Binding] = (),
     ) -> Project:
         """Create a project."""
         files = iter(files)
@@ -41,7 +45,7 @@ class Project:
 
         files = itertools.chain([first], files)
         name = first.path.parts[0]
-        return Project(template, name, files, hooks)
+        return Project(template, name, files, hooks, bindings)
 
     def add(self, file: File) -> Project:
         """Add a project file."""
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import datetime
+import tempfile
 from collections.abc import Iterable
 from collections.abc import Iterator
 from dataclasses import dataclass
@@ -12,6 +13,13 @@ import pygit2
 
 from cutty.compat.contextlib import contextmanager
 from cutty.errors import CuttyError
+from cutty.filestorage.adapters.git import GitTreeStorage
+from cutty.filestorage.domain.files import File
+from cutty.filestorage.domain.files import loadfile
+from cutty.filesystems.adapters.disk import DiskFilesystem
+from cutty.filesystems.adapters.git import GitFilesystem
+from cutty.filesystems.domain.filesystem import FileType
+from cutty.filesystems.domain.path import Path as FilesystemPath
 from cutty.packages.domain.package import Author
 from cutty.projects.config import PROJECT_CONFIG_FILE
 from cutty.util.git import MergeConflictError
@@ -19,23 +27,122 @@ from cutty.util.git import MergeMessage
 from cutty.util.git import Repository
 
 
-UPDATE_BRANCH = "cutty/update"
-
-
 class NoUpdateInProgressError(CuttyError):
     """A sequencer action was invoked without an update in progress."""
 
 
+def _createsignature(
+    signature: pygit2.Signature,
+    author: Optional[Author] = None,
+    date: Optional[datetime.datetime] = None,
+) -> pygit2.Signature:
+    """Return the signature for a project commit."""
+    if author is not None:
+        signature = pygit2.Signature(
+            author.name, author.email, signature.time, signature.offset
+        )
+    if date is not None:
+        signature = pygit2.Signature(
+            signature.name, signature.email, int(date.timestamp()), 0
+        )
+
+    return signature
+
+
+def _walkfiles(path: FilesystemPath) -> Iterator[File]:
+    """Load the files in a directory, except for git metadata."""
+    for entry in path.iterdir():
+        if entry.name == ".git":
+            continue
+
+        status = entry.stat(follow_symlinks=False)
+
+        if status.type is FileType.DIRECTORY:
+            yield from _walkfiles(entry)
+        elif status.type is not FileType.OTHER:
+            yield loadfile(entry, follow_symlinks=False)
+
+
+def _committree(
+    repository: ProjectRepository,
+    parent: str,
+    storage: GitTreeStorage,
+    root: Path,
+    message: str,
+    author: Optional[Author],
+    date: Optional[datetime.datetime],
+) -> str:
+    """Commit the stored files on top of the parent, returning the commit ID.
+
+    Files ignored by git are excluded, as if the root was a worktree of the
+    repository. The repository is opened separately for this, with the root as
+    its working directory, which is not recorded in the repository. If the tree
+    is unchanged, the parent is returned.
+    """
+    project = repository.project._repository
+    scratch = pygit2.Repository(project.path)
+    scratch.workdir = str(root)
+
+    ignored = {path for path in storage.entries if scratch.path_is_ignored(path)}
+    tree = storage.writetree(exclude=ignored)
+    commit = project[parent]
+
+    if tree == commit.tree.id:
+        return parent
+
+    signature = _createsignature(repository.project.default_signature, author, date)
+    oid = project.create_commit(None, signature, signature, message, tree, [commit.id])
+    return str(oid)
+
+
 @dataclass
 class ProjectBuilder:
-    """Adding a project to the repository."""
+    """Adding a project to the repository.
+
+    The project is written to a temporary directory, which is not registered as
+    a git worktree. Committing writes the files to the object database, except
+    for git metadata in the directory.
+    """
+
+    _repository: ProjectRepository
+    _parent: str
+    path: Path
+
+    def commit(
+        self,
+        message: str,
+        author: Optional[Author] = None,
+        date: Optional[datetime.datetime] = None,
+    ) -> str:
+        """Commit the project.
+
+        Files in the project directory are scanned, including those added by
+        hooks. Files ignored by git are skipped.
+        """
+        files = _walkfiles(FilesystemPath(filesystem=DiskFilesystem(self.path)))
+        storage = GitTreeStorage(self._repository.project._repository, root=self.path)
 
-    _worktree: Repository
+        with storage:
+            for file in files:
+                storage.add(file)
+
+        return _committree(
+            self._repository, self._parent, storage, self.path, message, author, date
+        )
+
+
+@dataclass
+class ProjectTreeBuilder:
+    """Adding a project to the repository, without writing it to disk.
 
-    @property
-    def path(self) -> Path:
-        """Return the project directory."""
-        return self._worktree.path
+    Project files are added to the storage, and written to the object database
+    directly. Files ignored by git are excluded from the commit, as they would
+    be if the project was written to disk.
+    """
+
+    _repository: ProjectRepository
+    _parent: str
+    storage: GitTreeStorage
 
     def commit(
         self,
@@ -44,19 +151,28 @@ class ProjectBuilder:
         date: Optional[datetime.datetime] = None,
     ) -> str:
         """Commit the project."""
-        signature = self._worktree.default_signature
-        if author is not None:
-            signature = pygit2.Signature(
-                author.name, author.email, signature.time, signature.offset
-            )
-        if date is not None:
-            signature = pygit2.Signature(
-                signature.name, signature.email, int(date.timestamp()), 0
+        repository = self._repository.project._repository
+
+        # Only ignore files need to be on disk to evaluate the ignore rules.
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+
+            for path, (oid, _) in self.storage.entries.items():
+                if path.rpartition("/")[2] == ".gitignore":
+                    ignorefile = root / path
+                    ignorefile.parent.mkdir(parents=True, exist_ok=True)
+                    ignorefile.write_bytes(repository[oid].data)
+
+            return _committree(
+                self._repository,
+                self._parent,
+                self.storage,
+                root,
+                message,
+                author,
+                date,
             )
 
-        self._worktree.commit(message=message, author=signature)
-        return str(self._worktree.head.commit.id)
-
 
 class ProjectRepository:
     """Project repository."""
@@ -91,20 +207,27 @@ class ProjectRepository:
 
     @contextmanager
     def build(self, *, parent: Optional[str] = None) -> Iterator[ProjectBuilder]:
-        """Create a commit with a generated project."""
+        """Create a commit with a generated project, in a temporary directory."""
         if parent is None:
             parent = self._createroot(updateref=None)
 
-        branch = self.project.heads.create(
-            UPDATE_BRANCH, self.project._repository[parent], force=True
-        )
+        with tempfile.TemporaryDirectory() as directory:
+            yield ProjectBuilder(self, parent, Path(directory))
 
-        try:
-            with self.project.worktree(branch, checkout=False) as worktree:
-                builder = ProjectBuilder(worktree)
-                yield builder
-        finally:
-            self.project.heads.pop(branch.name)
+    @contextmanager
+    def buildtree(
+        self, *, parent: Optional[str] = None
+    ) -> Iterator[ProjectTreeBuilder]:
+        """Create a commit with a generated project, without a worktree."""
+        if parent is None:
+            parent = self._createroot(updateref=None)
+
+        storage = GitTreeStorage(self.project._repository)
+        yield ProjectTreeBuilder(self, parent, storage)
+
+    def files(self, commit: str) -> FilesystemPath:
+        """Return the project files in the given commit."""
+        return FilesystemPath(filesystem=GitFilesystem(self.project.path, commit))
 
     def import_(self, commit: str, *, paths: Iterable[Path] = ()) -> None:
         """Import changes to the project made by the given commit."""
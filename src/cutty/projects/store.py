@@ -2,7 +2,9 @@
 import pathlib
 
 from cutty.filestorage.adapters.cookiecutter import createcookiecutterstorage
+from cutty.filestorage.adapters.disk import FileCounts
 from cutty.filestorage.adapters.disk import FileExistsPolicy
+from cutty.filestorage.domain.storage import FileStorage
 from cutty.filesystems.domain.purepath import PurePath
 from cutty.projects.project import Project
 
@@ -13,11 +15,20 @@ def storeproject(
     *,
     outputdirisproject: bool = True,
     fileexists: FileExistsPolicy = FileExistsPolicy.RAISE,
-) -> None:
-    """Store a project in the output directory."""
+    jobs: int = 1,
+    forkhooks: bool = False,
+) -> FileCounts:
+    """Store a project in the output directory, returning the file counts."""
+    counts = FileCounts()
     outputdir = projectdir if outputdirisproject else projectdir.parent
     storage = createcookiecutterstorage(
-        outputdir, projectdir, fileexists, project.hooks
+        outputdir,
+        projectdir,
+        fileexists,
+        project.hooks,
+        jobs=jobs,
+        counts=counts,
+        forkhooks=forkhooks,
     )
 
     with storage:
@@ -27,3 +38,13 @@ def storeproject(
                 projectfile = projectfile.withpath(path)
 
             storage.add(projectfile)
+
+    return counts
+
+
+def storeprojectfiles(project: Project, storage: FileStorage) -> None:
+    """Store the project files, without the project directory and hooks."""
+    with storage:
+        for projectfile in project.files:
+            path = PurePath(*projectfile.path.parts[1:])
+            storage.add(projectfile.withpath(path))
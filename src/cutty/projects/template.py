@@ -1,6 +1,7 @@
 """Loading templates."""
 from __future__ import annotations
 
+import hashlib
 import pathlib
 from collections.abc import Iterator
 from dataclasses import dataclass
@@ -82,5 +83,24 @@ class Template:
         name: str
         commit: Optional[Commit] = None
 
+        @property
+        def cachedir(self) -> Optional[pathlib.Path]:
+            """Return the cache directory for the template commit, if any.
+
+            Each directory of a commit is a separate template, with its own
+            cache directory.
+            """
+            if self.commit is None:
+                return None
+
+            name = self.commit.id
+
+            if self.directory is not None:
+                data = self.directory.as_posix().encode()
+                name += "-" + hashlib.blake2b(data, digest_size=16).hexdigest()
+
+            cachedir = pathlib.Path(platformdirs.user_cache_dir("cutty"))
+            return cachedir / "templates" / name
+
     metadata: Metadata
     root: Path
@@ -1,31 +1,151 @@
 """Rendering Cookiecutter templates."""
+import codecs
+import contextlib
 import fnmatch
+import functools
+import hashlib
+import os
+import pathlib
+import re
+import tempfile
+from collections.abc import Callable
+from collections.abc import Hashable
+from collections.abc import Iterable
+from collections.abc import Iterator
 from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any
+from typing import Optional
+from typing import Union
 
+import jinja2
 from binaryornot.helpers import is_binary_string
 
 from cutty.filestorage.domain.files import Executable
 from cutty.filestorage.domain.files import RegularFile
+from cutty.filestorage.domain.files import Stream
+from cutty.filesystems.domain.filesystem import FileType
 from cutty.filesystems.domain.path import Path
+from cutty.filesystems.domain.purepath import PurePath
 from cutty.rendering.adapters.cookiecutterextensions import DEFAULT_EXTENSIONS
-from cutty.rendering.adapters.jinja import createjinjarenderer
+from cutty.rendering.adapters.jinja import createjinjaenvironment
+from cutty.rendering.adapters.jinja import createjinjarenderers
+from cutty.rendering.adapters.jinja import findvariables
+from cutty.rendering.adapters.jinja import pooljinjaenvironment
+from cutty.rendering.adapters.jinja import templatemarkers
+from cutty.rendering.adapters.jinja import TextStream
 from cutty.rendering.domain.render import asrendercontinuation
+from cutty.rendering.domain.render import createpathrenderers
 from cutty.rendering.domain.render import createrenderer
 from cutty.rendering.domain.render import defaultrenderregistry
 from cutty.rendering.domain.render import Renderer
 from cutty.rendering.domain.render import RenderRegistry
+from cutty.rendering.domain.renderplan import createrenderplan
+from cutty.rendering.domain.renderplan import dumprenderplan
+from cutty.rendering.domain.renderplan import loadrenderplan
+from cutty.rendering.domain.renderplan import PlannedFile
+from cutty.rendering.domain.renderplan import RenderPlan
+from cutty.util.diskcache import DiskCache
 from cutty.variables.domain.bindings import Binding
 from cutty.variables.domain.variables import Variable
 
 
+# Files of at least this many characters are rendered incrementally while stored.
+STREAM_THRESHOLD = 1024 * 1024
+
+
+# Increment this when the format or the contents of render plans change.
+RENDER_PLAN_VERSION = 3
+
+
+# Increment this when the variables found for file contents change.
+VARIABLES_CACHE_VERSION = 2
+
+
+# Files with these suffixes are classified as binary without reading them.
+BINARY_SUFFIXES = frozenset(
+    f".{suffix}"
+    for suffix in """
+    7z bmp bz2 class dll eot exe gif gz ico jar jpeg jpg mo otf pdf png pyc
+    so tgz tif tiff ttf webp whl woff woff2 xz zip
+    """.split()
+)
+
+_TEXT_BYTES = b"\n\r\t\f\b" + bytes(range(32, 127))
+_UNICODE_BOMS = (codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE, codecs.BOM_UTF32_BE)
+
+
 def is_binary(blob: bytes) -> bool:
-    """Return True if the blob contains binary data."""
-    result: bool = is_binary_string(blob[:1024])
+    """Return True if the blob contains binary data.
+
+    Common cases are decided without the statistical checks of binaryornot:
+    Valid UTF-8 with few control characters is text, and NUL bytes outside of
+    UTF-16 or UTF-32 text indicate binary data.
+    """
+    blob = blob[:1024]
+
+    if not blob:
+        return False
+
+    if b"\0" in blob:
+        if not blob.startswith(_UNICODE_BOMS):
+            return True
+    elif 10 * len(blob.translate(None, _TEXT_BYTES)) <= 3 * len(blob):
+        with contextlib.suppress(UnicodeDecodeError):
+            codecs.getincrementaldecoder("utf-8")().decode(blob)
+            return False
+
+    result: bool = is_binary_string(blob)
     return result
 
 
+def createbinaryclassifier(
+    cachedir: Optional[pathlib.Path] = None,
+) -> Callable[[RegularFile], bool]:
+    """Return a function that returns True if a file contains binary data.
+
+    Files are classified by their suffix where possible, and otherwise by their
+    first kilobyte. Classifications are memoized by blob identifier, and
+    persisted in the cache directory if one is passed.
+    """
+    cache = DiskCache(cachedir / "binary" if cachedir is not None else None)
+
+    def isbinaryfile(file: RegularFile) -> bool:
+        _, dot, suffix = file.path.name.rpartition(".")
+        if dot and f".{suffix.lower()}" in BINARY_SUFFIXES:
+            return True
+
+        blobid = file.blobid
+        if blobid is not None and (value := cache.get(blobid)) is not None:
+            return value == "1"
+
+        with file.open() as io:
+            result = is_binary(io.read(1024))
+
+        if blobid is not None:
+            cache.set(blobid, str(int(result)))
+
+        return result
+
+    return isbinaryfile
+
+
+def encodestream(stream: TextStream) -> Callable[[], Iterator[bytes]]:
+    """Return a function producing the stream as encoded chunks."""
+    return lambda: (chunk.encode() for chunk in stream())
+
+
+def compilepatterns(patterns: Sequence[str]) -> Callable[[str], bool]:
+    """Compile glob patterns into a single matcher, as used by fnmatch."""
+    if not patterns:
+        return lambda name: False
+
+    regex = re.compile(
+        "|".join(fnmatch.translate(os.path.normcase(pattern)) for pattern in patterns)
+    )
+    return lambda name: regex.match(os.path.normcase(name)) is not None
+
+
 def asstringlist(settings: dict[str, Any], name: str) -> list[str]:
     """Return a setting as a list of strings."""
     value = settings.get(name, [])
@@ -55,6 +175,30 @@ def renderdict(
     }
 
 
+def digestextensions(
+    extensions: Sequence[Union[str, type[jinja2.ext.Extension]]], *extra: str
+) -> str:
+    """Return a digest identifying the Jinja extensions and extra strings."""
+    names = [
+        extension
+        if isinstance(extension, str)
+        else f"{extension.__module__}.{extension.__qualname__}"
+        for extension in extensions
+    ]
+    text = "\n".join([*names, *extra])
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+def createbytecodecache(
+    cachedir: pathlib.Path,
+    extensions: Sequence[Union[str, type[jinja2.ext.Extension]]],
+) -> jinja2.BytecodeCache:
+    """Create an on-disk bytecode cache for the given Jinja extensions."""
+    directory = cachedir / "jinja" / digestextensions(extensions)
+    directory.mkdir(parents=True, exist_ok=True)
+    return jinja2.FileSystemBytecodeCache(str(directory))
+
+
 @dataclass
 class CookiecutterConfig:
     """Configuration for a Cookiecutter template."""
@@ -63,13 +207,243 @@ class CookiecutterConfig:
     variables: tuple[Variable, ...]
 
 
+def getextensions(
+    config: CookiecutterConfig,
+) -> list[Union[str, type[jinja2.ext.Extension]]]:
+    """Return the Jinja extensions for the template."""
+    return [*DEFAULT_EXTENSIONS, *asstringlist(config.settings, "_extensions")]
+
+
+def getpoolkey(path: Path, cachedir: pathlib.Path) -> Hashable:
+    """Return the key for sharing Jinja environments of the template.
+
+    Templates are identified by their cache directory, which is specific to the
+    template commit and to the template directory within it, and by their path.
+    """
+    return (cachedir, path.parts)
+
+
+def getjinjaenvironment(
+    path: Path, config: CookiecutterConfig, *, cachedir: Optional[pathlib.Path] = None
+) -> jinja2.Environment:
+    """Return a Jinja environment for the template.
+
+    If a cache directory is passed, the environment is shared with renderers
+    for the same template commit.
+    """
+    extensions = getextensions(config)
+
+    if cachedir is None:
+        return createjinjaenvironment(searchpath=[path], extensions=extensions)
+
+    environment, _ = pooljinjaenvironment(
+        getpoolkey(path, cachedir),
+        searchpath=[path],
+        extensions=extensions,
+        bytecode_cache=createbytecodecache(cachedir, extensions),
+    )
+    return environment
+
+
+def createverbatimmatcher(config: CookiecutterConfig) -> Callable[[PurePath], bool]:
+    """Return a function that returns True if a file is copied without rendering."""
+    copyverbatim = compilepatterns(
+        asstringlist(config.settings, "_copy_without_render")
+    )
+
+    @functools.lru_cache(maxsize=None)
+    def isverbatimdir(path: PurePath) -> bool:
+        """Return True if files in the directory are copied without rendering."""
+        return bool(path.parts) and (
+            isverbatimdir(path.parent) or copyverbatim(str(path))
+        )
+
+    def isverbatim(path: PurePath) -> bool:
+        return copyverbatim(str(path)) or isverbatimdir(path.parent)
+
+    return isverbatim
+
+
+def _findcontentvariables(
+    path: Path, environment: jinja2.Environment, cache: DiskCache
+) -> Optional[frozenset[str]]:
+    """Return the variables used in the file contents, or None if unknown."""
+    blobid = path.blobid()
+    if blobid is not None and (value := cache.get(blobid)) is not None:
+        return frozenset(filter(None, value.split(","))) if value != "*" else None
+
+    try:
+        text = path.read_bytes().decode()
+    except UnicodeDecodeError:
+        # Only binary files can be rendered without being decoded.
+        names: Optional[frozenset[str]] = frozenset()
+    else:
+        names = findvariables(environment, text, context_prefix="cookiecutter")
+
+    if blobid is not None:
+        cache.set(blobid, ",".join(sorted(names)) if names is not None else "*")
+
+    return names
+
+
+def _unionvariables(
+    results: Iterable[Optional[frozenset[str]]],
+) -> Optional[frozenset[str]]:
+    """Combine variable sets, returning None if any of them is unknown."""
+    names: set[str] = set()
+
+    for result in results:
+        if result is None:
+            return None
+        names |= result
+
+    return frozenset(names)
+
+
+def createdependencyfinder(
+    path: Path, config: CookiecutterConfig, *, cachedir: Optional[pathlib.Path] = None
+) -> Callable[[Path], Optional[frozenset[str]]]:
+    """Return a function listing the variables a template file depends on.
+
+    These are the variables used in the path of the file and in its contents.
+    The contents of verbatim and binary files are not rendered, and not read.
+    The function returns None if the variables cannot be determined. Results
+    for file contents are memoized by blob identifier, and persisted in the
+    cache directory if one is passed.
+    """
+    environment = getjinjaenvironment(path, config, cachedir=cachedir)
+    isverbatim = createverbatimmatcher(config)
+    isbinaryfile = createbinaryclassifier(cachedir)
+    cache = DiskCache(
+        cachedir / f"variables-{VARIABLES_CACHE_VERSION}"
+        if cachedir is not None
+        else None
+    )
+
+    @functools.lru_cache(maxsize=None)
+    def findtextvariables(text: str) -> Optional[frozenset[str]]:
+        return findvariables(environment, text, context_prefix="cookiecutter")
+
+    def finddependencies(path: Path) -> Optional[frozenset[str]]:
+        pathnames = _unionvariables(map(findtextvariables, path.parts))
+        if pathnames is None or isverbatim(path):
+            return pathnames
+
+        if isbinaryfile(RegularFile(path, path)):
+            return pathnames
+
+        return _unionvariables(
+            [pathnames, _findcontentvariables(path, environment, cache)]
+        )
+
+    return finddependencies
+
+
+def createfileclassifier(
+    path: Path, config: CookiecutterConfig, *, cachedir: Optional[pathlib.Path] = None
+) -> Callable[[Path], PlannedFile]:
+    """Return a function that classifies template files for a render plan."""
+    markers = templatemarkers(getjinjaenvironment(path, config, cachedir=cachedir))
+    isverbatim = createverbatimmatcher(config)
+    isbinaryfile = createbinaryclassifier(cachedir)
+    finddependencies = createdependencyfinder(path, config, cachedir=cachedir)
+
+    def hasmarkers(text: str) -> bool:
+        return markers is None or any(marker in text for marker in markers)
+
+    def classify(file: Path) -> PlannedFile:
+        parts = file.parts[len(path.parts) :]
+        pathtemplate = any(map(hasmarkers, parts))
+
+        if file.is_dir():
+            return PlannedFile(
+                parts, True, None, False, False, pathtemplate, False, None
+            )
+
+        try:
+            status = file.stat()
+        except (FileNotFoundError, NotADirectoryError):
+            status = None
+
+        if status is None or status.type is not FileType.REGULAR:
+            return PlannedFile(
+                parts, False, None, False, False, pathtemplate, True, None
+            )
+
+        verbatim = isverbatim(file)
+        binary = not verbatim and isbinaryfile(RegularFile(file, file))
+
+        try:
+            bodytemplate = not (verbatim or binary) and hasmarkers(
+                file.read_bytes().decode()
+            )
+        except UnicodeDecodeError:
+            bodytemplate = True
+
+        return PlannedFile(
+            parts,
+            False,
+            status.mode,
+            binary,
+            verbatim,
+            pathtemplate,
+            bodytemplate,
+            finddependencies(file),
+        )
+
+    return classify
+
+
+def createcookiecutterrenderplan(
+    path: Path,
+    paths: Iterable[Path],
+    config: CookiecutterConfig,
+    *,
+    cachedir: pathlib.Path,
+) -> RenderPlan:
+    """Return the render plan for the template paths.
+
+    Plans are stored in the cache directory, which is specific to the template
+    commit, and only created if they are not found there.
+    """
+    paths = list(paths)
+    digest = digestextensions(
+        getextensions(config),
+        str(RENDER_PLAN_VERSION),
+        *["/".join(path.parts), *("/".join(each.parts) for each in paths)],
+    )
+    planfile = cachedir / "plans" / f"{digest}.json"
+
+    with contextlib.suppress(FileNotFoundError):
+        return loadrenderplan(planfile.read_text())
+
+    plan = createrenderplan(
+        paths, createfileclassifier(path, config, cachedir=cachedir)
+    )
+
+    planfile.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        "w", dir=planfile.parent, suffix=".tmp", delete=False
+    ) as io:
+        io.write(dumprenderplan(plan))
+
+    os.replace(io.name, planfile)
+    return plan
+
+
 def registerrenderers(
-    path: Path, config: CookiecutterConfig
+    path: Path, config: CookiecutterConfig, *, cachedir: Optional[pathlib.Path] = None
 ) -> RenderRegistry:  # noqa: C901
-    """Register render functions."""
-    copy_without_render = asstringlist(config.settings, "_copy_without_render")
-    extensions = DEFAULT_EXTENSIONS[:]
-    extensions.extend(asstringlist(config.settings, "_extensions"))
+    """Register render functions.
+
+    Rendered path prefixes are cached in memory. If a cache directory is
+    passed, compiled templates and binary file classifications are cached on
+    disk, and the Jinja environment is shared with other renderers for the
+    same template commit.
+    """
+    isverbatim = createverbatimmatcher(config)
+    extensions = getextensions(config)
+    isbinaryfile = createbinaryclassifier(cachedir)
 
     def renderregularfile(
         file: RegularFile, bindings: Sequence[Binding], render: Renderer
@@ -78,24 +452,37 @@ def registerrenderers(
         cls = Executable if isinstance(file, Executable) else RegularFile
         path = render(file.path, bindings)
 
-        ancestors = [file.path, *file.path.parents[:-1]]
-        for ancestor in reversed(ancestors):
-            for pattern in copy_without_render:
-                if fnmatch.fnmatch(str(ancestor), pattern):
-                    return cls(path, file.blob)
+        if isverbatim(file.path):
+            return file.withpath(path)
+
+        if isbinaryfile(file):
+            return file.withpath(path)
+
+        text = file.read_bytes().decode()
+
+        if len(text) >= STREAM_THRESHOLD:
+            stream = streamtext(text, bindings)
+            if stream is None:
+                return file.withpath(path)
+
+            return cls(path, Stream(encodestream(stream)))
+
+        rendered = render(text, bindings)
 
-        if is_binary(file.blob):
-            return cls(path, file.blob)
+        if rendered == text:
+            return file.withpath(path)
 
-        text = file.blob.decode()
-        text = render(text, bindings)
-        return cls(path, text.encode())
+        return cls(path, rendered.encode())
 
-    rendertext = createjinjarenderer(
+    rendertext, streamtext = createjinjarenderers(
         searchpath=[path],
         context_prefix="cookiecutter",
         extra_context=config.settings,
         extensions=extensions,
+        bytecode_cache=(
+            createbytecodecache(cachedir, extensions) if cachedir is not None else None
+        ),
+        poolkey=getpoolkey(path, cachedir) if cachedir is not None else None,
     )
 
     return {
@@ -103,10 +490,13 @@ def registerrenderers(
         list: renderlist,
         dict: renderdict,
         RegularFile: renderregularfile,
+        **createpathrenderers(),
     }
 
 
-def createcookiecutterrenderer(path: Path, config: CookiecutterConfig) -> Renderer:
+def createcookiecutterrenderer(
+    path: Path, config: CookiecutterConfig, *, cachedir: Optional[pathlib.Path] = None
+) -> Renderer:
     """Create Cookiecutter renderer."""
-    renderregistry = registerrenderers(path, config)
+    renderregistry = registerrenderers(path, config, cachedir=cachedir)
     return createrenderer({**defaultrenderregistry, **renderregistry})
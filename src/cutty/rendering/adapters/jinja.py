@@ -2,14 +2,23 @@
 from __future__ import annotations
 
 import contextlib
+import functools
+import hashlib
+import operator
+import threading
+from collections import OrderedDict
 from collections.abc import Callable
+from collections.abc import Hashable
 from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any
 from typing import Optional
 from typing import Union
 
 import jinja2
+import jinja2.meta
 
 from cutty.filesystems.domain.path import Path
 from cutty.rendering.domain.render import GenericRenderer
@@ -17,6 +26,20 @@ from cutty.util.reraise import reraise
 from cutty.variables.domain.bindings import Binding
 
 
+# Maximum number of compiled templates kept in memory by each renderer.
+TEMPLATE_CACHE_SIZE = 1024
+
+# Maximum length of templates kept in memory. Longer texts, such as file
+# contents, are rendered once per build and compiled on each call.
+TEMPLATE_CACHE_MAX_LENGTH = 256
+
+# Maximum number of Jinja environments kept for reuse across renderers.
+ENVIRONMENT_POOL_SIZE = 16
+
+TextStream = Callable[[], Iterator[str]]
+StreamRenderer = Callable[[str, Sequence[Binding]], Optional[TextStream]]
+
+
 @dataclass
 class TemplateExtensionNotFoundError(Exception):
     """The template extension was not found."""
@@ -114,37 +137,343 @@ class _FilesystemLoader(jinja2.BaseLoader):
         raise jinja2.TemplateNotFound(template)
 
 
-def createjinjarenderer(
+def createcontextbuilder(
+    context_prefix: Optional[str], extra_context: Optional[dict[str, Any]]
+) -> Callable[[Sequence[Binding]], dict[str, Any]]:
+    """Return a function that builds the template context for bindings.
+
+    The context is rebuilt only when the bindings change, and extended rather
+    than rebuilt when bindings are appended.
+    """
+
+    def createcontext(values: dict[str, Any]) -> dict[str, Any]:
+        namespace = values | extra_context if extra_context is not None else values
+        return {context_prefix: namespace} if context_prefix is not None else namespace
+
+    def extend(values: dict[str, Any], bindings: Iterable[Binding]) -> dict[str, Any]:
+        values = values.copy()
+        for binding in bindings:
+            values[binding.name] = binding.value
+        return values
+
+    cache: tuple[tuple[Binding, ...], dict[str, Any], dict[str, Any]] = (
+        (),
+        {},
+        createcontext({}),
+    )
+
+    def buildcontext(bindings: Sequence[Binding]) -> dict[str, Any]:
+        nonlocal cache
+        cachedbindings, values, context = cache
+        size = len(cachedbindings)
+
+        if len(bindings) == size and all(map(operator.is_, bindings, cachedbindings)):
+            return context
+
+        if len(bindings) > size and all(map(operator.is_, bindings, cachedbindings)):
+            values = extend(values, bindings[size:])
+        else:
+            values = extend({}, bindings)
+
+        context = createcontext(values)
+        cache = (tuple(bindings), values, context)
+        return context
+
+    return buildcontext
+
+
+def templatemarkers(environment: jinja2.Environment) -> Optional[tuple[str, ...]]:
+    """Return the strings whose absence makes a text render to itself.
+
+    Returns None if extensions preprocess the template source, because any
+    text could then contain template syntax.
+    """
+    if any(
+        type(extension).preprocess is not jinja2.ext.Extension.preprocess
+        for extension in environment.iter_extensions()
+    ):
+        return None
+
+    markers = [
+        environment.block_start_string,
+        environment.variable_start_string,
+        environment.comment_start_string,
+        environment.line_statement_prefix,
+        environment.line_comment_prefix,
+        # Jinja normalizes line endings in template data.
+        "\r",
+        "\n" if environment.newline_sequence != "\n" else None,
+    ]
+
+    return tuple(marker for marker in markers if marker)
+
+
+def createjinjaenvironment(
     *,
     searchpath: Iterable[Path],
-    context_prefix: Optional[str] = None,
-    extra_context: Optional[dict[str, Any]] = None,
     extensions: Iterable[Union[str, type[jinja2.ext.Extension]]] = (),
-) -> GenericRenderer[str]:
-    """Create a renderer using Jinja."""
+    bytecode_cache: Optional[jinja2.BytecodeCache] = None,
+) -> jinja2.Environment:
+    """Create a Jinja environment for rendering templates."""
     extensions = [
         load_extension(extension) if isinstance(extension, str) else extension
         for extension in extensions
     ]
 
-    environment = jinja2.Environment(  # noqa: S701
+    return jinja2.Environment(  # noqa: S701
         loader=_FilesystemLoader(searchpath=searchpath),
         extensions=extensions,
         keep_trailing_newline=True,
         undefined=jinja2.StrictUndefined,
+        bytecode_cache=bytecode_cache,
     )
 
-    def rendertext(text: str, bindings: Iterable[Binding]) -> str:
-        """Render the text using Jinja."""
-        template = environment.from_string(text)
-        context = {binding.name: binding.value for binding in bindings}
 
-        if extra_context is not None:
-            context.update(extra_context)
+def compiletemplate(environment: jinja2.Environment, text: str) -> jinja2.Template:
+    """Compile the text, using the bytecode cache of the environment if any."""
+    bytecode_cache = environment.bytecode_cache
+    if bytecode_cache is None:
+        return environment.from_string(text)
+
+    name = hashlib.blake2b(text.encode(errors="surrogatepass")).hexdigest()
+    bucket = bytecode_cache.get_bucket(environment, name, None, text)
+
+    if bucket.code is None:
+        bucket.code = environment.compile(text)
+        bytecode_cache.set_bucket(bucket)
+
+    return environment.template_class.from_code(
+        environment, bucket.code, environment.make_globals(None), None
+    )
+
+
+def createtemplategetter(
+    environment: jinja2.Environment,
+) -> Callable[[str], jinja2.Template]:
+    """Return a function that compiles templates, caching short ones by source."""
+
+    @functools.lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+    def getcachedtemplate(text: str) -> jinja2.Template:
+        return compiletemplate(environment, text)
+
+    def gettemplate(text: str) -> jinja2.Template:
+        """Return the compiled template for the text."""
+        if len(text) > TEMPLATE_CACHE_MAX_LENGTH:
+            return compiletemplate(environment, text)
+
+        return getcachedtemplate(text)
+
+    return gettemplate
 
-        if context_prefix is not None:
-            context = {context_prefix: context}
 
-        return template.render(context)
+_PooledEnvironment = tuple[jinja2.Environment, Callable[[str], jinja2.Template]]
+_environmentpool: OrderedDict[Hashable, _PooledEnvironment] = OrderedDict()
+_environmentpoollock = threading.Lock()
 
+
+def pooljinjaenvironment(
+    key: Hashable,
+    *,
+    searchpath: Iterable[Path],
+    extensions: Iterable[Union[str, type[jinja2.ext.Extension]]] = (),
+    bytecode_cache: Optional[jinja2.BytecodeCache] = None,
+) -> _PooledEnvironment:
+    """Return a Jinja environment and template getter from the process pool.
+
+    Environments are pooled by the key and the extensions, so their extensions
+    are loaded, and their templates compiled, only once. The key must identify
+    the contents of the search path, such as a template commit: The search path
+    of a pooled environment is replaced by the one passed here. The bytecode
+    cache is only used when the environment is created.
+    """
+    poolkey = (key, tuple(extensions))
+
+    with _environmentpoollock:
+        if (entry := _environmentpool.get(poolkey)) is not None:
+            _environmentpool.move_to_end(poolkey)
+            environment, _ = entry
+            assert isinstance(environment.loader, _FilesystemLoader)  # noqa: S101
+            environment.loader.searchpath = tuple(searchpath)
+            return entry
+
+        environment = createjinjaenvironment(
+            searchpath=searchpath,
+            extensions=poolkey[1],
+            bytecode_cache=bytecode_cache,
+        )
+        entry = environment, createtemplategetter(environment)
+        _environmentpool[poolkey] = entry
+
+        if len(_environmentpool) > ENVIRONMENT_POOL_SIZE:
+            _environmentpool.popitem(last=False)
+
+        return entry
+
+
+def findvariables(
+    environment: jinja2.Environment,
+    text: str,
+    *,
+    context_prefix: Optional[str] = None,
+) -> Optional[frozenset[str]]:
+    """Return the names of the variables that the template text depends on.
+
+    With a context prefix, these are the attributes looked up on the prefix.
+    Returns None if the dependencies cannot be determined, for example when
+    the template includes other templates, or uses the prefix in other ways.
+    """
+    markers = templatemarkers(environment)
+    if markers is not None and not any(marker in text for marker in markers):
+        return frozenset()
+
+    try:
+        ast = environment.parse(text)
+    except jinja2.TemplateSyntaxError:
+        return None
+
+    if any(True for _ in jinja2.meta.find_referenced_templates(ast)):
+        return None
+
+    undeclared = jinja2.meta.find_undeclared_variables(ast)
+
+    if context_prefix is None:
+        return frozenset(undeclared)
+
+    if context_prefix not in undeclared:
+        return frozenset()
+
+    names: set[str] = set()
+    return frozenset(names) if _findprefixnames(ast, context_prefix, names) else None
+
+
+# Attributes of the context mapping itself, such as ``items`` or ``get``.
+_MAPPING_ATTRIBUTES = frozenset(dir(dict))
+
+
+def _isprefixlookup(node: jinja2.nodes.Node, prefix: str) -> bool:
+    """Return True if the node looks up an attribute or item on the prefix."""
+    return (
+        isinstance(node, (jinja2.nodes.Getattr, jinja2.nodes.Getitem))
+        and isinstance(node.node, jinja2.nodes.Name)
+        and node.node.name == prefix
+    )
+
+
+def _getprefixname(node: jinja2.nodes.Node) -> Optional[str]:
+    """Return the variable looked up on the prefix, or None if unknown."""
+    if isinstance(node, jinja2.nodes.Getattr):
+        return node.attr if node.attr not in _MAPPING_ATTRIBUTES else None
+
+    if isinstance(node, jinja2.nodes.Getitem) and (
+        isinstance(node.arg, jinja2.nodes.Const) and isinstance(node.arg.value, str)
+    ):
+        return node.arg.value
+
+    return None
+
+
+def _findprefixnames(node: jinja2.nodes.Node, prefix: str, names: set[str]) -> bool:
+    """Collect the variables looked up on the prefix below the node.
+
+    Returns False if the prefix is used in any other way, such as calling a
+    method of the context mapping.
+    """
+    for child in node.iter_child_nodes():
+        if _isprefixlookup(child, prefix):
+            if isinstance(node, jinja2.nodes.Call) and node.node is child:
+                return False
+
+            if (name := _getprefixname(child)) is None:
+                return False
+
+            names.add(name)
+
+        elif (
+            isinstance(child, jinja2.nodes.Name) and child.name == prefix
+        ) or not _findprefixnames(child, prefix, names):
+            return False
+
+    return True
+
+
+def createjinjarenderer(
+    *,
+    searchpath: Iterable[Path],
+    context_prefix: Optional[str] = None,
+    extra_context: Optional[dict[str, Any]] = None,
+    extensions: Iterable[Union[str, type[jinja2.ext.Extension]]] = (),
+    bytecode_cache: Optional[jinja2.BytecodeCache] = None,
+    poolkey: Optional[Hashable] = None,
+) -> GenericRenderer[str]:
+    """Create a renderer using Jinja."""
+    rendertext, _ = createjinjarenderers(
+        searchpath=searchpath,
+        context_prefix=context_prefix,
+        extra_context=extra_context,
+        extensions=extensions,
+        bytecode_cache=bytecode_cache,
+        poolkey=poolkey,
+    )
     return rendertext
+
+
+def createjinjarenderers(
+    *,
+    searchpath: Iterable[Path],
+    context_prefix: Optional[str] = None,
+    extra_context: Optional[dict[str, Any]] = None,
+    extensions: Iterable[Union[str, type[jinja2.ext.Extension]]] = (),
+    bytecode_cache: Optional[jinja2.BytecodeCache] = None,
+    poolkey: Optional[Hashable] = None,
+) -> tuple[GenericRenderer[str], StreamRenderer]:
+    """Create a renderer and a stream renderer sharing a Jinja environment.
+
+    The stream renderer compiles the template immediately, and returns a
+    function that renders it incrementally each time it is called. It returns
+    None if the text has no template syntax and renders to itself. Templates
+    rendered as streams bypass the in-memory template cache.
+
+    Text without template syntax is returned unchanged, without invoking
+    Jinja. The template context is reused across calls with the same bindings.
+    Compiled templates are kept in an LRU cache keyed by their source, unless
+    they are long, such as file contents.
+    If a bytecode cache is passed, templates are also looked up there before
+    they are compiled, so that compilation is skipped across runs.
+
+    If a pool key is passed, the Jinja environment and its compiled templates
+    are shared with other renderers using the same key and extensions.
+    """
+    if poolkey is not None:
+        environment, gettemplate = pooljinjaenvironment(
+            poolkey,
+            searchpath=searchpath,
+            extensions=extensions,
+            bytecode_cache=bytecode_cache,
+        )
+    else:
+        environment = createjinjaenvironment(
+            searchpath=searchpath, extensions=extensions, bytecode_cache=bytecode_cache
+        )
+        gettemplate = createtemplategetter(environment)
+
+    markers = templatemarkers(environment)
+    buildcontext = createcontextbuilder(context_prefix, extra_context)
+
+    def rendertext(text: str, bindings: Sequence[Binding]) -> str:
+        """Render the text using Jinja."""
+        if markers is not None and not any(marker in text for marker in markers):
+            return text
+
+        template = gettemplate(text)
+        return template.render(buildcontext(bindings))
+
+    def streamtext(text: str, bindings: Sequence[Binding]) -> Optional[TextStream]:
+        """Render the text incrementally using Jinja."""
+        if markers is not None and not any(marker in text for marker in markers):
+            return None
+
+        template = compiletemplate(environment, text)
+        context = buildcontext(bindings)
+        return lambda: template.generate(context)
+
+    return rendertext, streamtext
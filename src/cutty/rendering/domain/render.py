@@ -104,6 +104,69 @@ def renderpath(
     )
 
 
+_BindingsKey = tuple[int, ...]
+_PrefixCache = dict[tuple[str, ...], tuple[str, ...]]
+_PrefixCaches = dict[_BindingsKey, tuple[tuple[Binding, ...], _PrefixCache]]
+
+
+def _getprefixcache(caches: _PrefixCaches, bindings: Sequence[Binding]) -> _PrefixCache:
+    """Return the cache of rendered prefixes for the bindings."""
+    # Bindings are immutable, so their identities form a valid key as long as
+    # the bindings are kept alive alongside the cache.
+    key = tuple(map(id, bindings))
+    try:
+        return caches[key][1]
+    except KeyError:
+        cache: _PrefixCache = {}
+        caches[key] = (tuple(bindings), cache)
+        return cache
+
+
+def _renderprefix(
+    parts: tuple[str, ...],
+    bindings: Sequence[Binding],
+    render: Renderer,
+    cache: _PrefixCache,
+) -> tuple[str, ...]:
+    """Render the path parts, reusing and caching rendered prefixes."""
+    if not parts:
+        return parts
+
+    try:
+        return cache[parts]
+    except KeyError:
+        prefix = _renderprefix(parts[:-1], bindings, render, cache)
+        result = (*prefix, render(parts[-1], bindings))
+        cache[parts] = result
+        return result
+
+
+def createpathrenderers() -> RenderRegistry:
+    """Create path renderers that render each path prefix only once.
+
+    Rendered prefixes are cached for each sequence of bindings, so a file at
+    depth d does not render its ancestors' names again.
+    """
+    caches: _PrefixCaches = {}
+
+    def renderparts(
+        parts: tuple[str, ...], bindings: Sequence[Binding], render: Renderer
+    ) -> tuple[str, ...]:
+        return _renderprefix(parts, bindings, render, _getprefixcache(caches, bindings))
+
+    def renderpurepath(
+        path: PurePath, bindings: Sequence[Binding], render: Renderer
+    ) -> PurePath:
+        return PurePath(*renderparts(path.parts, bindings, render))
+
+    def renderpath(path: Path, bindings: Sequence[Binding], render: Renderer) -> Path:
+        return Path(
+            *renderparts(path.parts, bindings, render), filesystem=path.filesystem
+        )
+
+    return {PurePath: renderpurepath, Path: renderpath}
+
+
 def renderregularfile(
     file: RegularFile,
     bindings: Sequence[Binding],
@@ -112,7 +175,7 @@ def renderregularfile(
     """Render a file by rendering its path and contents."""
     cls = Executable if isinstance(file, Executable) else RegularFile
     path = render(file.path, bindings)
-    text = file.blob.decode()
+    text = file.read_bytes().decode()
     text = render(text, bindings)
     return cls(path, text.encode())
 
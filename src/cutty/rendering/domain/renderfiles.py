@@ -1,21 +1,37 @@
 """Rendering files."""
+from collections.abc import Callable
 from collections.abc import Iterable
 from collections.abc import Iterator
 from collections.abc import Sequence
+from typing import Optional
 
 from cutty.filestorage.domain.files import File
 from cutty.filestorage.domain.files import loadfile
 from cutty.filesystems.domain.path import Path
 from cutty.rendering.domain.render import Renderer
+from cutty.util.concurrent import mapordered
 from cutty.variables.domain.bindings import Binding
 
 
 def renderfiles(
-    paths: Iterable[Path], render: Renderer, bindings: Sequence[Binding]
+    paths: Iterable[Path],
+    render: Renderer,
+    bindings: Sequence[Binding],
+    *,
+    jobs: int = 1,
+    reuse: Optional[Callable[[Path], Optional[File]]] = None,
 ) -> Iterator[File]:
-    """Render the files."""
+    """Render the files.
 
-    def _renderfiles(paths: Iterable[Path]) -> Iterator[File]:
+    If more than one job is requested, files are loaded and rendered in a
+    thread pool, while the caller consumes them. Files are always returned in
+    the same order.
+
+    The ``reuse`` callback may return a previously rendered file for a template
+    path, which is then used instead of rendering the template file.
+    """
+
+    def _findfiles(paths: Iterable[Path]) -> Iterator[Path]:
         for path in paths:
             name = render(path, bindings).name
             if not name:
@@ -27,8 +43,18 @@ def renderfiles(
                 )
 
             if path.is_dir():
-                yield from _renderfiles(path.iterdir())
+                yield from _findfiles(path.iterdir())
             else:
-                yield render(loadfile(path), bindings)
+                yield path
+
+    def _renderfile(path: Path) -> File:
+        if reuse is not None and (file := reuse(path)) is not None:
+            return file
+
+        rendered: File = render(loadfile(path), bindings)
+        return rendered
+
+    if jobs > 1:
+        return mapordered(_renderfile, _findfiles(paths), jobs=jobs)
 
-    return _renderfiles(paths)
+    return map(_renderfile, _findfiles(paths))
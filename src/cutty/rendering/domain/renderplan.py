@@ -0,0 +1,177 @@
+"""Render plans."""
+import functools
+import json
+import stat
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+from typing import Optional
+
+from cutty.filestorage.domain.files import Executable
+from cutty.filestorage.domain.files import File
+from cutty.filestorage.domain.files import loadfile
+from cutty.filestorage.domain.files import RegularFile
+from cutty.filesystems.domain.path import Path
+from cutty.rendering.domain.render import Renderer
+from cutty.util.concurrent import mapordered
+from cutty.variables.domain.bindings import Binding
+
+
+@dataclass(frozen=True)
+class PlannedFile:
+    """A file or directory in a template, classified for rendering.
+
+    The parts locate the file relative to the template root. The mode is None
+    for directories, and for files that need to be loaded to be rendered, such
+    as broken symlinks. Binary and verbatim files are copied without rendering
+    their contents, and so are files whose body has no template syntax. The
+    variables are those used in the path and body of the file, or None if they
+    cannot be determined.
+    """
+
+    parts: tuple[str, ...]
+    directory: bool
+    mode: Optional[int]
+    binary: bool
+    verbatim: bool
+    pathtemplate: bool
+    bodytemplate: bool
+    variables: Optional[frozenset[str]]
+
+
+RenderPlan = tuple[PlannedFile, ...]
+
+
+def createrenderplan(
+    paths: Iterable[Path], classify: Callable[[Path], PlannedFile]
+) -> RenderPlan:
+    """Walk the paths and classify every file and directory, in walk order."""
+
+    def _walk(paths: Iterable[Path]) -> Iterator[PlannedFile]:
+        for path in paths:
+            planned = classify(path)
+            yield planned
+
+            if planned.directory:
+                yield from _walk(path.iterdir())
+
+    return tuple(_walk(paths))
+
+
+def dumprenderplan(plan: RenderPlan) -> str:
+    """Serialize the render plan as JSON."""
+    return json.dumps(
+        [
+            {
+                "parts": planned.parts,
+                "directory": planned.directory,
+                "mode": planned.mode,
+                "binary": planned.binary,
+                "verbatim": planned.verbatim,
+                "pathtemplate": planned.pathtemplate,
+                "bodytemplate": planned.bodytemplate,
+                "variables": (
+                    sorted(planned.variables) if planned.variables is not None else None
+                ),
+            }
+            for planned in plan
+        ]
+    )
+
+
+def loadrenderplan(text: str) -> RenderPlan:
+    """Deserialize a render plan from JSON."""
+
+    def _load(data: dict[str, Any]) -> PlannedFile:
+        variables = data["variables"]
+        return PlannedFile(
+            tuple(data["parts"]),
+            data["directory"],
+            data["mode"],
+            data["binary"],
+            data["verbatim"],
+            data["pathtemplate"],
+            data["bodytemplate"],
+            frozenset(variables) if variables is not None else None,
+        )
+
+    data = json.loads(text)
+    assert isinstance(data, list)  # noqa: S101
+    return tuple(map(_load, data))
+
+
+def _findplannedfiles(
+    plan: RenderPlan, root: Path, render: Renderer, bindings: Sequence[Binding]
+) -> Iterator[tuple[Path, PlannedFile]]:
+    """Yield the files in the plan, skipping those with empty rendered names."""
+    for planned in plan:
+        path = root.joinpath(*planned.parts)
+
+        if planned.pathtemplate:
+            names = render(path, bindings).parts[len(root.parts) :]
+
+            if not all(names):
+                continue
+
+            name = names[-1]
+            if "/" in name or "\\" in name or name in (".", ".."):
+                raise RuntimeError(
+                    f"invalid component {name!r} from {path.name!r} in {path}"
+                )
+
+        if not planned.directory:
+            yield path, planned
+
+
+def _renderplannedfile(
+    item: tuple[Path, PlannedFile],
+    render: Renderer,
+    bindings: Sequence[Binding],
+    reuse: Optional[Callable[[Path], Optional[File]]],
+) -> File:
+    """Render a file from the plan, unless it can be reused."""
+    path, planned = item
+
+    if reuse is not None and (file := reuse(path)) is not None:
+        return file
+
+    if planned.mode is None:
+        file = loadfile(path)
+    else:
+        cls = Executable if planned.mode & stat.S_IXUSR else RegularFile
+        file = cls(path, path)
+
+    if planned.bodytemplate or not isinstance(file, RegularFile):
+        rendered: File = render(file, bindings)
+        return rendered
+
+    return file.withpath(render(path, bindings) if planned.pathtemplate else path)
+
+
+def renderplan(
+    plan: RenderPlan,
+    root: Path,
+    render: Renderer,
+    bindings: Sequence[Binding],
+    *,
+    jobs: int = 1,
+    reuse: Optional[Callable[[Path], Optional[File]]] = None,
+) -> Iterator[File]:
+    """Render the files in the plan.
+
+    This is equivalent to ``renderfiles`` on the paths the plan was created
+    from, but the template is not walked, and file contents without template
+    syntax are neither read nor rendered.
+    """
+    files = _findplannedfiles(plan, root, render, bindings)
+    renderfile = functools.partial(
+        _renderplannedfile, render=render, bindings=bindings, reuse=reuse
+    )
+
+    if jobs > 1:
+        return mapordered(renderfile, files, jobs=jobs)
+
+    return map(renderfile, files)
@@ -3,6 +3,7 @@ import pathlib
 from collections.abc import Sequence
 from typing import Optional
 
+from cutty.filestorage.adapters.disk import FileCounts
 from cutty.filestorage.adapters.disk import FileExistsPolicy
 from cutty.projects.build import createproject
 from cutty.projects.config import ProjectConfig
@@ -19,8 +20,10 @@ def create(
     checkout: Optional[str],
     directory: Optional[pathlib.Path],
     fileexists: FileExistsPolicy,
-) -> None:
-    """Generate projects from Cookiecutter templates."""
+    jobs: int = 1,
+    forkhooks: bool = False,
+) -> FileCounts:
+    """Generate projects from Cookiecutter templates, returning file counts."""
     config = ProjectConfig(location, (), checkout, directory)
 
     with createproject(
@@ -28,10 +31,13 @@ def create(
         userbindings=extrabindings,
         interactive=interactive,
         createconfigfile=False,
+        jobs=jobs,
     ) as project:
-        storeproject(
+        return storeproject(
             project,
             outputdir / project.name,
             outputdirisproject=False,
             fileexists=fileexists,
+            jobs=jobs,
+            forkhooks=forkhooks,
         )
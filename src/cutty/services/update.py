@@ -3,6 +3,7 @@ from collections.abc import Sequence
 from pathlib import Path
 from typing import Optional
 
+from cutty.projects.build import buildbaseproject
 from cutty.projects.build import buildproject
 from cutty.projects.config import ProjectConfig
 from cutty.projects.config import readprojectconfigfile
@@ -31,21 +32,21 @@ def update(
 
     repository = ProjectRepository(projectdir)
 
-    parent = buildproject(
+    with buildbaseproject(
         repository,
         config1,
         interactive=interactive,
         commitmessage=updatecommitmessage,
-    )
-
-    commit = buildproject(
-        repository,
-        config2,
-        userbindings=extrabindings,
-        interactive=interactive,
-        commitmessage=updatecommitmessage,
-        parent=parent,
-    )
+    ) as (parent, base):
+        commit = buildproject(
+            repository,
+            config2,
+            userbindings=extrabindings,
+            interactive=interactive,
+            commitmessage=updatecommitmessage,
+            parent=parent,
+            base=base,
+        )
 
     if commit != parent:
         repository.import_(commit)
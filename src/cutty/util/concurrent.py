@@ -0,0 +1,31 @@
+"""Utilities for concurrent execution."""
+import collections
+import concurrent.futures
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from typing import TypeVar
+
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+
+def mapordered(
+    function: Callable[[T], U], items: Iterable[T], *, jobs: int
+) -> Iterator[U]:
+    """Apply the function to the items using a thread pool.
+
+    Results are yielded in the order of the items. At most a few items per
+    thread are processed ahead of the consumer, and items are consumed lazily.
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures: collections.deque[concurrent.futures.Future[U]] = collections.deque()
+
+        for item in items:
+            futures.append(executor.submit(function, item))
+            if len(futures) > 2 * jobs:
+                yield futures.popleft().result()
+
+        while futures:
+            yield futures.popleft().result()
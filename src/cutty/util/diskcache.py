@@ -0,0 +1,37 @@
+"""Persistent string mappings."""
+import pathlib
+import threading
+from typing import Optional
+
+
+class DiskCache:
+    """Mapping of strings, appended to a file as entries are added.
+
+    Keys must not contain whitespace, and values must not contain newlines.
+    Without a path, entries are only kept in memory.
+    """
+
+    def __init__(self, path: Optional[pathlib.Path]) -> None:
+        """Initialize."""
+        self.path = path
+        self.entries: dict[str, str] = {}
+        self.lock = threading.Lock()
+
+        if path is not None and path.exists():
+            for line in path.read_text().splitlines():
+                key, _, value = line.partition(" ")
+                self.entries[key] = value
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the value for the key, if any."""
+        return self.entries.get(key)
+
+    def set(self, key: str, value: str) -> None:
+        """Store the value for the key."""
+        with self.lock:
+            self.entries[key] = value
+
+            if self.path is not None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with self.path.open("a") as io:
+                    io.write(f"{key} {value}\n")
@@ -5,6 +5,7 @@ import contextlib
 import hashlib
 import os
 import tempfile
+from collections.abc import Iterable
 from collections.abc import Iterator
 from collections.abc import MutableMapping
 from dataclasses import dataclass
@@ -268,7 +269,67 @@ class Repository:
         self._repository.checkout_tree(self._repository[oid])
 
     def cherrypick(self, commit: pygit2.Commit) -> None:
-        """Cherry-pick the commit onto the current branch."""
+        """Cherry-pick the commit onto the current branch.
+
+        The result is computed in memory, and only the paths it changes are
+        checked out, updating their index entries. If there are conflicts, the
+        cherry-pick is performed in the working tree, to record the conflicts
+        for resolution.
+        """
+        repository = self._repository
+
+        if len(commit.parents) != 1 or repository.head_is_unborn:
+            self._cherrypickworktree(commit)
+            return
+
+        [parent] = commit.parents
+        head = repository.head.peel(pygit2.Commit)
+        merged = repository.merge_trees(parent.tree, head.tree, commit.tree)
+
+        if merged.conflicts:
+            self._cherrypickworktree(commit)
+            return
+
+        tree = repository[merged.write_tree(repository)]
+        diff = head.tree.diff_to_tree(tree)
+        paths = {
+            file.path
+            for delta in diff.deltas
+            for file in (delta.old_file, delta.new_file)
+        }
+
+        repository.index.read()
+
+        if paths:
+            self._checkuncommitted(paths)
+            repository.checkout_tree(tree, paths=sorted(paths))
+
+        self.commit(
+            message=commit.message,
+            author=commit.author,
+            committer=self.default_signature,
+            stageallfiles=False,
+        )
+
+    def _checkuncommitted(self, paths: Iterable[str]) -> None:
+        """Raise an exception if any of the paths has uncommitted changes."""
+        count = 0
+
+        for path in paths:
+            with contextlib.suppress(KeyError):
+                status = self._repository.status_file(path)
+                if status not in (pygit2.GIT_STATUS_CURRENT, pygit2.GIT_STATUS_IGNORED):
+                    count += 1
+
+        if count:
+            # Use the same message as libgit2 for the worktree cherry-pick.
+            plural = "s" if count != 1 else ""
+            raise pygit2.GitError(
+                f"{count} uncommitted change{plural} would be overwritten by merge"
+            )
+
+    def _cherrypickworktree(self, commit: pygit2.Commit) -> None:
+        """Cherry-pick the commit onto the current branch, in the worktree."""
         self._repository.index.read()
         self._repository.cherrypick(commit.id)
 
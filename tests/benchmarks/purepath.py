@@ -0,0 +1,35 @@
+"""Microbenchmark for path operations.
+
+Run with ``python -m tests.benchmarks.purepath`` to print the time per
+operation in nanoseconds.
+"""
+import timeit
+
+from cutty.filesystems.adapters.dict import DictFilesystem
+from cutty.filesystems.domain.path import Path
+
+
+STATEMENTS = [
+    "path / 'x'",
+    "path.parent",
+    "list(path.parents)",
+    "path.parents[:-1]",
+    "hash(path)",
+    "str(path)",
+    "{path: 1}[path]",
+]
+
+
+def main(number: int = 100_000) -> None:
+    """Print the time per operation on a six-component path."""
+    path = Path("a", "b", "c", "d", "e", "f", filesystem=DictFilesystem({}))
+
+    for statement in STATEMENTS:
+        seconds = min(
+            timeit.repeat(statement, globals={"path": path}, number=number, repeat=5)
+        )
+        print(f"{statement:20} {seconds / number * 1e9:6.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,6 @@
 """Functional tests for the cookiecutter CLI."""
+import os
+import shutil
 from pathlib import Path
 
 import pytest
@@ -105,6 +107,53 @@ def test_directory(runcutty: RunCutty, template: Path, tmp_path: Path) -> None:
     assert template_files(template / "a") == project_files("example") - {EXTRA}
 
 
+def test_directory_cache(runcutty: RunCutty, template: Path, tmp_path: Path) -> None:
+    """It does not share cached render plans between template directories."""
+    move_repository_files_to_subdirectory(template, "a")
+    shutil.copytree(template / "a", template / "b")
+    (template / "a" / "{{ cookiecutter.project }}" / "only_a.txt").touch()
+    Repository.open(template).commit(message="Add directory b")
+
+    for directory in ["a", "b"]:
+        outputdir = tmp_path / directory
+        runcutty(
+            "cookiecutter",
+            "--no-input",
+            f"--directory={directory}",
+            f"--output-dir={outputdir}",
+            str(template),
+        )
+
+    assert (tmp_path / "a" / "example" / "only_a.txt").is_file()
+    assert not (tmp_path / "b" / "example" / "only_a.txt").exists()
+
+
+def test_directory_include(runcutty: RunCutty, template: Path, tmp_path: Path) -> None:
+    """It resolves includes in the template directory."""
+    move_repository_files_to_subdirectory(template, "a")
+    shutil.copytree(template / "a", template / "b")
+
+    for directory in ["a", "b"]:
+        (template / directory / "partial.txt").write_text(directory)
+        (template / directory / "{{ cookiecutter.project }}" / "README.md").write_text(
+            '{% include "partial.txt" %}'
+        )
+
+    Repository.open(template).commit(message="Add directory b")
+
+    for directory in ["a", "b"]:
+        outputdir = tmp_path / directory
+        runcutty(
+            "cookiecutter",
+            "--no-input",
+            f"--directory={directory}",
+            f"--output-dir={outputdir}",
+            str(template),
+        )
+
+        assert (outputdir / "example" / "README.md").read_text() == directory
+
+
 def test_overwrite(runcutty: RunCutty, template: Path) -> None:
     """It overwrites existing files."""
     readme = Path("example", "README.md")
@@ -116,6 +165,17 @@ def test_overwrite(runcutty: RunCutty, template: Path) -> None:
     assert readme.read_text() == "# example\n"
 
 
+def test_overwrite_unchanged(runcutty: RunCutty, template: Path) -> None:
+    """It reports files left unchanged."""
+    runcutty("cookiecutter", "--no-input", str(template))
+
+    output = runcutty(
+        "cookiecutter", "--no-input", "--overwrite-if-exists", str(template)
+    )
+
+    assert "0 files written" in output
+
+
 def test_skip(runcutty: RunCutty, template: Path) -> None:
     """It skips existing files."""
     readme = Path("example", "README.md")
@@ -133,6 +193,21 @@ def test_skip(runcutty: RunCutty, template: Path) -> None:
     assert readme.read_text() == ""
 
 
+def test_jobs(runcutty: RunCutty, template: Path) -> None:
+    """It generates the project using multiple threads."""
+    runcutty("cookiecutter", "--no-input", "--jobs=4", str(template))
+
+    assert template_files(template) == project_files("example") - {EXTRA}
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_fork_hooks(runcutty: RunCutty, template: Path) -> None:
+    """It runs Python hooks in a forked process."""
+    runcutty("cookiecutter", "--no-input", "--fork-hooks", str(template))
+
+    assert Path("example", EXTRA).is_file()
+
+
 def test_empty_template(emptytemplate: Path, runcutty: RunCutty) -> None:
     """It exits with a non-zero status code."""
     with pytest.raises(RunCuttyError):
@@ -43,6 +43,27 @@ def test_hook(runcutty: RunCutty, template: Path) -> None:
     assert Path("example", "post_gen_project").is_file()
 
 
+def test_hook_git(runcutty: RunCutty, template: Path) -> None:
+    """It runs hooks outside of the project repository."""
+    updatefile(
+        template / "hooks" / "post_gen_project.py",
+        """
+        import subprocess
+
+        subprocess.run(["git", "init", "--quiet"], check=True)
+        subprocess.run(["git", "add", "."], check=True)
+        open("post_gen_project", mode="w")
+        """,
+    )
+
+    runcutty("create", "--non-interactive", str(template))
+
+    repository = Repository.open(Path("example"))
+    tree = repository.head.commit.tree
+    assert "post_gen_project" in tree and ".git" not in tree
+    assert Path("example", "post_gen_project").is_file()
+
+
 def test_files(runcutty: RunCutty, template: Path) -> None:
     """It renders the project files."""
     runcutty("create", "--non-interactive", str(template))
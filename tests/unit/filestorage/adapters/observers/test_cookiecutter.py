@@ -1,5 +1,7 @@
 """Unit tests for cutty.filestorage.adapters.observers.cookiecutter."""
+import os
 import pathlib
+import subprocess  # noqa: S404
 from collections.abc import Iterable
 from collections.abc import Sequence
 from typing import Protocol
@@ -135,3 +137,45 @@ def test_rollback_overwrite(
     path = tmp_path / "example" / "pre_gen_project"
     assert path.is_file()
     assert not any(tmp_path.joinpath(*file.path.parts).is_file() for file in files)
+
+
+def createforkstorage(tmp_path: pathlib.Path, hook: str, source: str) -> FileStorage:
+    """Create a storage that runs a Python hook in a forked child process."""
+    storage = DiskFileStorage(tmp_path)
+    hookfile = RegularFile(PurePath("hooks", f"{hook}.py"), source.encode())
+    observer = CookiecutterHooksObserver(
+        hookfiles=[hookfile],
+        project=tmp_path / "example",
+        fileexists=FileExistsPolicy.RAISE,
+        forkhooks=True,
+    )
+    return observe(storage, observer)
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_forkhooks(tmp_path: pathlib.Path, files: Iterable[File]) -> None:
+    """It runs Python hooks in the project directory."""
+    source = "import os, sys; open('hook', 'w').write(os.getcwd()); sys.exit(0)"
+    storage = createforkstorage(tmp_path, "post_gen_project", source)
+
+    with storage:
+        for file in files:
+            storage.add(file)
+
+    path = tmp_path / "example" / "hook"
+    assert path.read_text() == str(tmp_path / "example")
+    assert pathlib.Path.cwd() != tmp_path / "example"
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+@pytest.mark.parametrize(
+    "source",
+    ["raise SystemExit(3)", "raise RuntimeError()", "import sys; sys.exit('')"],
+)
+def test_forkhooks_failure(tmp_path: pathlib.Path, source: str) -> None:
+    """It raises an exception if the hook fails."""
+    storage = createforkstorage(tmp_path, "pre_gen_project", source)
+
+    with pytest.raises(subprocess.CalledProcessError):
+        with storage:
+            pass
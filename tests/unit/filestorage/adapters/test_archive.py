@@ -0,0 +1,124 @@
+"""Unit tests for cutty.filestorage.adapters.archive."""
+import pathlib
+import stat
+import tarfile
+import zipfile
+from typing import Union
+
+import pytest
+
+from cutty.filestorage.adapters.archive import TarFileStorage
+from cutty.filestorage.adapters.archive import ZipFileStorage
+from cutty.filestorage.adapters.archive import ZstandardNotFoundError
+from cutty.filestorage.domain.files import Executable
+from cutty.filestorage.domain.files import File
+from cutty.filestorage.domain.files import RegularFile
+from cutty.filestorage.domain.files import Stream
+from cutty.filestorage.domain.files import SymbolicLink
+from cutty.filesystems.adapters.dict import DictFilesystem
+from cutty.filesystems.domain.path import Path
+from cutty.filesystems.domain.purepath import PurePath
+
+
+def createfiles() -> list[File]:
+    """Return files of every supported kind."""
+    root = Path(filesystem=DictFilesystem({"file": "from a path"}))
+    return [
+        RegularFile(PurePath("project", "README"), b"# example\n"),
+        Executable(PurePath("project", "bin", "run"), b"#!/bin/sh\n"),
+        SymbolicLink(PurePath("project", "link"), PurePath("README")),
+        RegularFile(PurePath("project", "path"), root / "file"),
+        RegularFile(PurePath("project", "stream"), Stream(lambda: [b"a", b"b"])),
+    ]
+
+
+def test_zip(tmp_path: pathlib.Path) -> None:
+    """It writes the files to a zip archive."""
+    path = tmp_path / "project.zip"
+
+    with ZipFileStorage(path, mtime=0) as storage:
+        for file in createfiles():
+            storage.add(file)
+
+    with zipfile.ZipFile(path) as archive:
+        modes = {info.filename: info.external_attr >> 16 for info in archive.infolist()}
+        assert archive.read("project/path") == b"from a path"
+        assert archive.read("project/stream") == b"ab"
+        assert archive.read("project/link") == b"README"
+
+    assert modes["project/README"] == stat.S_IFREG | 0o644
+    assert modes["project/bin/run"] == stat.S_IFREG | 0o755
+    assert modes["project/link"] == stat.S_IFLNK | 0o777
+
+
+@pytest.mark.parametrize("compression", ["", "gz", "bz2", "xz"])
+def test_tar(tmp_path: pathlib.Path, compression: str) -> None:
+    """It writes the files to a tar archive."""
+    path = tmp_path / "project.tar"
+
+    with TarFileStorage(path, mtime=0, compression=compression) as storage:
+        for file in createfiles():
+            storage.add(file)
+
+    with tarfile.open(path) as archive:
+        readme = archive.getmember("project/README")
+        executable = archive.getmember("project/bin/run")
+        link = archive.getmember("project/link")
+
+        assert readme.mode == 0o644
+        assert executable.mode == 0o755
+        assert link.issym() and link.linkname == "README"
+
+        for name, blob in [("project/path", b"from a path"), ("project/stream", b"ab")]:
+            member = archive.extractfile(name)
+            assert member is not None and member.read() == blob
+
+
+def test_tar_unknown_compression(tmp_path: pathlib.Path) -> None:
+    """It raises an exception for unknown compression schemes."""
+    with pytest.raises(ValueError):
+        TarFileStorage(tmp_path / "project.tar", compression="lz4")
+
+
+def test_tar_zstandard(tmp_path: pathlib.Path) -> None:
+    """It raises an exception or compresses with zstandard."""
+    directory = tmp_path / "archives"
+    directory.mkdir()
+    path = directory / "project.tar.zst"
+
+    try:
+        with TarFileStorage(path, compression="zst") as storage:
+            storage.add(RegularFile(PurePath("file"), b"teapot"))
+    except ZstandardNotFoundError:
+        assert not any(directory.iterdir())
+    else:
+        assert path.read_bytes().startswith(b"\x28\xb5\x2f\xfd")
+
+
+def test_file_exists(tmp_path: pathlib.Path) -> None:
+    """It raises an exception if the file was already added."""
+    file = RegularFile(PurePath("file"), b"")
+
+    with pytest.raises(FileExistsError):
+        with ZipFileStorage(tmp_path / "project.zip") as storage:
+            storage.add(file)
+            storage.add(file)
+
+
+@pytest.mark.parametrize("storagetype", [ZipFileStorage, TarFileStorage])
+def test_rollback(
+    tmp_path: pathlib.Path, storagetype: type[Union[ZipFileStorage, TarFileStorage]]
+) -> None:
+    """It leaves an existing archive untouched and removes the temporary file."""
+    directory = tmp_path / "archives"
+    directory.mkdir()
+    path = directory / "project"
+    path.write_bytes(b"teapot")
+
+    with pytest.raises(RuntimeError):
+        with storagetype(path) as storage:
+            storage.add(RegularFile(PurePath("file"), b""))
+            raise RuntimeError()
+
+    assert path.read_bytes() == b"teapot"
+    assert list(directory.iterdir()) == [path]
@@ -3,15 +3,20 @@ import contextlib
 import os
 import pathlib
 import platform
+from collections.abc import Iterator
 
 import pytest
 
 from cutty.filestorage.adapters.disk import DiskFileStorage
+from cutty.filestorage.adapters.disk import FileCounts
 from cutty.filestorage.adapters.disk import FileExistsPolicy
 from cutty.filestorage.domain.files import Executable
 from cutty.filestorage.domain.files import File
 from cutty.filestorage.domain.files import RegularFile
+from cutty.filestorage.domain.files import Stream
 from cutty.filestorage.domain.files import SymbolicLink
+from cutty.filesystems.adapters.disk import DiskFilesystem
+from cutty.filesystems.domain.path import Path
 from cutty.filesystems.domain.purepath import PurePath
 
 
@@ -54,7 +59,7 @@ def test_regular_file(storage: DiskFileStorage, file: RegularFile) -> None:
         storage.add(file)
 
     path = storage.resolve(file.path)
-    assert path.read_bytes() == file.blob
+    assert path.read_bytes() == file.read_bytes()
 
 
 def test_multiple_files(storage: DiskFileStorage, file: File, executable: File) -> None:
@@ -141,7 +146,7 @@ def test_file_exists_overwrite(tmp_path: pathlib.Path, file: RegularFile) -> Non
     with storage:
         storage.add(file)
 
-    assert path.read_bytes() == file.blob
+    assert path.read_bytes() == file.read_bytes()
 
 
 def test_file_exists_overwrite_directory(
@@ -181,7 +186,7 @@ def test_executable_blob(storage: DiskFileStorage, executable: Executable) -> No
         storage.add(executable)
 
     path = storage.resolve(executable.path)
-    assert path.read_bytes() == executable.blob
+    assert path.read_bytes() == executable.read_bytes()
 
 
 @pytest.mark.skipif(
@@ -244,3 +249,293 @@ def test_unknown_filetype(storage: DiskFileStorage) -> None:
     path = storage.resolve(file.path)
     assert not path.exists()
     assert not path.parent.exists()
+
+
+def test_regular_file_stream(tmp_path: pathlib.Path) -> None:
+    """It copies the file contents from its source."""
+    source = tmp_path / "source"
+    source.write_bytes(b"# example\n")
+    filesystem = DiskFilesystem(tmp_path)
+    file = RegularFile(PurePath("README.md"), Path("source", filesystem=filesystem))
+    storage = DiskFileStorage(tmp_path / "storage")
+
+    with storage:
+        storage.add(file)
+
+    path = storage.resolve(file.path)
+    assert path.read_bytes() == source.read_bytes()
+
+
+def test_regular_file_stream_overwrite(tmp_path: pathlib.Path) -> None:
+    """It copies the file contents over an existing file."""
+    source = tmp_path / "source"
+    source.write_bytes(b"# example\n")
+    filesystem = DiskFilesystem(tmp_path)
+    file = RegularFile(PurePath("README.md"), Path("source", filesystem=filesystem))
+    storage = DiskFileStorage(
+        tmp_path / "storage", fileexists=FileExistsPolicy.OVERWRITE
+    )
+
+    path = storage.resolve(file.path)
+    path.parent.mkdir(parents=True)
+    path.write_bytes(b"# old example with more text\n")
+
+    with storage:
+        storage.add(file)
+
+    assert path.read_bytes() == source.read_bytes()
+
+
+def test_regular_file_chunks(tmp_path: pathlib.Path) -> None:
+    """It writes streamed contents chunk by chunk."""
+    chunks = [b"# example\n", b"\n", b"Lorem ipsum dolor\n"]
+    file = RegularFile(PurePath("README.md"), Stream(lambda: iter(chunks)))
+    storage = DiskFileStorage(tmp_path / "storage")
+
+    with storage:
+        storage.add(file)
+
+    path = storage.resolve(file.path)
+    assert path.read_bytes() == b"".join(chunks)
+
+
+def test_directories_checked_once(
+    storage: DiskFileStorage, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """It does not check directories again for every file."""
+    paths = [PurePath("a", "b", f"file{n}") for n in range(10)]
+    calls = []
+    is_dir = pathlib.Path.is_dir
+
+    def _is_dir(self: pathlib.Path) -> bool:
+        calls.append(self)
+        return is_dir(self)
+
+    monkeypatch.setattr(pathlib.Path, "is_dir", _is_dir)
+
+    with storage:
+        for path in paths:
+            storage.add(RegularFile(path, b""))
+
+    assert len(calls) == len(set(calls))
+
+
+def test_directories_transaction(tmp_path: pathlib.Path, file: RegularFile) -> None:
+    """It checks directories again in a new transaction."""
+    storage = DiskFileStorage(tmp_path)
+
+    with storage:
+        storage.add(file)
+
+    storage.resolve(file.path).unlink()
+    storage.resolve(file.path).parent.rmdir()
+
+    with storage:
+        storage.add(file)
+
+    assert storage.resolve(file.path).is_file()
+
+
+def test_staging(tmp_path: pathlib.Path, file: RegularFile) -> None:
+    """It moves the staged directory into place on commit."""
+    storage = DiskFileStorage(tmp_path / "storage", staging=True)
+    path = storage.resolve(file.path)
+
+    with storage:
+        storage.add(file)
+        assert not path.exists()
+
+    assert path.read_bytes() == file.read_bytes()
+    assert [entry.name for entry in storage.root.iterdir()] == ["example"]
+
+
+def test_staging_undo(tmp_path: pathlib.Path, file: RegularFile) -> None:
+    """It removes the staged directory when rolling back after an error."""
+    storage = DiskFileStorage(tmp_path / "storage", staging=True)
+
+    with contextlib.suppress(FakeError):
+        with storage:
+            storage.add(file)
+            raise FakeError()
+
+    assert not storage.root.exists()
+    assert storage.undo == [storage.root.rmdir]
+
+
+def test_staging_existing_directory(tmp_path: pathlib.Path, file: RegularFile) -> None:
+    """It stores files in place if their top-level directory exists."""
+    storage = DiskFileStorage(tmp_path / "storage", staging=True)
+    path = storage.resolve(file.path)
+    path.parent.mkdir(parents=True)
+
+    with storage:
+        storage.add(file)
+        assert path.read_bytes() == file.read_bytes()
+
+    assert [entry.name for entry in storage.root.iterdir()] == ["example"]
+
+
+def test_staging_conflict(tmp_path: pathlib.Path, file: RegularFile) -> None:
+    """It rolls back if the directory was created by someone else meanwhile."""
+    storage = DiskFileStorage(tmp_path / "storage", staging=True)
+    path = storage.resolve(file.path)
+
+    with pytest.raises(OSError):
+        with storage:
+            storage.add(file)
+            path.parent.mkdir()
+            (path.parent / "other").touch()
+
+    assert [entry.name for entry in storage.root.iterdir()] == ["example"]
+    assert not path.exists()
+
+
+@pytest.mark.skipif(
+    platform.system() == "Windows",
+    reason="Path.chmod ignores executable bits on Windows.",
+)
+def test_executable_mode_overwrite(tmp_path: pathlib.Path, executable: File) -> None:
+    """It makes an existing file executable."""
+    storage = DiskFileStorage(tmp_path, fileexists=FileExistsPolicy.OVERWRITE)
+    path = storage.resolve(executable.path)
+    path.parent.mkdir()
+    path.touch(mode=0o644)
+
+    with storage:
+        storage.add(executable)
+
+    assert os.access(path, os.X_OK)
+
+
+def test_jobs(tmp_path: pathlib.Path) -> None:
+    """It writes files in a pool of worker threads."""
+    files = [
+        RegularFile(PurePath("example", f"file{n}"), str(n).encode())
+        for n in range(100)
+    ]
+    storage = DiskFileStorage(tmp_path, jobs=4)
+
+    with storage:
+        for file in files:
+            storage.add(file)
+
+    assert all(
+        storage.resolve(file.path).read_bytes() == file.read_bytes() for file in files
+    )
+
+
+def test_jobs_file_exists(tmp_path: pathlib.Path, file: RegularFile) -> None:
+    """It applies the policy to files added in the same transaction."""
+    storage = DiskFileStorage(tmp_path, jobs=4)
+
+    with pytest.raises(FileExistsError):
+        with storage:
+            storage.add(file)
+            storage.add(file)
+
+    assert not storage.resolve(file.path).exists()
+
+
+def test_jobs_undo(tmp_path: pathlib.Path) -> None:
+    """It removes written files when a write fails."""
+
+    def fail() -> Iterator[bytes]:
+        raise FakeError()
+
+    files = [
+        RegularFile(PurePath("example", f"file{n}"), str(n).encode()) for n in range(10)
+    ]
+    storage = DiskFileStorage(tmp_path / "storage", jobs=4)
+
+    with pytest.raises(FakeError):
+        with storage:
+            for file in files:
+                storage.add(file)
+
+            storage.add(RegularFile(PurePath("example", "fail"), Stream(fail)))
+
+    assert not storage.root.exists()
+
+
+def test_overwrite_unchanged(tmp_path: pathlib.Path, file: RegularFile) -> None:
+    """It does not rewrite files with the same contents."""
+    storage = DiskFileStorage(tmp_path, fileexists=FileExistsPolicy.OVERWRITE)
+    path = storage.resolve(file.path)
+    path.parent.mkdir()
+    path.write_bytes(file.read_bytes())
+    os.utime(path, (0, 0))
+
+    with storage:
+        storage.add(file)
+
+    assert path.stat().st_mtime == 0
+    assert storage.counts == FileCounts(unchanged=1)
+
+
+def test_overwrite_same_size(tmp_path: pathlib.Path, file: RegularFile) -> None:
+    """It rewrites files with different contents of the same size."""
+    storage = DiskFileStorage(tmp_path, fileexists=FileExistsPolicy.OVERWRITE)
+    path = storage.resolve(file.path)
+    path.parent.mkdir()
+    path.write_bytes(file.read_bytes().upper())
+
+    with storage:
+        storage.add(file)
+
+    assert path.read_bytes() == file.read_bytes()
+    assert storage.counts == FileCounts(written=1)
+
+
+@pytest.mark.skipif(
+    platform.system() == "Windows",
+    reason="Path.chmod ignores executable bits on Windows.",
+)
+def test_overwrite_unchanged_mode(
+    tmp_path: pathlib.Path, executable: Executable
+) -> None:
+    """It rewrites executables if the file on disk is not executable."""
+    storage = DiskFileStorage(tmp_path, fileexists=FileExistsPolicy.OVERWRITE)
+    path = storage.resolve(executable.path)
+    path.parent.mkdir()
+    path.write_bytes(executable.read_bytes())
+
+    with storage:
+        storage.add(executable)
+
+    assert os.access(path, os.X_OK)
+    assert storage.counts == FileCounts(written=1)
+
+
+@pytest.mark.skipif(
+    platform.system() == "Windows",
+    reason="Path.chmod ignores executable bits on Windows.",
+)
+def test_overwrite_unchanged_usermode(
+    tmp_path: pathlib.Path, executable: Executable
+) -> None:
+    """It treats files executable by their owner as executables."""
+    storage = DiskFileStorage(tmp_path, fileexists=FileExistsPolicy.OVERWRITE)
+    path = storage.resolve(executable.path)
+    path.parent.mkdir()
+    path.write_bytes(executable.read_bytes())
+    path.chmod(0o700)
+    os.utime(path, (0, 0))
+
+    with storage:
+        storage.add(executable)
+
+    assert path.stat().st_mtime == 0
+    assert storage.counts == FileCounts(unchanged=1)
+
+
+def test_counts_skipped(tmp_path: pathlib.Path, file: RegularFile) -> None:
+    """It counts skipped files."""
+    storage = DiskFileStorage(tmp_path, fileexists=FileExistsPolicy.SKIP)
+    storage.resolve(file.path).parent.mkdir()
+    storage.resolve(file.path).touch()
+
+    with storage:
+        storage.add(file)
+        storage.add(RegularFile(PurePath("example", "other"), b""))
+
+    assert storage.counts == FileCounts(written=1, skipped=1)
@@ -0,0 +1,106 @@
+"""Unit tests for cutty.filestorage.adapters.git."""
+from pathlib import Path
+
+import pygit2
+import pytest
+
+from cutty.filestorage.adapters.git import GitTreeStorage
+from cutty.filestorage.domain.files import Executable
+from cutty.filestorage.domain.files import RegularFile
+from cutty.filestorage.domain.files import SymbolicLink
+from cutty.filesystems.adapters.git import GitFilesystem
+from cutty.filesystems.domain.path import Path as FilesystemPath
+from cutty.filesystems.domain.purepath import PurePath
+from cutty.util.git import Repository
+
+
+@pytest.fixture
+def repository(tmp_path: Path) -> pygit2.Repository:
+    """Fixture for a repository."""
+    return pygit2.init_repository(tmp_path / "repository")
+
+
+@pytest.fixture
+def storage(repository: pygit2.Repository) -> GitTreeStorage:
+    """Fixture for a storage."""
+    return GitTreeStorage(repository)
+
+
+def test_regular_file(repository: pygit2.Repository, storage: GitTreeStorage) -> None:
+    """It stores regular files as blobs."""
+    with storage:
+        storage.add(RegularFile(PurePath("dir", "file"), b"teapot"))
+
+    assert storage.tree is not None
+    entry = repository[storage.tree] / "dir" / "file"
+    assert entry.filemode == pygit2.GIT_FILEMODE_BLOB
+    assert entry.data == b"teapot"
+
+
+def test_executable(repository: pygit2.Repository, storage: GitTreeStorage) -> None:
+    """It stores executables with the executable file mode."""
+    with storage:
+        storage.add(Executable(PurePath("script"), b"#!/bin/sh"))
+
+    assert storage.tree is not None
+    entry = repository[storage.tree] / "script"
+    assert entry.filemode == pygit2.GIT_FILEMODE_BLOB_EXECUTABLE
+
+
+def test_symlink(repository: pygit2.Repository, storage: GitTreeStorage) -> None:
+    """It stores symbolic links as blobs with their target."""
+    with storage:
+        storage.add(SymbolicLink(PurePath("link"), PurePath("dir", "file")))
+
+    assert storage.tree is not None
+    entry = repository[storage.tree] / "link"
+    assert entry.filemode == pygit2.GIT_FILEMODE_LINK
+    assert entry.data == b"dir/file"
+
+
+def test_file_exists(storage: GitTreeStorage) -> None:
+    """It raises an exception if the file was already added."""
+    with pytest.raises(FileExistsError):
+        with storage:
+            storage.add(RegularFile(PurePath("file"), b""))
+            storage.add(RegularFile(PurePath("file"), b""))
+
+    assert storage.tree is None
+
+
+def test_rollback(storage: GitTreeStorage) -> None:
+    """It discards the added files on failure."""
+    with pytest.raises(Exception, match="boom"):
+        with storage:
+            storage.add(RegularFile(PurePath("file"), b""))
+            raise Exception("boom")
+
+    assert not storage.entries
+
+
+def test_writetree_exclude(
+    repository: pygit2.Repository, storage: GitTreeStorage
+) -> None:
+    """It omits excluded paths from the tree."""
+    storage.add(RegularFile(PurePath("dir", "a"), b""))
+    storage.add(RegularFile(PurePath("dir", "b"), b""))
+
+    tree = repository[storage.writetree(exclude={"dir/b"})]
+
+    assert [entry.name for entry in tree / "dir"] == ["a"]
+
+
+def test_reuse_blob(tmp_path: Path, storage: GitTreeStorage) -> None:
+    """It reuses blobs of files read from the same repository."""
+    repository = Repository.open(tmp_path / "repository")
+    (repository.path / "file").write_bytes(b"teapot")
+    repository.commit()
+
+    root = FilesystemPath(filesystem=GitFilesystem(repository.path))
+    file = RegularFile(PurePath("file"), root / "file")
+
+    with storage:
+        storage.add(file)
+
+    [(oid, _)] = storage.entries.values()
+    assert oid == repository.head.commit.tree["file"].id
@@ -1,9 +1,12 @@
 """Unit tests for cutty.filestorage.domain.files."""
+from typing import Union
+
 import pytest
 
 from cutty.filestorage.domain.files import Executable
 from cutty.filestorage.domain.files import loadfile
 from cutty.filestorage.domain.files import RegularFile
+from cutty.filestorage.domain.files import Stream
 from cutty.filestorage.domain.files import SymbolicLink
 from cutty.filesystems.adapters.dict import DictFilesystem
 from cutty.filesystems.domain.filesystem import Filesystem
@@ -24,7 +27,7 @@ def test_load_regularfile(filesystem: Filesystem) -> None:
     file = loadfile(path)
     assert isinstance(file, RegularFile)
     assert file.path == path
-    assert file.blob == path.read_bytes()
+    assert file.read_bytes() == path.read_bytes()
 
 
 def test_load_symlink_follow(filesystem: Filesystem) -> None:
@@ -33,7 +36,7 @@ def test_load_symlink_follow(filesystem: Filesystem) -> None:
     file = loadfile(path)
     assert isinstance(file, RegularFile)
     assert file.path == path
-    assert file.blob == path.read_bytes()
+    assert file.read_bytes() == path.read_bytes()
 
 
 def test_load_symlink_nofollow(filesystem: Filesystem) -> None:
@@ -89,3 +92,77 @@ def test_withpath_symlink(filesystem: Filesystem) -> None:
     assert isinstance(link2, SymbolicLink)
     assert link2.path == path2
     assert link2.target == link1.target
+
+
+def test_load_regularfile_lazy(filesystem: Filesystem) -> None:
+    """It reads the file contents when needed."""
+    path = Path("file", filesystem=filesystem)
+    file = loadfile(path)
+    assert isinstance(file, RegularFile)
+    assert file.blob == path
+    with file.open() as io:
+        assert io.read() == path.read_bytes()
+
+
+def test_open_regularfile() -> None:
+    """It opens the file contents held in memory."""
+    file = RegularFile(PurePath("file"), b"Lorem ipsum dolor")
+    with file.open() as io:
+        assert io.read() == file.read_bytes()
+
+
+def test_blobid_inmemory() -> None:
+    """It does not provide identifiers for contents held in memory."""
+    file = RegularFile(PurePath("file"), b"Lorem ipsum dolor")
+    assert file.blobid is None
+
+
+@pytest.mark.parametrize(
+    "name,message",
+    [
+        ("dir", "directory"),
+        ("broken", "broken symlink"),
+        ("missing", "no such file"),
+    ],
+)
+def test_load_error(name: str, message: str) -> None:
+    """It reports why the path cannot be loaded."""
+    filesystem = DictFilesystem({"dir": {}, "broken": PurePath("missing")})
+    path = Path(name, filesystem=filesystem)
+    with pytest.raises(RuntimeError, match=message):
+        loadfile(path)
+
+
+def test_stream_blob() -> None:
+    """It joins the chunks of streamed contents."""
+    file = RegularFile(PurePath("file"), Stream(lambda: iter([b"Lorem ", b"ipsum"])))
+    assert file.read_bytes() == b"Lorem ipsum"
+
+
+def test_stream_open() -> None:
+    """It reads streamed contents."""
+    file = RegularFile(PurePath("file"), Stream(lambda: iter([b"Lorem ", b"ipsum"])))
+
+    with file.open() as io:
+        assert io.read(3) == b"Lor"
+        assert io.read() == b"em ipsum"
+
+
+@pytest.mark.parametrize(
+    "contents",
+    [
+        b"Lorem ipsum dolor",
+        Path("file", filesystem=DictFilesystem({"file": "Lorem ipsum dolor"})),
+        Stream(lambda: iter([b"Lorem ipsum", b"", b" dolor"])),
+    ],
+)
+def test_chunks(contents: Union[bytes, Path, Stream]) -> None:
+    """It iterates over the file contents in chunks."""
+    file = RegularFile(PurePath("file"), contents)
+    assert b"".join(file.chunks()) == b"Lorem ipsum dolor"
+
+
+def test_chunks_empty() -> None:
+    """It yields no chunks for empty files."""
+    file = RegularFile(PurePath("file"), b"")
+    assert not list(file.chunks())
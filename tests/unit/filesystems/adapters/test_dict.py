@@ -5,7 +5,9 @@ import pytest
 
 from cutty.filesystems.adapters.dict import DictFilesystem
 from cutty.filesystems.domain.filesystem import Access
+from cutty.filesystems.domain.filesystem import FileStatus
 from cutty.filesystems.domain.filesystem import Filesystem
+from cutty.filesystems.domain.filesystem import FileType
 from cutty.filesystems.domain.path import Path
 from cutty.filesystems.domain.purepath import PurePath
 
@@ -294,6 +296,24 @@ def test_read_bytes(root: Path) -> None:
     assert path.read_bytes() == b"# .profile\n"
 
 
+def test_open(root: Path) -> None:
+    """It returns a stream with the file contents."""
+    path = root / "root" / ".profile"
+    with path.open() as io:
+        assert io.read() == b"# .profile\n"
+
+
+def test_blobid(root: Path) -> None:
+    """It does not provide identifiers for file contents."""
+    assert (root / "root" / ".profile").blobid() is None
+
+
+def test_open_is_a_directory(root: Path) -> None:
+    """It raises an exception."""
+    with pytest.raises(IsADirectoryError):
+        (root / "root").open()
+
+
 def test_read_text(root: Path) -> None:
     """It returns the file contents."""
     path = root / "root" / ".profile"
@@ -347,3 +367,32 @@ def test_access(root: Path) -> None:
     """It returns False if the path cannot be accessed as specified."""
     path = root / "etc" / "passwd"
     assert not path.access(Access.EXECUTE)
+
+
+def test_stat_file(root: Path) -> None:
+    """It returns the type and size of a regular file."""
+    status = (root / "root" / ".profile").stat()
+    assert status == FileStatus(FileType.REGULAR, 0o644, len("# .profile\n"))
+
+
+def test_stat_directory(root: Path) -> None:
+    """It returns the type of a directory."""
+    assert (root / "etc").stat().type is FileType.DIRECTORY
+
+
+def test_stat_follow_symlinks(root: Path) -> None:
+    """It returns the status of the link target."""
+    assert (root / "home" / "root").stat().type is FileType.DIRECTORY
+
+
+def test_stat_symlink(root: Path) -> None:
+    """It returns the type and target of a symbolic link."""
+    status = (root / "home" / "root").stat(follow_symlinks=False)
+    assert status.type is FileType.SYMLINK
+    assert status.target == PurePath("..", "root")
+
+
+def test_stat_notfound(root: Path) -> None:
+    """It raises an exception if the file does not exist."""
+    with pytest.raises(FileNotFoundError):
+        (root / "etc" / "shadow").stat()
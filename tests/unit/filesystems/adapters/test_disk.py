@@ -1,11 +1,16 @@
 """Unit tests for cutty.filesystems.adapters.disk."""
+import os
 import pathlib
+import platform
+import stat
 
 import pytest
 
 from cutty.filesystems.adapters.disk import DiskFilesystem
 from cutty.filesystems.domain.filesystem import Filesystem
+from cutty.filesystems.domain.filesystem import FileType
 from cutty.filesystems.domain.path import Path
+from cutty.filesystems.domain.purepath import PurePath
 
 
 @pytest.fixture
@@ -56,6 +61,14 @@ def test_read_bytes(root: Path, filesystem: DiskFilesystem) -> None:
     assert (root / "filename").read_bytes() == data
 
 
+def test_open(root: Path, filesystem: DiskFilesystem) -> None:
+    """It returns a stream with the file contents."""
+    data = bytes.fromhex("deadbeef")
+    (filesystem.resolve(root) / "filename").write_bytes(data)
+    with (root / "filename").open() as io:
+        assert io.read() == data
+
+
 def test_is_symlink(root: Path, filesystem: DiskFilesystem) -> None:
     """It returns True if the path is a symlink."""
     (filesystem.resolve(root) / "filename").symlink_to("target")
@@ -83,3 +96,50 @@ def test_eq(root: Path) -> None:
 def test_lt(root: Path) -> None:
     """It returns False if the paths are the same."""
     assert root <= root
+
+
+def test_blobid(root: Path, filesystem: DiskFilesystem) -> None:
+    """It returns a different identifier when the file is modified."""
+    file = filesystem.resolve(root) / "filename"
+    file.write_bytes(b"Lorem")
+    blobid = (root / "filename").blobid()
+    file.write_bytes(b"Lorem ipsum")
+    assert blobid != (root / "filename").blobid()
+
+
+def test_stat_file(root: Path, filesystem: DiskFilesystem) -> None:
+    """It returns the type, mode and size of a regular file."""
+    path = filesystem.resolve(root) / "filename"
+    path.write_bytes(b"Lorem")
+    path.chmod(0o755)
+    status = (root / "filename").stat()
+    assert status.type is FileType.REGULAR
+    assert status.size == 5
+    assert status.mode & stat.S_IXUSR or platform.system() == "Windows"
+
+
+def test_stat_directory(root: Path) -> None:
+    """It returns the type of a directory."""
+    assert root.stat().type is FileType.DIRECTORY
+
+
+def test_stat_symlink(root: Path, filesystem: DiskFilesystem) -> None:
+    """It returns the type and target of a symbolic link."""
+    (filesystem.resolve(root) / "filename").symlink_to("target")
+    status = (root / "filename").stat(follow_symlinks=False)
+    assert status.type is FileType.SYMLINK
+    assert status.target == PurePath("target")
+
+
+def test_stat_nofollow_file(root: Path, filesystem: DiskFilesystem) -> None:
+    """It returns the type of a regular file."""
+    (filesystem.resolve(root) / "filename").touch()
+    status = (root / "filename").stat(follow_symlinks=False)
+    assert status.type is FileType.REGULAR
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="requires named pipes")
+def test_stat_special(root: Path, filesystem: DiskFilesystem) -> None:
+    """It returns the type of a special file."""
+    os.mkfifo(filesystem.resolve(root) / "fifo")
+    assert (root / "fifo").stat().type is FileType.OTHER
@@ -8,6 +8,8 @@ import pytest
 
 from cutty.filesystems.adapters.git import GitFilesystem
 from cutty.filesystems.domain.filesystem import Access
+from cutty.filesystems.domain.filesystem import FileStatus
+from cutty.filesystems.domain.filesystem import FileType
 from cutty.filesystems.domain.purepath import PurePath
 from cutty.util.git import Repository
 
@@ -160,6 +162,20 @@ def test_iterdir(filesystem: GitFilesystem) -> None:
     assert entry == ".keep"
 
 
+def test_open(filesystem: GitFilesystem) -> None:
+    """It returns a stream with the file contents."""
+    with filesystem.open(PurePath("file")) as io:
+        assert io.read(5) == b"lorem"
+        assert io.read() == b" ipsum dolor\n"
+
+
+def test_blobid(filesystem: GitFilesystem) -> None:
+    """It returns the object ID of the blob."""
+    assert filesystem.blobid(PurePath("file")) == str(
+        pygit2.hash(b"lorem ipsum dolor\n")
+    )
+
+
 def test_read_text_symlink(filesystem: GitFilesystem) -> None:
     """It returns the contents of the target."""
     assert filesystem.read_text(PurePath("dir", "link")) == "lorem ipsum dolor\n"
@@ -176,3 +192,25 @@ def test_read_text_symlink(filesystem: GitFilesystem) -> None:
 def test_access_executable(filesystem: GitFilesystem, path: PurePath) -> None:
     """It returns True."""
     assert filesystem.access(path, Access.EXECUTE)
+
+
+@pytest.mark.parametrize(
+    "path,expected",
+    [
+        (PurePath("file"), FileStatus(FileType.REGULAR, 0o644, 18)),
+        (PurePath("dir", "script.py"), FileStatus(FileType.REGULAR, 0o755, 22)),
+        (PurePath("dir"), FileStatus(FileType.DIRECTORY, 0o755, 0)),
+        (PurePath("dir", "link"), FileStatus(FileType.REGULAR, 0o644, 18)),
+    ],
+    ids=str,
+)
+def test_stat(filesystem: GitFilesystem, path: PurePath, expected: FileStatus) -> None:
+    """It returns the file status."""
+    assert filesystem.stat(path) == expected
+
+
+def test_stat_symlink(filesystem: GitFilesystem) -> None:
+    """It returns the type and target of a symbolic link."""
+    status = filesystem.stat(PurePath("dir", "link"), follow_symlinks=False)
+    assert status.type is FileType.SYMLINK
+    assert status.target == PurePath("..", "file")
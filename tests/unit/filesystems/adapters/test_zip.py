@@ -7,6 +7,8 @@ import pytest
 
 from cutty.filesystems.adapters.zip import ZipFilesystem
 from cutty.filesystems.domain.filesystem import Access
+from cutty.filesystems.domain.filesystem import FileStatus
+from cutty.filesystems.domain.filesystem import FileType
 from cutty.filesystems.domain.purepath import PurePath
 
 
@@ -113,6 +115,12 @@ def test_read_bytes(filesystem: ZipFilesystem) -> None:
     assert filesystem.read_bytes(PurePath("file")) == b"lorem ipsum dolor\n"
 
 
+def test_open(filesystem: ZipFilesystem) -> None:
+    """It returns a stream with the file contents."""
+    with filesystem.open(PurePath("file")) as io:
+        assert io.read() == b"lorem ipsum dolor\n"
+
+
 def test_read_text(filesystem: ZipFilesystem) -> None:
     """It returns the file contents."""
     assert filesystem.read_text(PurePath("file")) == "lorem ipsum dolor\n"
@@ -162,3 +170,16 @@ def test_access_exists(filesystem: ZipFilesystem) -> None:
 def test_access_not_exists(filesystem: ZipFilesystem) -> None:
     """It returns False if the file does not exist."""
     assert not filesystem.access(PurePath("bogus"), Access.DEFAULT)
+
+
+def test_stat_file(filesystem: ZipFilesystem) -> None:
+    """It returns the type and size of a regular file."""
+    status = filesystem.stat(PurePath("file"))
+    assert status.type is FileType.REGULAR
+    assert status.size == len(b"lorem ipsum dolor\n")
+
+
+def test_stat_directory(filesystem: ZipFilesystem) -> None:
+    """It returns the type of a directory."""
+    status = filesystem.stat(PurePath("dir"))
+    assert status == FileStatus(FileType.DIRECTORY, 0o755, 0)
@@ -4,6 +4,7 @@ from typing import Any
 import pytest
 
 from cutty.filesystems.adapters.dict import DictFilesystem
+from cutty.filesystems.domain.filesystem import FileType
 from cutty.filesystems.domain.path import Path
 from cutty.filesystems.domain.pathfs import PathFilesystem
 from cutty.filesystems.domain.purepath import PurePath
@@ -45,6 +46,12 @@ def test_read_bytes(path: Path) -> None:
     assert b"text" == (path / "file").read_bytes()
 
 
+def test_open(path: Path) -> None:
+    """It returns a stream with the file contents."""
+    with (path / "file").open() as io:
+        assert b"text" == io.read()
+
+
 def test_read_text(path: Path) -> None:
     """It returns the contents of the file located at the path."""
     assert "text" == (path / "file").read_text()
@@ -79,3 +86,14 @@ def test_constrain_symlinks_to_filesystem() -> None:
     # XXX Should we rewrite the error message to hide the 'dir/' prefix?
     with pytest.raises(FileNotFoundError, match="file not found: dir/file"):
         assert (path / "link").read_text()
+
+
+def test_stat(path: Path) -> None:
+    """It returns the status of the file located at the path."""
+    assert (path / "file").stat().type is FileType.REGULAR
+
+
+def test_stat_symlink(path: Path) -> None:
+    """It returns the status of the symbolic link located at the path."""
+    status = (path / "link").stat(follow_symlinks=False)
+    assert status.type is FileType.SYMLINK
@@ -1,6 +1,12 @@
 """Unit tests for cutty.filesystems.domain.purepath."""
+import copy
+import pickle  # noqa: S403
+from collections.abc import Callable
+
 import pytest
 
+from cutty.filesystems.adapters.dict import DictFilesystem
+from cutty.filesystems.domain.path import Path
 from cutty.filesystems.domain.purepath import PurePath
 
 
@@ -70,3 +76,67 @@ def test_parents_getitem_slice() -> None:
     assert path.parents[-2:] == (PurePath("usr"), PurePath())
     with pytest.raises(IndexError):
         path.parents[len(path.parts)]
+
+
+def test_parents_iter() -> None:
+    """It yields the parents from the nearest to the root."""
+    path = PurePath("usr", "share", "README.rst")
+    assert list(path.parents) == [
+        PurePath("usr", "share"),
+        PurePath("usr"),
+        PurePath(),
+    ]
+
+
+def test_hash() -> None:
+    """It hashes equal paths to the same value."""
+    path = PurePath("usr", "share")
+    assert hash(path) == hash(path) == hash(PurePath("usr") / "share")
+
+
+def test_str() -> None:
+    """It joins the parts using slashes."""
+    path = PurePath("usr", "share")
+    assert str(path) == str(path) == "usr/share"
+
+
+def test_immutable() -> None:
+    """It raises an exception when assigning to a path."""
+    path = PurePath("usr")
+    with pytest.raises(AttributeError):
+        path.parts = ("etc",)
+
+
+def test_interned() -> None:
+    """It interns the path components."""
+    name = "".join(["REA", "DME"])
+    assert PurePath(name).name is PurePath("README").name
+
+
+@pytest.mark.parametrize(
+    "function",
+    [
+        copy.copy,
+        copy.deepcopy,
+        lambda path: pickle.loads(pickle.dumps(path)),  # noqa: S301
+    ],
+)
+def test_copy(function: Callable[[PurePath], PurePath]) -> None:
+    """It can be copied and pickled."""
+    path = PurePath("usr", "share")
+    hash(path), str(path)
+
+    result = function(path)
+
+    assert result == path and hash(result) == hash(path)
+    assert str(result) == "usr/share"
+
+
+def test_copy_path() -> None:
+    """It copies paths along with their filesystem."""
+    filesystem = DictFilesystem({"README": "hello"})
+    path = Path("README", filesystem=filesystem)
+
+    result = copy.copy(path)
+
+    assert result == path and result.filesystem is filesystem
@@ -0,0 +1,130 @@
+"""Unit tests for cutty.projects.generate."""
+import json
+import os
+import pathlib
+
+import pytest
+
+from cutty.filestorage.domain.files import RegularFile
+from cutty.filesystems.adapters.disk import DiskFilesystem
+from cutty.filesystems.domain.path import Path
+from cutty.projects.generate import BaseProject
+from cutty.projects.generate import ProjectGenerator
+from cutty.projects.template import Template
+from cutty.variables.domain.bindings import Binding
+
+
+@pytest.fixture
+def template(tmp_path: pathlib.Path) -> Template:
+    """Fixture for a template on disk."""
+    directory = tmp_path / "template"
+    projectdir = directory / "{{ cookiecutter.project }}"
+    projectdir.mkdir(parents=True)
+
+    context = {"project": "example", "license": "MIT"}
+    (directory / "cookiecutter.json").write_text(json.dumps(context))
+    (projectdir / "README.md").write_text("# {{ cookiecutter.project }}\n")
+    (projectdir / "LICENSE").write_text("{{ cookiecutter.license }}\n")
+
+    metadata = Template.Metadata("template", None, "template")
+    return Template(metadata, Path(filesystem=DiskFilesystem(directory)))
+
+
+@pytest.fixture
+def base(tmp_path: pathlib.Path, template: Template) -> BaseProject:
+    """Fixture for a base project with placeholder files.
+
+    Its template shares the files of the template fixture via hard links.
+    """
+    templatedir = tmp_path / "base-template"
+    for source in (tmp_path / "template").rglob("*"):
+        if source.is_file():
+            target = templatedir / source.relative_to(tmp_path / "template")
+            target.parent.mkdir(parents=True, exist_ok=True)
+            os.link(source, target)
+
+    basetemplate = Template(
+        template.metadata, Path(filesystem=DiskFilesystem(templatedir))
+    )
+
+    directory = tmp_path / "base"
+    directory.mkdir()
+
+    for name in ["README.md", "LICENSE"]:
+        (directory / name).write_text("previous\n")
+
+    bindings = [Binding("project", "example"), Binding("license", "MIT")]
+    return BaseProject(
+        basetemplate, bindings, Path(filesystem=DiskFilesystem(directory))
+    )
+
+
+def generatefiles(template: Template, base: BaseProject) -> dict[str, bytes]:
+    """Generate the project, returning the file contents by name."""
+    generator = ProjectGenerator.create(template)
+    bindings = [Binding("project", "example"), Binding("license", "GPL-3.0")]
+    project = generator.generate(bindings, base=base)
+
+    return {
+        file.path.name: file.read_bytes()
+        for file in project.files
+        if isinstance(file, RegularFile)
+    }
+
+
+def test_generate_base_reuse(template: Template, base: BaseProject) -> None:
+    """It reuses files that do not depend on changed variables."""
+    files = generatefiles(template, base)
+
+    assert files == {"README.md": b"previous\n", "LICENSE": b"GPL-3.0\n"}
+
+
+def test_generate_base_changed(
+    tmp_path: pathlib.Path, template: Template, base: BaseProject
+) -> None:
+    """It renders files whose template changed."""
+    readme = tmp_path / "template" / "{{ cookiecutter.project }}" / "README.md"
+    readme.unlink()
+    readme.write_text("# {{ cookiecutter.project }}!\n")
+
+    files = generatefiles(template, base)
+
+    assert files["README.md"] == b"# example!\n"
+
+
+def test_generate_base_hooks(
+    tmp_path: pathlib.Path, template: Template, base: BaseProject
+) -> None:
+    """It does not reuse files if the template has hooks."""
+    hookdir = tmp_path / "template" / "hooks"
+    hookdir.mkdir()
+    (hookdir / "post_gen_project.py").touch()
+
+    files = generatefiles(template, base)
+
+    assert files["README.md"] == b"# example\n"
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "{% for key, value in cookiecutter.items() %}{{ value }}{% endfor %}\n",
+        "{{ cookiecutter.get('license') }}\n",
+    ],
+)
+def test_generate_base_context_methods(
+    tmp_path: pathlib.Path, template: Template, base: BaseProject, text: str
+) -> None:
+    """It renders files that call methods of the context."""
+    readme, basereadme = (
+        tmp_path / directory / "{{ cookiecutter.project }}" / "README.md"
+        for directory in ["template", "base-template"]
+    )
+    readme.unlink()
+    readme.write_text(text)
+    basereadme.unlink()
+    os.link(readme, basereadme)
+
+    files = generatefiles(template, base)
+
+    assert b"GPL-3.0" in files["README.md"]
@@ -73,7 +73,7 @@ def test_readprojectconfigfile_template_typeerror(
     file = createprojectconfigfile(PurePath(), projectconfig)
 
     # Replace the template location with `None` in the JSON record.
-    data = json.loads(file.blob.decode())
+    data = json.loads(file.read_bytes().decode())
     data["template"][field] = value
     file = dataclasses.replace(file, blob=json.dumps(data).encode())
 
@@ -1,8 +1,11 @@
 """Unit tests for cutty.projects.repository."""
 from pathlib import Path
 
+import pygit2
 import pytest
 
+from cutty.filestorage.domain.files import RegularFile
+from cutty.filesystems.domain.purepath import PurePath
 from cutty.projects.repository import ProjectRepository
 
 
@@ -17,3 +20,112 @@ def test_build_cleanup(tmp_path: Path) -> None:
             raise Exception("boom")
 
     assert branches == [*repository.project.heads]
+
+
+def test_buildtree(tmp_path: Path) -> None:
+    """It commits the stored files."""
+    repository = ProjectRepository.create(tmp_path / "project")
+
+    with repository.buildtree() as builder:
+        with builder.storage:
+            builder.storage.add(RegularFile(PurePath("dir", "file"), b"teapot"))
+        commit = builder.commit("Initial")
+
+    files = repository.files(commit)
+    assert (files / "dir" / "file").read_bytes() == b"teapot"
+
+
+def test_buildtree_ignored(tmp_path: Path) -> None:
+    """It omits files ignored by git."""
+    repository = ProjectRepository.create(tmp_path / "project")
+
+    with repository.buildtree() as builder:
+        with builder.storage:
+            builder.storage.add(RegularFile(PurePath(".gitignore"), b"build/\n"))
+            builder.storage.add(RegularFile(PurePath("build", "file"), b""))
+            builder.storage.add(RegularFile(PurePath("file"), b""))
+        commit = builder.commit("Initial")
+
+    files = repository.files(commit)
+    assert sorted(path.name for path in files.iterdir()) == [".gitignore", "file"]
+
+
+def test_buildtree_unchanged(tmp_path: Path) -> None:
+    """It returns the parent if the tree is unchanged."""
+    repository = ProjectRepository.create(tmp_path / "project")
+
+    with repository.buildtree() as builder:
+        with builder.storage:
+            builder.storage.add(RegularFile(PurePath("file"), b""))
+        parent = builder.commit("Initial")
+
+    with repository.buildtree(parent=parent) as builder:
+        with builder.storage:
+            builder.storage.add(RegularFile(PurePath("file"), b""))
+        commit = builder.commit("Again")
+
+    assert commit == parent
+
+
+def test_build_ignored(tmp_path: Path) -> None:
+    """It skips files ignored by git."""
+    repository = ProjectRepository.create(tmp_path / "project")
+
+    with repository.build() as builder:
+        (builder.path / ".gitignore").write_text("*.log\n")
+        (builder.path / "file").write_text("teapot")
+        (builder.path / "error.log").touch()
+        commit = builder.commit("Initial")
+
+    names = sorted(path.name for path in repository.files(commit).iterdir())
+    assert names == [".gitignore", "file"]
+
+
+def test_build_scan(tmp_path: Path) -> None:
+    """It commits the files in the project directory, without a worktree."""
+    repository = ProjectRepository.create(tmp_path / "project")
+
+    with repository.build() as builder:
+        (builder.path / "dir").mkdir()
+        (builder.path / "dir" / "script").touch(mode=0o755)
+        (builder.path / "link").symlink_to("dir")
+        (builder.path / ".git").mkdir()
+        (builder.path / ".git" / "HEAD").touch()
+        commit = builder.commit("Initial")
+
+    tree = repository.project._repository[commit].tree
+    assert sorted(entry.name for entry in tree) == ["dir", "link"]
+    assert (tree / "dir" / "script").filemode == pygit2.GIT_FILEMODE_BLOB_EXECUTABLE
+    assert (tree / "link").filemode == pygit2.GIT_FILEMODE_LINK
+    assert not repository.project._repository.list_worktrees()
+
+
+def test_build_unchanged(tmp_path: Path) -> None:
+    """It returns the parent if the tree is unchanged."""
+    repository = ProjectRepository.create(tmp_path / "project")
+
+    with repository.build() as builder:
+        (builder.path / "file").touch()
+        parent = builder.commit("Initial")
+
+    with repository.build(parent=parent) as builder:
+        (builder.path / "file").touch()
+        commit = builder.commit("Again")
+
+    assert commit == parent
+
+
+def test_buildtree_excludes(tmp_path: Path) -> None:
+    """It omits files excluded in the repository."""
+    repository = ProjectRepository.create(tmp_path / "project")
+    exclude = Path(repository.project._repository.path) / "info" / "exclude"
+    exclude.parent.mkdir(exist_ok=True)
+    exclude.write_text("*.log\n")
+
+    with repository.buildtree() as builder:
+        with builder.storage:
+            builder.storage.add(RegularFile(PurePath("error.log"), b""))
+            builder.storage.add(RegularFile(PurePath("file"), b""))
+        commit = builder.commit("Initial")
+
+    assert [path.name for path in repository.files(commit).iterdir()] == ["file"]
@@ -1,15 +1,25 @@
 """Unit tests for cutty.rendering.adapters.cookiecutter."""
+import fnmatch
+import pathlib
 from collections.abc import Callable
 from typing import Any
 
 import pytest
+from binaryornot.helpers import is_binary_string
 
 from cutty.filestorage.domain.files import RegularFile
+from cutty.filestorage.domain.files import Stream
 from cutty.filesystems.adapters.dict import DictFilesystem
+from cutty.filesystems.adapters.disk import DiskFilesystem
 from cutty.filesystems.domain.path import Path
 from cutty.filesystems.domain.purepath import PurePath
+from cutty.rendering.adapters import cookiecutter
+from cutty.rendering.adapters.cookiecutter import compilepatterns
 from cutty.rendering.adapters.cookiecutter import CookiecutterConfig
+from cutty.rendering.adapters.cookiecutter import createbinaryclassifier
 from cutty.rendering.adapters.cookiecutter import createcookiecutterrenderer
+from cutty.rendering.adapters.cookiecutter import createcookiecutterrenderplan
+from cutty.rendering.adapters.cookiecutter import is_binary
 from cutty.rendering.domain.render import Renderer
 from cutty.variables.domain.bindings import Binding
 
@@ -55,6 +65,44 @@ def test_copy_without_render(rendererfactory: Callable[..., Renderer]) -> None:
     assert render(file1, [Binding("project", "example")]) == file2
 
 
+def test_copy_without_render_directory(
+    rendererfactory: Callable[..., Renderer]
+) -> None:
+    """It does not read files in directories matching the patterns."""
+    render = rendererfactory(_copy_without_render=["{{ cookiecutter.project }}/vendor"])
+    filesystem = DictFilesystem({})
+    path = Path(
+        "{{ cookiecutter.project }}",
+        "vendor",
+        "lib",
+        "{{ cookiecutter.x }}.py",
+        filesystem=filesystem,
+    )
+    file = RegularFile(path, path)
+
+    rendered = render(file, [Binding("project", "example"), Binding("x", "module")])
+
+    assert rendered.path.parts == ("example", "vendor", "lib", "module.py")
+    assert rendered.blob == path
+
+
+@pytest.mark.parametrize(
+    "name",
+    ["README.md", "docs/index.rst", "vendor", "vendor/lib/module.py", "[x]"],
+)
+def test_compilepatterns(name: str) -> None:
+    """It matches names like fnmatch."""
+    patterns = ["*.md", "vendor", "docs/*", "[[]x]"]
+    match = compilepatterns(patterns)
+
+    assert match(name) == any(fnmatch.fnmatch(name, pattern) for pattern in patterns)
+
+
+def test_compilepatterns_empty() -> None:
+    """It matches nothing without patterns."""
+    assert not compilepatterns([])("README.md")
+
+
 def test_binary(render: Renderer) -> None:
     """It does not render binary files."""
     path1 = PurePath("{{ cookiecutter.project }}", "README")
@@ -64,3 +112,183 @@ def test_binary(render: Renderer) -> None:
     file2 = RegularFile(path2, file1.blob)
 
     assert render(file1, [Binding("project", "example")]) == file2
+
+
+@pytest.mark.parametrize(
+    "blob,expected",
+    [
+        (b"", False),
+        (b"# example\n", False),
+        ("# \u00e9xample\n".encode(), False),
+        ("# \u00e9xample\n".encode()[:-2], False),
+        (b"\0\x01\x02\x03", True),
+        (b"\x89PNG\r\n\x1a\n\0\0\0\rIHDR", True),
+    ],
+)
+def test_is_binary(blob: bytes, expected: bool) -> None:
+    """It detects binary data."""
+    assert is_binary(blob) is expected
+
+
+@pytest.mark.parametrize(
+    "blob",
+    [
+        "# example\n".encode("utf-16"),
+        "# \u00e9xample\n".encode("latin-1"),
+    ],
+)
+def test_is_binary_fallback(blob: bytes) -> None:
+    """It falls back to binaryornot."""
+    assert is_binary(blob) == is_binary_string(blob)
+
+
+def test_binaryclassifier_suffix() -> None:
+    """It classifies files by suffix without reading them."""
+    isbinaryfile = createbinaryclassifier()
+    path = Path("image.PNG", filesystem=DictFilesystem({}))
+
+    assert isbinaryfile(RegularFile(PurePath("image.PNG"), path))
+
+
+def test_binaryclassifier_store(tmp_path: pathlib.Path) -> None:
+    """It stores classifications by blob identifier."""
+    (tmp_path / "file").write_bytes(b"\0")
+    path = Path("file", filesystem=DiskFilesystem(tmp_path))
+    isbinaryfile = createbinaryclassifier(tmp_path / "cache")
+
+    assert isbinaryfile(RegularFile(PurePath("file"), path))
+    assert (tmp_path / "cache" / "binary").read_text() == f"{path.blobid()} 1\n"
+
+
+def test_binaryclassifier_load(tmp_path: pathlib.Path) -> None:
+    """It loads stored classifications."""
+    (tmp_path / "file").write_text("text")
+    path = Path("file", filesystem=DiskFilesystem(tmp_path))
+    (tmp_path / "cache").mkdir()
+    (tmp_path / "cache" / "binary").write_text(f"{path.blobid()} 1\n")
+    isbinaryfile = createbinaryclassifier(tmp_path / "cache")
+
+    assert isbinaryfile(RegularFile(PurePath("file"), path))
+
+
+def test_literal(render: Renderer) -> None:
+    """It copies files without template syntax verbatim."""
+    path = Path("README", filesystem=DictFilesystem({"README": "# example\n"}))
+    file = RegularFile(PurePath("README"), path)
+
+    rendered = render(file, [])
+
+    assert isinstance(rendered, RegularFile) and rendered.blob == path
+
+
+def test_stream(render: Renderer, monkeypatch: pytest.MonkeyPatch) -> None:
+    """It renders large files incrementally."""
+    monkeypatch.setattr(cookiecutter, "STREAM_THRESHOLD", 16)
+    file = RegularFile(PurePath("README"), b"{{ cookiecutter.x }}\n" * 4)
+
+    rendered = render(file, [Binding("x", "teapot")])
+
+    assert isinstance(rendered, RegularFile)
+    assert isinstance(rendered.blob, Stream)
+    assert rendered.read_bytes() == b"teapot\n" * 4
+
+
+def test_stream_literal(render: Renderer, monkeypatch: pytest.MonkeyPatch) -> None:
+    """It copies large files without template syntax verbatim."""
+    monkeypatch.setattr(cookiecutter, "STREAM_THRESHOLD", 16)
+    file = RegularFile(PurePath("README"), b"Lorem ipsum dolor\n" * 4)
+
+    assert render(file, []) == file
+
+
+def test_bytecode_cache(tmp_path: pathlib.Path) -> None:
+    """It stores compiled templates in the cache directory."""
+    searchpath = Path(filesystem=DictFilesystem({}))
+    config = CookiecutterConfig({}, ())
+    render = createcookiecutterrenderer(searchpath, config, cachedir=tmp_path)
+
+    assert render("{{ cookiecutter.x }}", [Binding("x", "teapot")]) == "teapot"
+    assert any(path.is_file() for path in (tmp_path / "jinja").rglob("*"))
+
+
+def test_shared_environment(tmp_path: pathlib.Path) -> None:
+    """It reuses compiled templates for the same template commit."""
+    config = CookiecutterConfig({}, ())
+    text = "{{ cookiecutter.x }}"
+
+    render = createcookiecutterrenderer(
+        Path(filesystem=DictFilesystem({})), config, cachedir=tmp_path
+    )
+    assert render(text, [Binding("x", "teapot")]) == "teapot"
+
+    for path in list((tmp_path / "jinja").rglob("*")):
+        if path.is_file():
+            path.unlink()
+
+    render = createcookiecutterrenderer(
+        Path(filesystem=DictFilesystem({})), config, cachedir=tmp_path
+    )
+    assert render(text, [Binding("x", "kettle")]) == "kettle"
+    assert not any(path.is_file() for path in (tmp_path / "jinja").rglob("*"))
+
+
+def test_renderplan(tmp_path: pathlib.Path) -> None:
+    """It classifies the template files, and stores the plan."""
+    root = Path(
+        filesystem=DictFilesystem(
+            {
+                "{{ cookiecutter.project }}": {
+                    "README": "# {{ cookiecutter.title }}",
+                    "LICENSE": "MIT",
+                    "logo.png": "{{ cookiecutter.title }}",
+                }
+            }
+        )
+    )
+    config = CookiecutterConfig({"_copy_without_render": ["*.png"]}, ())
+    plan = createcookiecutterrenderplan(
+        root, [root / "{{ cookiecutter.project }}"], config, cachedir=tmp_path
+    )
+    directory, license, readme, logo = sorted(plan, key=lambda file: file.parts)
+
+    assert directory.directory and directory.pathtemplate
+    assert readme.bodytemplate and readme.variables == frozenset(["project", "title"])
+    assert not license.bodytemplate and license.variables == frozenset(["project"])
+    assert logo.verbatim and not logo.bodytemplate
+
+    assert plan == createcookiecutterrenderplan(
+        root, [root / "{{ cookiecutter.project }}"], config, cachedir=tmp_path
+    )
+    assert any((tmp_path / "plans").iterdir())
+
+
+def test_renderplan_copied_files(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """It does not read verbatim and binary files to find their variables."""
+    root = Path(
+        filesystem=DictFilesystem(
+            {
+                "{{ cookiecutter.project }}": {
+                    "vendor.js": "{% if %}",
+                    "logo.png": "{{ cookiecutter.title }}",
+                }
+            }
+        )
+    )
+    config = CookiecutterConfig({"_copy_without_render": ["*.js"]}, ())
+    read_bytes = Path.read_bytes
+
+    def fake_read_bytes(path: Path) -> bytes:
+        assert path.name not in ("vendor.js", "logo.png")
+        return read_bytes(path)
+
+    monkeypatch.setattr(Path, "read_bytes", fake_read_bytes)
+
+    plan = createcookiecutterrenderplan(
+        root, [root / "{{ cookiecutter.project }}"], config, cachedir=tmp_path
+    )
+    _, logo, vendor = sorted(plan, key=lambda file: file.parts)
+
+    assert logo.binary and logo.variables == frozenset(["project"])
+    assert vendor.verbatim and vendor.variables == frozenset(["project"])
@@ -1,15 +1,24 @@
 """Unit tests for cutty.rendering.adapters.jinja."""
 import pathlib
+from typing import Optional
 
 import jinja2
+import jinja2.ext
 import pytest
 
 from cutty.filesystems.adapters.dict import DictFilesystem
 from cutty.filesystems.adapters.disk import DiskFilesystem
 from cutty.filesystems.domain.path import Path
+from cutty.rendering.adapters.jinja import createcontextbuilder
+from cutty.rendering.adapters.jinja import createjinjaenvironment
 from cutty.rendering.adapters.jinja import createjinjarenderer
+from cutty.rendering.adapters.jinja import createjinjarenderers
+from cutty.rendering.adapters.jinja import findvariables
 from cutty.rendering.adapters.jinja import import_object
 from cutty.rendering.adapters.jinja import load_extension
+from cutty.rendering.adapters.jinja import pooljinjaenvironment
+from cutty.rendering.adapters.jinja import TEMPLATE_CACHE_MAX_LENGTH
+from cutty.rendering.adapters.jinja import templatemarkers
 from cutty.rendering.domain.render import asrendercontinuation
 from cutty.rendering.domain.render import createrenderer
 from cutty.rendering.domain.render import defaultrenderregistry
@@ -130,3 +139,268 @@ def test_render_with_extra_context(tmp_path: pathlib.Path) -> None:
     )
     text = render("{{ value }}", [])
     assert text == "teapot"
+
+
+class MemoryBytecodeCache(jinja2.BytecodeCache):
+    """Bytecode cache storing compiled templates in a dictionary."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.buckets: dict[str, bytes] = {}
+        self.loads = 0
+
+    def load_bytecode(self, bucket: jinja2.bccache.Bucket) -> None:
+        """Load the bytecode for the bucket."""
+        self.loads += 1
+        if data := self.buckets.get(bucket.key):
+            bucket.bytecode_from_string(data)
+
+    def dump_bytecode(self, bucket: jinja2.bccache.Bucket) -> None:
+        """Store the bytecode for the bucket."""
+        self.buckets[bucket.key] = bucket.bytecode_to_string()
+
+
+def test_render_compiled_once() -> None:
+    """It compiles each template only once."""
+    cache = MemoryBytecodeCache()
+    root = Path(filesystem=DictFilesystem({}))
+    render = createjinjarenderer(searchpath=[root], bytecode_cache=cache)
+
+    for _ in range(2):
+        assert render("{{ value }}", [Binding("value", "teapot")]) == "teapot"
+
+    assert cache.loads == 1
+
+
+def test_render_long_text_uncached() -> None:
+    """It does not keep long templates in memory."""
+    cache = MemoryBytecodeCache()
+    root = Path(filesystem=DictFilesystem({}))
+    render = createjinjarenderer(searchpath=[root], bytecode_cache=cache)
+    text = "{{ value }}" + " " * TEMPLATE_CACHE_MAX_LENGTH
+
+    for _ in range(2):
+        assert render(text, [Binding("value", "teapot")]).strip() == "teapot"
+
+    assert cache.loads == 2
+
+
+def test_render_bytecode_cache() -> None:
+    """It uses templates compiled by another renderer."""
+    cache = MemoryBytecodeCache()
+    root = Path(filesystem=DictFilesystem({}))
+
+    for _ in range(2):
+        render = createjinjarenderer(searchpath=[root], bytecode_cache=cache)
+        assert render("{{ value }}", [Binding("value", "teapot")]) == "teapot"
+
+    assert cache.loads == 2
+    assert len(cache.buckets) == 1
+
+
+def test_render_pooled() -> None:
+    """It shares compiled templates between renderers with the same pool key."""
+    cache = MemoryBytecodeCache()
+    root = Path(filesystem=DictFilesystem({}))
+    key = object()
+
+    for _ in range(2):
+        render = createjinjarenderer(
+            searchpath=[root], bytecode_cache=cache, poolkey=key
+        )
+        assert render("{{ value }}", [Binding("value", "teapot")]) == "teapot"
+
+    assert cache.loads == 1
+
+
+def test_pooljinjaenvironment_reuse() -> None:
+    """It returns the same environment for the same key and extensions."""
+    root = Path(filesystem=DictFilesystem({}))
+    key = object()
+    environment, _ = pooljinjaenvironment(key, searchpath=[root])
+    environment2, _ = pooljinjaenvironment(key, searchpath=[root])
+    environment3, _ = pooljinjaenvironment(
+        key, searchpath=[root], extensions=["jinja2.ext.do"]
+    )
+
+    assert environment is environment2
+    assert environment is not environment3
+
+
+def test_pooljinjaenvironment_searchpath() -> None:
+    """It loads templates from the search path passed last."""
+    key = object()
+
+    for text in ["teapot", "kettle"]:
+        root = Path(filesystem=DictFilesystem({"template": text}))
+        environment, _ = pooljinjaenvironment(key, searchpath=[root])
+
+    assert environment.get_template("template").render() == "kettle"
+
+
+def test_render_literal() -> None:
+    """It returns text without template syntax unchanged."""
+    cache = MemoryBytecodeCache()
+    root = Path(filesystem=DictFilesystem({}))
+    render = createjinjarenderer(searchpath=[root], bytecode_cache=cache)
+    text = "{ value }}\n"
+
+    assert render(text, []) is text
+    assert cache.loads == 0
+
+
+def test_render_literal_newlines() -> None:
+    """It normalizes line endings as Jinja does."""
+    root = Path(filesystem=DictFilesystem({}))
+    render = createjinjarenderer(searchpath=[root])
+
+    assert render("a\r\nb", []) == "a\nb"
+
+
+class PreprocessExtension(jinja2.ext.Extension):
+    """Jinja extension turning `$name` into a variable reference."""
+
+    def preprocess(
+        self, source: str, name: Optional[str], filename: Optional[str] = None
+    ) -> str:
+        """Preprocess the template source."""
+        return source.replace("$", "{{ ").replace(";", " }}")
+
+
+def test_templatemarkers_preprocess() -> None:
+    """It returns None if extensions preprocess the template source."""
+    environment = jinja2.Environment(extensions=[PreprocessExtension])  # noqa: S701
+    assert templatemarkers(environment) is None
+
+
+def test_render_preprocess() -> None:
+    """It renders text without delimiters if extensions preprocess it."""
+    root = Path(filesystem=DictFilesystem({}))
+    render = createjinjarenderer(searchpath=[root], extensions=[PreprocessExtension])
+
+    assert render("$value;", [Binding("value", "teapot")]) == "teapot"
+
+
+def test_templatemarkers_line_statements() -> None:
+    """It includes line statement and comment prefixes."""
+    environment = jinja2.Environment(  # noqa: S701
+        line_statement_prefix="%", line_comment_prefix="##"
+    )
+    markers = templatemarkers(environment)
+
+    assert markers is not None and "%" in markers and "##" in markers
+
+
+def test_createcontextbuilder_reuse() -> None:
+    """It reuses the context for the same bindings."""
+    buildcontext = createcontextbuilder("cookiecutter", {"_extensions": []})
+    bindings = [Binding("x", "teapot")]
+
+    context = buildcontext(bindings)
+
+    assert context == {"cookiecutter": {"x": "teapot", "_extensions": []}}
+    assert buildcontext(bindings) is context
+
+
+def test_createcontextbuilder_extend() -> None:
+    """It extends the context when bindings are appended."""
+    buildcontext = createcontextbuilder(None, None)
+    bindings = [Binding("x", "teapot")]
+
+    first = buildcontext(bindings)
+    bindings.append(Binding("y", "kettle"))
+
+    assert buildcontext(bindings) == {"x": "teapot", "y": "kettle"}
+    assert first == {"x": "teapot"}
+
+
+def test_createcontextbuilder_extra_context() -> None:
+    """It gives precedence to the extra context."""
+    buildcontext = createcontextbuilder(None, {"x": "teapot"})
+    buildcontext([])
+
+    assert buildcontext([Binding("x", "kettle")]) == {"x": "teapot"}
+
+
+def test_createcontextbuilder_order() -> None:
+    """It places the bindings before the extra context."""
+    extra = {"_extensions": [], "_template": "template"}
+    buildcontext = createcontextbuilder("cookiecutter", extra)
+    bindings = [Binding("project", "example")]
+    buildcontext(bindings)
+    bindings.append(Binding("license", "MIT"))
+
+    context = buildcontext(bindings)
+
+    assert list(context["cookiecutter"]) == [
+        "project",
+        "license",
+        "_extensions",
+        "_template",
+    ]
+
+
+def test_createcontextbuilder_rebuild() -> None:
+    """It rebuilds the context when bindings are replaced."""
+    buildcontext = createcontextbuilder(None, None)
+    buildcontext([Binding("x", "teapot"), Binding("y", "kettle")])
+
+    assert buildcontext([Binding("x", "pot")]) == {"x": "pot"}
+
+
+def test_streamtext() -> None:
+    """It renders the text incrementally, each time the stream is called."""
+    root = Path(filesystem=DictFilesystem({}))
+    _, streamtext = createjinjarenderers(searchpath=[root])
+
+    stream = streamtext("{{ x }}\n" * 3, [Binding("x", "teapot")])
+
+    assert stream is not None
+    assert "".join(stream()) == "".join(stream()) == "teapot\n" * 3
+
+
+def test_streamtext_literal() -> None:
+    """It returns None for text without template syntax."""
+    root = Path(filesystem=DictFilesystem({}))
+    _, streamtext = createjinjarenderers(searchpath=[root])
+
+    assert streamtext("teapot\n", []) is None
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    [
+        ("README", frozenset()),
+        ("{{ x }}", frozenset()),
+        ("{{ c.x }}-{{ c['y'] }}", frozenset({"x", "y"})),
+        ("{% if c.x %}{{ c.y | upper }}{% endif %}", frozenset({"x", "y"})),
+        ("{{ c[name] }}", None),
+        ("{{ c | tojson }}", None),
+        ("{% for key in c %}{% endfor %}", None),
+        ("{% include 'other' %}", None),
+        ("{{ c.x", None),
+        ("{{ c.items() }}", None),
+        ("{% for k, v in c.items() %}{% endfor %}", None),
+        ("{{ c.keys() | list }}", None),
+        ("{{ c.get('license') }}", None),
+        ("{{ c.values }}", None),
+        ("{{ c.x() }}", None),
+        ("{{ c['items'] }}", frozenset({"items"})),
+    ],
+)
+def test_findvariables(text: str, expected: Optional[frozenset[str]]) -> None:
+    """It returns the variables referenced under the context prefix."""
+    root = Path(filesystem=DictFilesystem({}))
+    environment = createjinjaenvironment(searchpath=[root])
+
+    assert findvariables(environment, text, context_prefix="c") == expected
+
+
+def test_findvariables_without_prefix() -> None:
+    """It returns the undeclared variables."""
+    root = Path(filesystem=DictFilesystem({}))
+    environment = createjinjaenvironment(searchpath=[root])
+
+    names = findvariables(environment, "{{ x }}{% set y = 1 %}{{ y }}")
+
+    assert names == frozenset({"x"})
@@ -1,11 +1,19 @@
 """Unit tests for cutty.rendering.domain.render."""
+from collections.abc import Sequence
+
 import pytest
 
 from cutty.filestorage.domain.files import Executable
 from cutty.filestorage.domain.files import RegularFile
 from cutty.filestorage.domain.files import SymbolicLink
+from cutty.filesystems.adapters.dict import DictFilesystem
+from cutty.filesystems.domain.path import Path
 from cutty.filesystems.domain.purepath import PurePath
+from cutty.rendering.domain.render import createpathrenderers
+from cutty.rendering.domain.render import createrenderer
+from cutty.rendering.domain.render import defaultrenderregistry
 from cutty.rendering.domain.render import Renderer
+from cutty.rendering.domain.render import RenderRegistry
 from cutty.variables.domain.bindings import Binding
 from cutty.variables.domain.variables import GenericVariable
 
@@ -47,3 +55,50 @@ def test_render_invalid(render: Renderer, template: object) -> None:
 def test_render_variable(render: Renderer, variable: GenericVariable[str]) -> None:
     """It renders the variable."""
     assert variable == render(variable, [])
+
+
+@pytest.fixture
+def countingrenderer() -> tuple[Renderer, list[str]]:
+    """Fixture for a renderer with cached paths, recording rendered strings."""
+    rendered: list[str] = []
+
+    def rendertext(text: str, bindings: Sequence[Binding], _: Renderer) -> str:
+        rendered.append(text)
+        return text.format_map({binding.name: binding.value for binding in bindings})
+
+    registry: RenderRegistry = {
+        **defaultrenderregistry,
+        **createpathrenderers(),
+        str: rendertext,
+    }
+    return createrenderer(registry), rendered
+
+
+def test_createpathrenderers(countingrenderer: tuple[Renderer, list[str]]) -> None:
+    """It renders each path prefix only once."""
+    render, rendered = countingrenderer
+    bindings = [Binding("x", "teapot")]
+    filesystem = DictFilesystem({})
+    paths = [
+        PurePath("{x}", "a"),
+        PurePath("{x}", "b"),
+        Path("{x}", "a", filesystem=filesystem),
+    ]
+
+    assert [str(render(path, bindings)) for path in paths] == [
+        "teapot/a",
+        "teapot/b",
+        "teapot/a",
+    ]
+    assert rendered == ["{x}", "a", "b"]
+
+
+def test_createpathrenderers_bindings(
+    countingrenderer: tuple[Renderer, list[str]]
+) -> None:
+    """It does not reuse paths rendered with other bindings."""
+    render, _ = countingrenderer
+    path = PurePath("{x}")
+
+    assert render(path, [Binding("x", "teapot")]) == PurePath("teapot")
+    assert render(path, [Binding("x", "kettle")]) == PurePath("kettle")
@@ -24,7 +24,7 @@ def test_renderfiles_default(render: Renderer, path: Path) -> None:
 
     assert isinstance(file, RegularFile)
     assert file.path.parts == ("dir", "teapot")
-    assert file.blob == b"teapot-blob"
+    assert file.read_bytes() == b"teapot-blob"
 
 
 def test_renderfiles_empty_path(render: Renderer, path: Path) -> None:
@@ -40,3 +40,15 @@ def test_renderfiles_invalid_path(render: Renderer, path: Path) -> None:
 
     with pytest.raises(Exception):
         next(renderfiles([path], render, [binding]))
+
+
+def test_renderfiles_jobs(render: Renderer) -> None:
+    """It renders files in parallel, preserving their order."""
+    names = [f"{n:03}-{{x}}" for n in range(100)]
+    filesystem = DictFilesystem({"dir": {name: "{x}" for name in names}})
+    path = Path("dir", filesystem=filesystem)
+    binding = Binding("x", "teapot")
+
+    files = renderfiles([path], render, [binding], jobs=4)
+
+    assert [file.path.name for file in files] == [f"{n:03}-teapot" for n in range(100)]
@@ -0,0 +1,121 @@
+"""Unit tests for cutty.rendering.domain.renderplan."""
+import pytest
+
+from cutty.filestorage.domain.files import Executable
+from cutty.filestorage.domain.files import RegularFile
+from cutty.filesystems.adapters.dict import DictFilesystem
+from cutty.filesystems.domain.path import Path
+from cutty.rendering.domain.render import Renderer
+from cutty.rendering.domain.renderplan import createrenderplan
+from cutty.rendering.domain.renderplan import dumprenderplan
+from cutty.rendering.domain.renderplan import loadrenderplan
+from cutty.rendering.domain.renderplan import PlannedFile
+from cutty.rendering.domain.renderplan import renderplan
+from cutty.rendering.domain.renderplan import RenderPlan
+from cutty.variables.domain.bindings import Binding
+
+
+def classify(path: Path) -> PlannedFile:
+    """Classify files with braces in their path or body as templates."""
+    pathtemplate = any("{" in part for part in path.parts)
+
+    if path.is_dir():
+        return PlannedFile(
+            path.parts, True, None, False, False, pathtemplate, False, None
+        )
+
+    bodytemplate = b"{" in path.read_bytes()
+    return PlannedFile(
+        path.parts, False, 0o644, False, False, pathtemplate, bodytemplate, None
+    )
+
+
+@pytest.fixture
+def root() -> Path:
+    """Fixture for a template root."""
+    filesystem = DictFilesystem(
+        {"dir": {"{x}": "{x}-blob", "sub": {"file": "blob"}, "{x}-dir": {}}}
+    )
+    return Path(filesystem=filesystem)
+
+
+@pytest.fixture
+def plan(root: Path) -> RenderPlan:
+    """Fixture for a render plan."""
+    return createrenderplan([root / "dir"], classify)
+
+
+def test_createrenderplan(plan: RenderPlan) -> None:
+    """It lists directories before their contents."""
+    assert [planned.parts for planned in plan] == [
+        ("dir",),
+        ("dir", "{x}"),
+        ("dir", "sub"),
+        ("dir", "sub", "file"),
+        ("dir", "{x}-dir"),
+    ]
+
+
+def test_renderplan_default(render: Renderer, root: Path, plan: RenderPlan) -> None:
+    """It renders the files."""
+    binding = Binding("x", "teapot")
+
+    file, file2 = renderplan(plan, root, render, [binding])
+
+    assert isinstance(file, RegularFile)
+    assert file.path.parts == ("dir", "teapot")
+    assert file.read_bytes() == b"teapot-blob"
+    assert file2.path.parts == ("dir", "sub", "file")
+
+
+def test_renderplan_literal(render: Renderer, root: Path) -> None:
+    """It does not render file contents without template syntax."""
+    plan = (PlannedFile(("dir", "{x}"), False, 0o755, False, False, True, False, None),)
+
+    [file] = renderplan(plan, root, render, [Binding("x", "teapot")])
+
+    assert isinstance(file, Executable)
+    assert file.path.parts == ("dir", "teapot")
+    assert file.read_bytes() == b"{x}-blob"
+
+
+def test_renderplan_empty_path(render: Renderer, root: Path, plan: RenderPlan) -> None:
+    """It skips files and directories whose name renders empty."""
+    binding = Binding("x", "")
+
+    [file] = renderplan(plan, root, render, [binding])
+
+    assert file.path.parts == ("dir", "sub", "file")
+
+
+def test_renderplan_invalid_path(
+    render: Renderer, root: Path, plan: RenderPlan
+) -> None:
+    """It raises an exception."""
+    binding = Binding("x", "..")
+
+    with pytest.raises(Exception):
+        list(renderplan(plan, root, render, [binding]))
+
+
+def test_renderplan_jobs(render: Renderer) -> None:
+    """It renders files in parallel, preserving their order."""
+    names = [f"{n:03}-{{x}}" for n in range(100)]
+    root = Path(filesystem=DictFilesystem({"dir": {name: "{x}" for name in names}}))
+    plan = createrenderplan([root / "dir"], classify)
+    binding = Binding("x", "teapot")
+
+    files = renderplan(plan, root, render, [binding], jobs=4)
+
+    assert [file.path.name for file in files] == [f"{n:03}-teapot" for n in range(100)]
+
+
+def test_dumprenderplan(plan: RenderPlan) -> None:
+    """It serializes the plan."""
+    plan = (*plan, PlannedFile(("x",), False, 0o644, True, False, False, False, None))
+    plan = (
+        *plan,
+        PlannedFile(("y",), False, 0o644, False, True, False, False, frozenset("ab")),
+    )
+
+    assert loadrenderplan(dumprenderplan(plan)) == plan
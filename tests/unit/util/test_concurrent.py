@@ -0,0 +1,47 @@
+"""Unit tests for cutty.util.concurrent."""
+import threading
+from collections.abc import Iterator
+
+import pytest
+
+from cutty.util.concurrent import mapordered
+
+
+def test_mapordered_order() -> None:
+    """It yields the results in the order of the items."""
+    assert list(mapordered(str, range(100), jobs=4)) == [str(n) for n in range(100)]
+
+
+def test_mapordered_threads() -> None:
+    """It applies the function in worker threads."""
+    [thread] = mapordered(lambda _: threading.current_thread(), [None], jobs=1)
+    assert thread is not threading.current_thread()
+
+
+def test_mapordered_lazy() -> None:
+    """It consumes a bounded number of items ahead of the results."""
+    consumed: list[int] = []
+
+    def items() -> Iterator[int]:
+        for n in range(100):
+            consumed.append(n)
+            yield n
+
+    results = mapordered(str, items(), jobs=2)
+
+    assert next(results) == "0"
+    assert len(consumed) <= 5
+
+
+def test_mapordered_error() -> None:
+    """It raises exceptions from the function."""
+
+    def function(n: int) -> int:
+        if n == 3:
+            raise ValueError(n)
+        return n
+
+    results = mapordered(function, range(10), jobs=4)
+
+    with pytest.raises(ValueError):
+        list(results)
@@ -0,0 +1,21 @@
+"""Unit tests for cutty.util.diskcache."""
+import pathlib
+
+from cutty.util.diskcache import DiskCache
+
+
+def test_memory() -> None:
+    """It stores entries in memory."""
+    cache = DiskCache(None)
+    cache.set("key", "value")
+
+    assert cache.get("key") == "value"
+    assert cache.get("other") is None
+
+
+def test_persist(tmp_path: pathlib.Path) -> None:
+    """It loads entries stored by another instance."""
+    path = tmp_path / "cache" / "entries"
+    DiskCache(path).set("key", "value with spaces")
+
+    assert DiskCache(path).get("key") == "value with spaces"
@@ -487,6 +487,61 @@ def test_cherrypick_with_untracked_files(repository: Repository, path: Path) ->
     assert untracked.name not in repository.head.commit.tree
 
 
+def test_cherrypick_removes_file(repository: Repository, path: Path) -> None:
+    """It removes files deleted by the commit."""
+    updatefile(path)
+
+    main = repository.head
+    branch = repository.heads.create("branch")
+
+    repository.checkout(branch)
+    removefile(path)
+
+    repository.checkout(main)
+    repository.cherrypick(branch.commit)
+
+    assert not path.exists()
+    assert path.name not in repository.head.commit.tree
+
+
+def test_cherrypick_with_unrelated_changes(repository: Repository, path: Path) -> None:
+    """It leaves changes to other files alone."""
+    other = repository.path / "other"
+    updatefile(other, "a")
+
+    main = repository.head
+    branch = repository.heads.create("branch")
+
+    repository.checkout(branch)
+    updatefile(path)
+
+    repository.checkout(main)
+    other.write_text("b")
+    repository.cherrypick(branch.commit)
+
+    assert other.read_text() == "b"
+    assert repository.head.commit.tree[other.name].data == b"a"
+
+
+def test_cherrypick_with_uncommitted_changes(
+    repository: Repository, path: Path
+) -> None:
+    """It raises an exception if the commit would overwrite local changes."""
+    main = repository.head
+    branch = repository.heads.create("branch")
+
+    repository.checkout(branch)
+    updatefile(path, "a")
+
+    repository.checkout(main)
+    path.write_text("b")
+
+    with pytest.raises(pygit2.GitError, match="uncommitted change"):
+        repository.cherrypick(branch.commit)
+
+    assert path.read_text() == "b"
+
+
 def test_cherrypickhead_none(repository: Repository) -> None:
     """It returns None if no cherry pick is in progress."""
     assert repository.cherrypickhead is None